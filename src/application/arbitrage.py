@@ -27,6 +27,7 @@ from typing import List
 from pandas import DataFrame, concat
 from utils.technical import Constant, setup_logger
 from utils.events import MainEventsBoard, Event
+from utils.odds import OddsStore
 
 
 class Arbitrage:
@@ -37,11 +38,21 @@ class Arbitrage:
     -----------
     - data_object (MainEventsBoard): An object containing data related
         to sports betting events.
+    - odds_store (OddsStore, optional): Store with the odds of the
+        sport, used to skip events without a chance of arbitrage.
+    - sport (str, optional): The name of the sport in the odds store.
     - logger - logging func.
     """
 
-    def __init__(self, data_object: MainEventsBoard) -> None:
+    def __init__(
+        self,
+        data_object: MainEventsBoard,
+        odds_store: OddsStore = None,
+        sport: str = None,
+    ) -> None:
         self.data_object = data_object
+        self.odds_store = odds_store
+        self.sport = sport
         self.logger = setup_logger(name="ARBITRAGE", print_logs=True)
 
     def calculate_opportunity(self, row) -> dict:
@@ -57,7 +68,11 @@ class Arbitrage:
         dict or None: Calculated arbitrage opportunity for the event.
         """
         try:
-            event = Event.create(row, self.data_object.events_dict)
+            event = Event.create(
+                row,
+                self.data_object.events_dict,
+                self.data_object.swapped_events,
+            )
             arbitrage = EventArbitrage.create(event)
             return arbitrage.calculate()
         except Exception as e:
@@ -73,9 +88,15 @@ class Arbitrage:
         list: A list containing calculated arbitrage opportunities for each event.
         """
         try:
+            events_table = self.data_object.events_table
+            if self.odds_store is not None and self.sport is not None:
+                candidates = self.odds_store.find_arbitrage(self.sport)
+                events_table = events_table.iloc[
+                    candidates["event_id"].to_list()
+                ]
             arbitration_opportunities = [
                 self.calculate_opportunity(row)
-                for _, row in self.data_object.events_table.iterrows()
+                for _, row in events_table.iterrows()
             ]
         except Exception as e:
             self.logger.info(f"Error during arbitrage calculation: {e}")
@@ -137,7 +158,7 @@ class EventArbitrage:
         ]
         event_name = first_key["event_name"].iloc[0]
         event_date = first_key["event_date"].iloc[0]
-        if first_key.shape[1] == 7:
+        if "draw" in first_key.columns:
             return cls(
                 event_object,
                 event_name,
@@ -145,7 +166,7 @@ class EventArbitrage:
                 ThreeWayArbitrageCalculator(event_object),
                 event_names_list,
             )
-        if first_key.shape[1] == 6:
+        if "away_team_win" in first_key.columns:
             return cls(
                 event_object,
                 event_name,
@@ -189,6 +210,26 @@ class ArbitrageCalculator:
     def __init__(self, event_data) -> None:
         self.event_data = event_data
 
+    def get_odds(self, events_data: DataFrame, columns: List[str]):
+        """
+        Get the odds of the events as float64, rounding away the error of
+        the float32 odds stored in the events tables.
+
+        Parameters:
+        --------
+        - events_data (DataFrame): Events of a bookmaker.
+        - columns (List[str]): The columns of the odds.
+
+        Returns:
+        --------
+        pandas.DataFrame: The odds as float64.
+        """
+        return (
+            events_data[columns]
+            .astype("float64")
+            .round(Constant.ODDS_DECIMALS)
+        )
+
     def get_probability(self, odds: float) -> float:
         """
         Calculates the probability of an event based on the odds.
@@ -255,7 +296,7 @@ class TwoWayArbitrageCalculator(ArbitrageCalculator):
         dataframes_dict = {}
         for key, value in self.event_data.events_data.items():
             dataframes_dict[key] = (
-                value[["home_team_win", "away_team_win"]]
+                self.get_odds(value, ["home_team_win", "away_team_win"])
                 .reset_index()
                 .add_prefix(f"{key}_")
             )
@@ -446,7 +487,9 @@ class ThreeWayArbitrageCalculator(ArbitrageCalculator):
         dataframes_dict = {}
         for key, value in self.event_data.events_data.items():
             dataframes_dict[key] = (
-                value[["home_team_win", "draw", "away_team_win"]]
+                self.get_odds(
+                    value, ["home_team_win", "draw", "away_team_win"]
+                )
                 .reset_index()
                 .add_prefix(f"{key}_")
             )
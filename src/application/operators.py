@@ -21,10 +21,15 @@ initializing the necessary operators, scanning the market, and handling
 email notifications.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pandas import DataFrame
+from application.orchestrator import ScrapeOrchestrator
 from application.webscrper import ScrapersPool
 from application.arbitrage import Arbitrage
+from scrapers.base import DriverPool
 from utils.sports import EventsTypes
+from utils.matching import MatchingCache
+from utils.odds import OddsStore
 from utils.technical import setup_logger
 
 
@@ -68,27 +73,75 @@ class DataOperator:
         betting opportunities.
     - three_way_results (DataFrame): A DataFrame to store results for
         three-way betting opportunities.
+    - matching_caches (dict): A dictionary mapping sports to the events
+        matched in their previous cycle.
+    - odds_store (OddsStore): Long-format odds of all scanned sports,
+        pre-filtering events before the arbitrage calculation.
+    - driver_pool (DriverPool): Warm browsers shared by the scrapers of
+        all sports, closed after every scan of the market.
+    - orchestrated (bool): Scrape all sports at once with
+        the ScrapeOrchestrator before matching them, otherwise every
+        sport is scraped in turn.
+    - max_sports (int): The number of sports scanned at once, 1 scans
+        them serially.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        orchestrated: bool = True,
+        max_sports: int = 4,
+    ) -> None:
         self.results = []
         self.two_way_results = DataFrame()
         self.three_way_results = DataFrame()
+        self.matching_caches = {}
+        self.odds_store = OddsStore()
+        self.driver_pool = DriverPool()
+        self.orchestrated = orchestrated
+        self.max_sports = max_sports
         self.logging = setup_logger(name="DATA_OPERATOR", print_logs=True)
 
     def get_data(self):
         """
         Retrieves sports betting data for various sports and bet types.
+        Sports are scanned in parallel up to max_sports at once and their
+        results are collected as they finish.
         """
-        for sport, bet_type in EventsTypes().sports.items():
-            try:
-                self.results.append(
-                    DisciplineOperator(sport, bet_type).scan_market()
-                )
-                self.logging.info(f"{sport} data scraped")
-            except:
-                self.logging.warning(f"{sport} data not scraped")
-        self.logging.info("Data scraping is finished")
+        events_types = EventsTypes()
+        events_tables = {}
+        if self.orchestrated:
+            events_tables = ScrapeOrchestrator(
+                events_types.sports, self.driver_pool
+            ).run()
+        with ThreadPoolExecutor(max_workers=self.max_sports) as executor:
+            futures = {
+                executor.submit(
+                    DisciplineOperator(
+                        sport,
+                        bet_type,
+                        self.matching_caches.setdefault(
+                            sport, MatchingCache()
+                        ),
+                        events_types.matching.get(sport),
+                        self.odds_store,
+                        self.driver_pool,
+                    ).scan_market,
+                    events_tables.get(sport),
+                ): sport
+                for sport, bet_type in events_types.sports.items()
+            }
+            for future in as_completed(futures):
+                sport = futures[future]
+                try:
+                    self.results.append(future.result())
+                    self.logging.info(f"{sport} data scraped")
+                except Exception:
+                    self.logging.warning(f"{sport} data not scraped")
+        self.driver_pool.close()
+        self.logging.info(
+            f"Data scraping is finished, {len(self.odds_store.data)} odds "
+            f"stored in {self.odds_store.memory_usage()} bytes"
+        )
 
     def get_odds_value_with_bookmaker(self, opp: dict, ends_with: str):
         odds_key: str = [key for key in opp.keys() if key.endswith(ends_with)][
@@ -202,25 +255,66 @@ class DisciplineOperator:
     -----------
     sport (str): The specific sport to scan.
     bet_type (int): The type of sports bet to consider.
+    matching_cache (MatchingCache, optional): Events matched in the
+        previous cycle of the sport.
+    matching_options (dict, optional): Keyword arguments of
+        MainEventsBoard configuring the matching of the sport.
+    odds_store (OddsStore, optional): Store receiving the odds of the
+        matched events of the sport, used to skip events without
+        a chance of arbitrage.
+    driver_pool (DriverPool, optional): Warm browsers lent to the
+        scrapers of the sport.
     """
 
-    def __init__(self, sport: str, bet_type: int) -> None:
+    def __init__(
+        self,
+        sport: str,
+        bet_type: int,
+        matching_cache: MatchingCache = None,
+        matching_options: dict = None,
+        odds_store: OddsStore = None,
+        driver_pool: DriverPool = None,
+    ) -> None:
         self.sport = sport
         self.bet_type = bet_type
+        self.matching_cache = matching_cache
+        self.matching_options = matching_options
+        self.odds_store = odds_store
+        self.driver_pool = driver_pool
 
-    def scan_market(self) -> dict:
+    def scan_market(self, events_tables: list = None) -> dict:
         """
         Scans the sports betting market for arbitrage opportunities.
 
+        Parameters:
+        -----------
+        events_tables (list, optional): Events tables of the sport
+            already collected by the ScrapeOrchestrator, the scrapers
+            of the sport are run when not given.
+
         Return:
         -------
         A dictionary containing the sport and corresponding arbitrage
         opportunities.
         """
-        scrapers = ScrapersPool(self.sport, self.bet_type)
-        scrapers.get_data()
+        scrapers = ScrapersPool(
+            self.sport,
+            self.bet_type,
+            self.matching_cache,
+            self.matching_options,
+            self.driver_pool,
+        )
+        if events_tables is None:
+            scrapers.get_data()
+        else:
+            for events_table in events_tables:
+                scrapers.data.put_data(events_table)
         data = scrapers.data
         data.create_events_table()
-        arbitrage_obj = Arbitrage(data)
+        if self.odds_store is None:
+            arbitrage_obj = Arbitrage(data)
+        else:
+            self.odds_store.put_board(self.sport, data)
+            arbitrage_obj = Arbitrage(data, self.odds_store, self.sport)
         opportunities = arbitrage_obj.calculate_arbitage()
         return {self.sport: opportunities}
@@ -0,0 +1,213 @@
+"""
+Module containing the ScrapeOrchestrator class, scheduling the scrapers
+of all sports and bookmakers of a market cycle at once.
+
+Classes:
+---------
+ScrapeJob: A named tuple describing one scraper of a sport and
+    a bookmaker.
+ScrapeOrchestrator: A class running the scrape jobs of all sports on
+    an asyncio event loop with bounded concurrency.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Dict, List, NamedTuple, Optional
+from scrapers.base import DriverPool
+from utils.events import BetEventsTable
+from utils.sports import ScrapersDict
+from utils.technical import setup_logger
+
+
+class ScrapeJob(NamedTuple):
+    """
+    One scraper of a sport and a bookmaker.
+
+    Attributes:
+    -----------
+    - sport (str): The scraped sport.
+    - bookmaker (str): The name of the bookmaker class.
+    - scraper (type): The scraper class of the bet type of the sport.
+    - site_path (str): The URL of the sport at the bookmaker.
+    """
+
+    sport: str
+    bookmaker: str
+    scraper: type
+    site_path: str
+
+
+class ScrapeOrchestrator:
+    """
+    A class running the scrapers of all sports and bookmakers at once,
+    so a cycle of the market takes about as long as the slowest
+    bookmaker instead of the sum over sports.
+
+    The scrapers are blocking, so they run in a thread pool executor
+    driven by the event loop. Jobs of one bookmaker are bounded
+    separately, so its website and its drivers in the DriverPool are
+    not flooded.
+
+    Attributes:
+    -----------
+    - sports (dict): A dictionary mapping sports to their bet types.
+    - driver_pool (DriverPool): The pool lending warm browsers to
+        the scrapers.
+    - max_jobs (int): The number of jobs running at once.
+    - jobs_per_bookmaker (int): The number of jobs of one bookmaker
+        running at once.
+    - scrapers (dict): Bookmakers and their scraper classes.
+    - logging (Logger): The logger for handling log messages.
+
+    Parameters:
+    -----------
+    - sports (dict): A dictionary mapping sports to their bet types.
+    - driver_pool (DriverPool, optional): The pool lending warm browsers
+        to the scrapers.
+    - max_jobs (int, optional): The number of jobs running at once.
+    - jobs_per_bookmaker (int, optional): The number of jobs of one
+        bookmaker running at once, by default the number of drivers
+        the pool keeps per host.
+    - scrapers (ScrapersDict, optional): Bookmakers and their scrapers.
+    """
+
+    def __init__(
+        self,
+        sports: Dict[str, int],
+        driver_pool: DriverPool = None,
+        max_jobs: int = 5,
+        jobs_per_bookmaker: int = None,
+        scrapers: ScrapersDict = None,
+    ) -> None:
+        self.sports = sports
+        self.driver_pool = driver_pool
+        self.max_jobs = max_jobs
+        if jobs_per_bookmaker is None:
+            jobs_per_bookmaker = (
+                driver_pool.drivers_per_host if driver_pool else 1
+            )
+        self.jobs_per_bookmaker = jobs_per_bookmaker
+        self.scrapers = (scrapers or ScrapersDict()).scrapers
+        self.logging = setup_logger(name="ORCHESTRATOR", print_logs=True)
+
+    def get_jobs(self) -> List[ScrapeJob]:
+        """
+        Get the scrape jobs of all sports, skipping sports a bookmaker
+        does not offer.
+
+        Returns:
+        --------
+        List[ScrapeJob]: The jobs of the cycle.
+        """
+        jobs = []
+        for sport, bet_type in self.sports.items():
+            for site, scrapers in self.scrapers.items():
+                site_path = getattr(site, sport)
+                if site_path is None:
+                    continue
+                jobs.append(
+                    ScrapeJob(
+                        sport,
+                        type(site).__name__,
+                        scrapers[bet_type - 2],
+                        site_path,
+                    )
+                )
+        return jobs
+
+    def scrape(self, job: ScrapeJob) -> Optional[BetEventsTable]:
+        """
+        Run a blocking scraper of the job.
+
+        Parameters:
+        -----------
+        - job (ScrapeJob): The job to run.
+
+        Returns:
+        --------
+        BetEventsTable or None: The collected events, None if
+            the scraper gave nothing.
+        """
+        result_queue = Queue()
+        job.scraper.init_with(job.site_path, self.driver_pool).collect(
+            result_queue
+        )
+        return None if result_queue.empty() else result_queue.get()
+
+    async def run_job(
+        self,
+        job: ScrapeJob,
+        executor: ThreadPoolExecutor,
+        limit: asyncio.Semaphore,
+        bookmaker_limit: asyncio.Semaphore,
+    ) -> Optional[BetEventsTable]:
+        """
+        Run the job once the bookmaker and the global limits allow it.
+        The bookmaker limit is acquired first, so jobs waiting for a slow
+        bookmaker do not hold the global slots of other bookmakers.
+
+        Parameters:
+        -----------
+        - job (ScrapeJob): The job to run.
+        - executor (ThreadPoolExecutor): The executor of blocking
+            scrapers.
+        - limit (Semaphore): The limit of all jobs.
+        - bookmaker_limit (Semaphore): The limit of jobs of
+            the bookmaker.
+
+        Returns:
+        --------
+        BetEventsTable or None: The collected events, None if the job
+            failed.
+        """
+        async with bookmaker_limit, limit:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, self.scrape, job)
+            except Exception as e:
+                self.logging.warning(
+                    f"{job.sport} of {job.bookmaker} not scraped: {e}"
+                )
+                return None
+
+    async def gather(self) -> Dict[str, List[BetEventsTable]]:
+        """
+        Run all jobs of the cycle and group their tables by sports.
+
+        Returns:
+        --------
+        Dict[str, List[BetEventsTable]]: Events tables of every sport.
+        """
+        jobs = self.get_jobs()
+        limit = asyncio.Semaphore(self.max_jobs)
+        bookmaker_limits = {
+            job.bookmaker: asyncio.Semaphore(self.jobs_per_bookmaker)
+            for job in jobs
+        }
+        tables: Dict[str, List[BetEventsTable]] = {
+            sport: [] for sport in self.sports
+        }
+        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
+            results = await asyncio.gather(
+                *[
+                    self.run_job(
+                        job, executor, limit, bookmaker_limits[job.bookmaker]
+                    )
+                    for job in jobs
+                ]
+            )
+        for job, table in zip(jobs, results):
+            if table is not None:
+                tables[job.sport].append(table)
+        return tables
+
+    def run(self) -> Dict[str, List[BetEventsTable]]:
+        """
+        Run a cycle of the market on a new event loop.
+
+        Returns:
+        --------
+        Dict[str, List[BetEventsTable]]: Events tables of every sport.
+        """
+        return asyncio.run(self.gather())
@@ -10,6 +10,7 @@ ScrapersPool: A class representing a pool of scrapers for collecting sports
 
 from queue import Queue
 from threading import Thread
+from scrapers.base import DriverPool
 from utils.sports import ScrapersDict
 from utils.events import MainEventsBoard
 
@@ -24,17 +25,33 @@ class ScrapersPool:
     - bet_type (str): The type of bet for which the data is being collected.
     - data (MainEventsBoard): An instance of MainEventsBoard to store and
         manage the collected data.
+    - driver_pool (DriverPool): The pool lending warm browsers to
+        the scrapers, None to launch a new browser for every scraper.
 
     Parameters:
     -----------
     - sport (str): The sport for which the data is being collected.
     - bet_type (str): The type of bet for which the data is being collected.
+    - matching_cache (MatchingCache, optional): Events matched in
+        the previous cycle of the sport.
+    - matching_options (dict, optional): Keyword arguments of
+        MainEventsBoard configuring the matching of the sport.
+    - driver_pool (DriverPool, optional): The pool lending warm browsers
+        to the scrapers.
     """
 
-    def __init__(self, sport, bet_type) -> None:
+    def __init__(
+        self,
+        sport,
+        bet_type,
+        matching_cache=None,
+        matching_options=None,
+        driver_pool: DriverPool = None,
+    ) -> None:
         self.sport = sport
         self.bet_type = bet_type
-        self.data = MainEventsBoard()
+        self.data = MainEventsBoard(matching_cache, **(matching_options or {}))
+        self.driver_pool = driver_pool
 
     def get_scrapers(self) -> dict:
         """
@@ -65,7 +82,7 @@ class ScrapersPool:
 
         for site_path, scraper in scrapers.items():
             thread = Thread(
-                target=scraper.init_with(site_path).get_events_values,
+                target=scraper.init_with(site_path, self.driver_pool).collect,
                 args=(result_queue,),
             )
             thread.start()
@@ -4,14 +4,531 @@ Module for the Scraper class, a base class for web scraping using Selenium.
 Classes:
 ---------
 Scraper: A base class for web scraping using Selenium.
+BrowserProfile: Options of the launched browsers, by default a headless
+    browser which does not download images, media, fonts and trackers.
+DriverPool: A pool of warm WebDrivers shared by the scrapers of all
+    sports.
+
+Functions:
+----------
+create_driver: Launch a new Chrome WebDriver.
+class_xpath: Build a relative XPath selecting descendants by class.
 """
 
+import json
+import time
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Dict, Iterator, List, Tuple
+from urllib.parse import urlparse
 from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
+from selenium.common.exceptions import (
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import WebDriverWait
+from scrapers.feeds import ResponseAdapter
 from utils.technical import setup_logger
 
+# Functions collecting the values of the events of the page. The layout
+# gives the XPath of the groups of events (competitions or days), of
+# the events in a group and of the values of an event; events missing
+# any value are skipped, so are events rejected by isNew. Events for
+# which isSeen is true are skipped before their values are read. count
+# gives the number of event rows without reading their values.
+EVENTS_FUNCTIONS = """
+const nodes = (context, xpath) => {
+    const result = document.evaluate(
+        xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const found = [];
+    for (let idx = 0; idx < result.snapshotLength; idx++) {
+        found.push(result.snapshotItem(idx));
+    }
+    return found;
+};
+const text = (context, xpath) => {
+    const node = document.evaluate(
+        xpath, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return node === null ? null : node.innerText.trim();
+};
+const values = (context, fields, row) => {
+    for (const [field, xpath] of Object.entries(fields || {})) {
+        row[field] = text(context, xpath);
+        if (row[field] === null) {
+            return false;
+        }
+    }
+    return true;
+};
+const collect = (layout, isNew, isSeen = () => false) => {
+    const events = [];
+    const groups = layout.groups ? nodes(document, layout.groups) : [document];
+    for (const group of groups) {
+        const className = group.getAttribute ? group.getAttribute("class") : null;
+        if (layout.group_classes && !layout.group_classes.includes(className)) {
+            continue;
+        }
+        const groupRow = {};
+        for (const [field, xpath] of Object.entries(layout.group_fields || {})) {
+            groupRow[field] = text(group, xpath);
+        }
+        for (const event of nodes(group, layout.events)) {
+            if ((layout.skip_classes || []).includes(event.getAttribute("class"))) {
+                continue;
+            }
+            if (isSeen(event)) {
+                continue;
+            }
+            const row = Object.assign({}, groupRow);
+            if (values(event, layout.fields, row) && isNew(event, row)) {
+                events.push(row);
+            }
+        }
+    }
+    return events;
+};
+const count = (layout) => {
+    const groups = layout.groups ? nodes(document, layout.groups) : [document];
+    let rows = 0;
+    for (const group of groups) {
+        const className = group.getAttribute ? group.getAttribute("class") : null;
+        if (layout.group_classes && !layout.group_classes.includes(className)) {
+            continue;
+        }
+        rows += nodes(group, layout.events).length;
+    }
+    return rows;
+};
+"""
+
+# Collects the values of all events of the page in a single WebDriver
+# round trip.
+EVENTS_SCRIPT = EVENTS_FUNCTIONS + """
+return collect(arguments[0], () => true);
+"""
+
+# Counts the event rows of the page in a single WebDriver round trip.
+ROWS_SCRIPT = EVENTS_FUNCTIONS + """
+return count(arguments[0]);
+"""
+
+# Records the events of a virtualized list as they enter the DOM. Every
+# change of the page schedules a scan, events are buffered once and
+# the buffer is emptied by temidaStream.drain(), so Python reads every
+# event once in batches while the page scrolls. Events are keyed by
+# their normalized participants, and also by the id of their closest
+# element matching layout.key_closest, checked before reading any
+# value, so a fixture listed under several ids is recorded once.
+STREAM_SCRIPT = EVENTS_FUNCTIONS + """
+const layout = arguments[0];
+if (window.temidaStream) {
+    window.temidaStream.stop();
+}
+const keyFields = layout.key_fields || ["home_player", "away_player"];
+const seen = new Set();
+const buffer = [];
+let scheduled = null;
+const idOf = (event) => {
+    if (!layout.key_closest) {
+        return null;
+    }
+    const node = event.closest(layout.key_closest);
+    return node === null || !node.id ? null : node.id;
+};
+const keyOf = (row) => keyFields
+    .map((field) => String(row[field]).replace(/\\s+/g, " ").toLowerCase())
+    .join("|");
+const isSeen = (event) => {
+    const id = idOf(event);
+    return id !== null && seen.has("id:" + id);
+};
+const isNew = (event, row) => {
+    const id = idOf(event);
+    if (id !== null) {
+        seen.add("id:" + id);
+    }
+    const key = "row:" + keyOf(row);
+    if (seen.has(key)) {
+        return false;
+    }
+    seen.add(key);
+    return true;
+};
+const scan = () => {
+    clearTimeout(scheduled);
+    scheduled = null;
+    for (const row of collect(layout, isNew, isSeen)) {
+        buffer.push(row);
+    }
+};
+const observer = new MutationObserver(() => {
+    if (scheduled === null) {
+        scheduled = setTimeout(scan, 50);
+    }
+});
+observer.observe(document.body, {
+    childList: true, subtree: true, characterData: true
+});
+window.temidaStream = {
+    drain: () => {
+        if (scheduled !== null) {
+            scan();
+        }
+        return buffer.splice(0, buffer.length);
+    },
+    stop: () => {
+        observer.disconnect();
+        clearTimeout(scheduled);
+        delete window.temidaStream;
+    },
+};
+scan();
+"""
+
+
+# Resolves once the list of events settles: the rows of the layout
+# are counted every poll and the callback is called as soon as their
+# number did not change for quietMs, or after timeoutMs on pages which
+# never settle. Live odds changing the text of the rows do not restart
+# the quiet period.
+QUIET_SCRIPT = EVENTS_FUNCTIONS + """
+const [layout, quietMs, timeoutMs] = [arguments[0], arguments[1], arguments[2]];
+const callback = arguments[arguments.length - 1];
+const pollMs = Math.max(10, Math.min(100, quietMs));
+const started = Date.now();
+let rows = count(layout);
+let stableSince = started;
+const poll = () => {
+    const now = Date.now();
+    const current = count(layout);
+    if (current !== rows) {
+        rows = current;
+        stableSince = now;
+    }
+    if (now - stableSince >= quietMs) {
+        callback(true);
+    } else if (now - started >= timeoutMs) {
+        callback(false);
+    } else {
+        setTimeout(poll, pollMs);
+    }
+};
+setTimeout(poll, pollMs);
+"""
+
+
+class BrowserProfile:
+    """
+    Options of the browsers launched for the scrapers.
+
+    The default profile runs Chrome headless in a small window, without
+    extensions and background networking, and blocks images, media,
+    fonts and third-party trackers through the DevTools protocol.
+
+    Attributes:
+    -----------
+    - headless (bool): Run the browser without a window.
+    - block_resources (bool): Block the BLOCKED_URLS and blocked_urls
+        patterns.
+    - blocked_urls (list): Additional URL patterns to block.
+    - window_size (tuple): Width and height of the browser window.
+    - capture_network (bool): Keep the performance log of the browser,
+        so the scraper can read the JSON responses of the webpage.
+    """
+
+    BLOCKED_URLS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.svg",
+        "*.ico",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.otf",
+        "*.mp4",
+        "*.webm",
+        "*.mp3",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*facebook.net*",
+        "*hotjar.com*",
+        "*criteo.com*",
+    ]
+    ARGUMENTS = [
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-sync",
+        "--mute-audio",
+        "--no-first-run",
+    ]
+
+    def __init__(
+        self,
+        headless: bool = True,
+        block_resources: bool = True,
+        blocked_urls: List[str] = None,
+        window_size: Tuple[int, int] = (1280, 900),
+        capture_network: bool = False,
+    ) -> None:
+        self.headless = headless
+        self.block_resources = block_resources
+        self.blocked_urls = blocked_urls or []
+        self.window_size = window_size
+        self.capture_network = capture_network
+
+    def options(self) -> Options:
+        """
+        Create the Chrome options of the profile.
+
+        Returns:
+        --------
+        Options: Options of the launched browser.
+        """
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        else:
+            options.add_experimental_option("detach", True)
+        options.add_argument("--window-size={},{}".format(*self.window_size))
+        for argument in self.ARGUMENTS:
+            options.add_argument(argument)
+        if self.block_resources:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        if self.capture_network:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        return options
+
+    def apply(self, driver: webdriver.Chrome) -> None:
+        """
+        Block the resources of the profile in the launched browser.
+
+        Parameters:
+        -----------
+        - driver (webdriver.Chrome): The launched driver.
+        """
+        if not self.block_resources:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": self.BLOCKED_URLS + self.blocked_urls},
+        )
+
+
+def create_driver(profile: BrowserProfile = None) -> webdriver.Chrome:
+    """
+    Launch a new Chrome WebDriver.
+
+    Parameters:
+    -----------
+    - profile (BrowserProfile, optional): Options of the browser, the
+        default headless resource-blocking profile if not given.
+
+    Returns:
+    --------
+    webdriver.Chrome: The launched WebDriver.
+    """
+    profile = profile or BrowserProfile()
+    driver = webdriver.Chrome(options=profile.options())
+    profile.apply(driver)
+    return driver
+
+
+class DriverPool:
+    """
+    A pool of warm WebDrivers shared by the scrapers of all sports.
+
+    Every host gets up to `drivers_per_host` browsers which are handed
+    to the scrapers in turn, so the next sport navigates an already
+    running browser instead of launching a new one. Drivers failing
+    the health check are replaced and drivers which loaded `max_pages`
+    pages are recycled.
+
+    Attributes:
+    -----------
+    - drivers_per_host (int): The number of browsers per host.
+    - max_pages (int): The number of pages after which a browser is
+        recycled.
+    - driver_factory (Callable): Function launching a new WebDriver.
+    - idle (dict): A dictionary mapping hosts to the drivers waiting
+        for the next scraper.
+    - pages (dict): A dictionary mapping ids of drivers to the number
+        of pages loaded by them.
+    - slots (dict): A dictionary mapping hosts to the semaphores
+        limiting the number of their drivers.
+    - lock (Lock): A lock guarding the dictionaries of the pool.
+    - logging (Logger): The logger for handling log messages.
+    """
+
+    def __init__(
+        self,
+        drivers_per_host: int = 1,
+        max_pages: int = 50,
+        driver_factory: Callable = create_driver,
+    ) -> None:
+        self.drivers_per_host = drivers_per_host
+        self.max_pages = max_pages
+        self.driver_factory = driver_factory
+        self.idle: Dict[str, List[webdriver.Chrome]] = {}
+        self.pages: Dict[int, int] = {}
+        self.slots: Dict[str, BoundedSemaphore] = {}
+        self.lock = Lock()
+        self.logging = setup_logger(name="DRIVER_POOL", print_logs=True)
+
+    @staticmethod
+    def get_host(site_path: str) -> str:
+        """
+        Get the host of the website.
+
+        Parameters:
+        -----------
+        - site_path (str): The URL of the website.
+
+        Returns:
+        --------
+        str: The host part of the URL.
+        """
+        return urlparse(site_path).netloc
+
+    @staticmethod
+    def is_healthy(driver: webdriver.Chrome) -> bool:
+        """
+        Check if the session of the driver still responds.
+
+        Parameters:
+        -----------
+        - driver (webdriver.Chrome): The checked driver.
+
+        Returns:
+        --------
+        bool: True if the browser answers commands.
+        """
+        try:
+            return bool(driver.window_handles)
+        except WebDriverException:
+            return False
+
+    def quit_driver(self, driver: webdriver.Chrome) -> None:
+        """
+        Quit the driver and forget its page counter.
+
+        Parameters:
+        -----------
+        - driver (webdriver.Chrome): The driver to quit.
+        """
+        with self.lock:
+            self.pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logging.warning(f"Driver not closed: {e}")
+
+    def acquire(
+        self, site_path: str, profile: BrowserProfile = None
+    ) -> webdriver.Chrome:
+        """
+        Get a warm driver for the host of the website, a new one is
+        launched if the host has no healthy idle driver. Blocks while
+        all drivers of the host are used.
+
+        Parameters:
+        -----------
+        - site_path (str): The URL of the website.
+        - profile (BrowserProfile, optional): Options of the launched
+            browser.
+
+        Returns:
+        --------
+        webdriver.Chrome: The driver reserved for the caller.
+        """
+        host = self.get_host(site_path)
+        with self.lock:
+            slots = self.slots.setdefault(
+                host, BoundedSemaphore(self.drivers_per_host)
+            )
+        slots.acquire()
+        try:
+            while True:
+                with self.lock:
+                    idle = self.idle.get(host)
+                    driver = idle.pop() if idle else None
+                if driver is None:
+                    driver = self.driver_factory(profile)
+                    with self.lock:
+                        self.pages[id(driver)] = 0
+                    return driver
+                if self.is_healthy(driver):
+                    return driver
+                self.logging.warning(f"Replacing broken driver of {host}")
+                self.quit_driver(driver)
+        except Exception:
+            slots.release()
+            raise
+
+    def release(self, site_path: str, driver: webdriver.Chrome) -> None:
+        """
+        Give the driver back to the pool after loading a page.
+
+        Parameters:
+        -----------
+        - site_path (str): The URL of the website loaded by the driver.
+        - driver (webdriver.Chrome): The released driver.
+        """
+        host = self.get_host(site_path)
+        with self.lock:
+            pages = self.pages.get(id(driver), 0) + 1
+            recycle = pages >= self.max_pages
+            if not recycle:
+                self.pages[id(driver)] = pages
+                self.idle.setdefault(host, []).append(driver)
+        if recycle:
+            self.quit_driver(driver)
+        self.slots[host].release()
+
+    def close(self) -> None:
+        """
+        Quit all idle drivers of the pool.
+        """
+        with self.lock:
+            drivers = [
+                driver for idle in self.idle.values() for driver in idle
+            ]
+            self.idle = {}
+        for driver in drivers:
+            self.quit_driver(driver)
+
+
+def class_xpath(class_name: str) -> str:
+    """
+    Build a relative XPath selecting descendants by class, like
+    By.CLASS_NAME.
+
+    Parameters:
+    -----------
+    - class_name (str): The name of the class.
+
+    Returns:
+    --------
+    str: The XPath of the descendants with the class.
+    """
+    return (
+        './/*[contains(concat(" ", normalize-space(@class), " "), '
+        f'" {class_name} ")]'
+    )
+
 
 class Scraper:
     """
@@ -19,7 +536,15 @@ class Scraper:
 
     Attributes:
     -----------
+    - PROFILE (BrowserProfile): Options of the browser launched for
+        the scraper, bookmakers may override it.
+    - EVENTS_LAYOUT (dict): XPaths of the groups of events, the events
+        and their values read by extract_events.
+    - FEED_ADAPTER (ResponseAdapter): Adapter of the JSON responses of
+        the webpage, used when the PROFILE captures the network.
     - site_path (object): The path or URL of the website to scrape.
+    - driver_pool (DriverPool): The pool lending the driver, None if
+        the scraper launches its own browser.
     - driver (webdriver.Chrome): The Chrome WebDriver for interacting
         with the website.
     - logging (Logger): The logger for handling log messages.
@@ -27,15 +552,26 @@ class Scraper:
         elements to load.
     """
 
-    def __init__(self, site_path: object) -> None:
+    PROFILE = BrowserProfile()
+    EVENTS_LAYOUT: dict = {}
+    FEED_ADAPTER: ResponseAdapter = None
+
+    def __init__(
+        self, site_path: object, driver_pool: DriverPool = None
+    ) -> None:
         self.site_path = site_path
-        options = Options()
-        options.add_experimental_option("detach", True)
-        self.driver = webdriver.Chrome(options=options)
+        self.driver_pool = driver_pool
         self.logging = setup_logger(name="BASE", print_logs=True)
+        if driver_pool is not None and site_path is not None:
+            self.driver = driver_pool.acquire(site_path, self.PROFILE)
+        else:
+            self.driver = create_driver(self.PROFILE)
 
         try:
             if self.site_path is not None:
+                if self.PROFILE.capture_network:
+                    # drop the log of the page loaded by a pooled driver
+                    self.driver.get_log("performance")
                 self.driver.get(site_path)
                 self.wait = WebDriverWait(self.driver, 20)
             else:
@@ -43,10 +579,13 @@ class Scraper:
                 pass
         except SessionNotCreatedException as e:
             self.logging.info(f"URL error: {e}")
-            self.driver.quit()
+            self.close_driver()
+        except WebDriverException:
+            self.close_driver()
+            raise
 
     @classmethod
-    def init_with(cls, site_path):
+    def init_with(cls, site_path, driver_pool: DriverPool = None):
         """
         Class method to create an instance of the Scraper class.
 
@@ -54,9 +593,338 @@ class Scraper:
         -----------
         - cls (class): The class (Scraper) that this method belongs to.
             site_path: The path or URL of the website to scrape.
+        - driver_pool (DriverPool, optional): The pool lending warm
+            drivers, a new browser is launched without it.
 
         Returns:
         --------
         Scraper: An instance of the Scraper class.
         """
-        return cls(site_path)
+        return cls(site_path, driver_pool)
+
+    def extract_events(self, layout: dict = None) -> List[dict]:
+        """
+        Collect the values of all events of the current page with one
+        injected script instead of a WebDriver call per value.
+
+        Parameters:
+        -----------
+        - layout (dict, optional): XPaths of the page, EVENTS_LAYOUT of
+            the scraper by default.
+
+        Returns:
+        --------
+        List[dict]: Values of the events ready for the parsers.
+        """
+        return (
+            self.driver.execute_script(
+                EVENTS_SCRIPT, layout or self.EVENTS_LAYOUT
+            )
+            or []
+        )
+
+    def count_rows(self, layout: dict = None) -> int:
+        """
+        Count the event rows rendered on the current page.
+
+        Parameters:
+        -----------
+        - layout (dict, optional): XPaths of the page, EVENTS_LAYOUT of
+            the scraper by default.
+
+        Returns:
+        --------
+        int: The number of event rows in the DOM.
+        """
+        return self.driver.execute_script(
+            ROWS_SCRIPT, layout or self.EVENTS_LAYOUT
+        )
+
+    def start_stream(self, layout: dict = None) -> None:
+        """
+        Start recording the events entering the page into a page-side
+        buffer, replacing a previous recording.
+
+        Parameters:
+        -----------
+        - layout (dict, optional): XPaths of the page, EVENTS_LAYOUT of
+            the scraper by default.
+        """
+        self.driver.execute_script(STREAM_SCRIPT, layout or self.EVENTS_LAYOUT)
+
+    def drain_stream(self) -> List[dict]:
+        """
+        Take the events recorded since the previous call.
+
+        Returns:
+        --------
+        List[dict]: Values of the new events ready for the parsers.
+        """
+        return (
+            self.driver.execute_script(
+                "return window.temidaStream ? "
+                "window.temidaStream.drain() : [];"
+            )
+            or []
+        )
+
+    def stop_stream(self) -> None:
+        """
+        Stop recording the events of the page.
+        """
+        self.driver.execute_script(
+            "if (window.temidaStream) { window.temidaStream.stop(); }"
+        )
+
+    def stream_events(
+        self, layout: dict = None, step: int = 2000, max_steps: int = 500
+    ) -> Iterator[List[dict]]:
+        """
+        Scroll a virtualized list from the top and yield batches of
+        the events rendered on the way, every event once.
+
+        Parameters:
+        -----------
+        - layout (dict, optional): XPaths of the page, EVENTS_LAYOUT of
+            the scraper by default.
+        - step (int): Pixels scrolled between the batches.
+        - max_steps (int): The limit of scroll steps of endless pages.
+
+        Returns:
+        --------
+        Iterator[List[dict]]: Batches of values of the events.
+        """
+        position = self.driver.execute_script(
+            "window.scrollTo(0, 0); return window.scrollY;"
+        )
+        self.start_stream(layout)
+        try:
+            for _ in range(max_steps):
+                yield self.drain_stream()
+                new_position = self.driver.execute_script(
+                    "window.scrollBy(0, arguments[0]); return window.scrollY;",
+                    step,
+                )
+                if new_position == position:
+                    break
+                position = new_position
+                self.wait_until_quiet(quiet=0.1, timeout=2, layout=layout)
+            yield self.drain_stream()
+        finally:
+            self.stop_stream()
+
+    def wait_until_quiet(
+        self, quiet: float = 0.5, timeout: float = 10, layout: dict = None
+    ) -> bool:
+        """
+        Wait until the number of event rows of the webpage stops
+        changing. Changes of the odds of rendered rows are ignored.
+
+        Parameters:
+        -----------
+        - quiet (float): Seconds with the same number of rows treated as
+            loaded.
+        - timeout (float): Seconds to wait at most.
+        - layout (dict, optional): XPaths of the page, EVENTS_LAYOUT of
+            the scraper by default.
+
+        Returns:
+        --------
+        bool: True if the webpage settled, False after the timeout.
+        """
+        self.driver.set_script_timeout(timeout + 5)
+        return bool(
+            self.driver.execute_async_script(
+                QUIET_SCRIPT,
+                layout or self.EVENTS_LAYOUT,
+                int(quiet * 1000),
+                int(timeout * 1000),
+            )
+        )
+
+    def wait_for(self, xpath: str, timeout: float = 10) -> bool:
+        """
+        Wait until an element of the webpage is present.
+
+        Parameters:
+        -----------
+        - xpath (str): The XPath of the element.
+        - timeout (float): Seconds to wait at most.
+
+        Returns:
+        --------
+        bool: True if the element appeared, False after the timeout.
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                expected_conditions.presence_of_element_located(
+                    (By.XPATH, xpath)
+                )
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def get_whole_site(self, max_steps: int = 100) -> None:
+        """
+        Scroll to the end of the webpage until scrolling loads no more
+        events, waiting on every step only as long as new rows appear.
+        Scrolling stops when the rows do not settle before the timeout.
+
+        Parameters:
+        -----------
+        - max_steps (int): The limit of scroll steps of endless pages.
+        """
+        last_height = self.driver.execute_script(
+            "return document.body.scrollHeight"
+        )
+        for _ in range(max_steps):
+            self.driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight);"
+            )
+            if not self.wait_until_quiet():
+                self.logging.warning("Webpage not settled, scrolling stopped")
+                break
+            new_height = self.driver.execute_script(
+                "return document.body.scrollHeight"
+            )
+            if new_height == last_height:
+                break
+            last_height = new_height
+
+    def wait_for_feed(
+        self, quiet: float = 1, timeout: float = 10
+    ) -> List[str]:
+        """
+        Wait until the responses of the feed finished loading and no new
+        response of the feed arrived for the quiet period, reading their
+        requests from the performance log. Pages without a matching
+        response, e.g. served from the cache, are left after the quiet
+        period instead of the timeout.
+
+        Parameters:
+        -----------
+        - quiet (float): Seconds without new responses of the feed
+            treated as loaded, or without any response of the feed
+            treated as a page without the feed.
+        - timeout (float): Seconds to wait at most.
+
+        Returns:
+        --------
+        List[str]: Ids of the requests whose responses finished loading.
+        """
+        pending, loaded = set(), []
+        last_change = time.monotonic()
+
+        def settled(driver) -> bool:
+            nonlocal last_change
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                method = message.get("method")
+                params = message.get("params", {})
+                request_id = params.get("requestId")
+                if method == "Network.responseReceived":
+                    if (
+                        request_id in pending
+                        or request_id in loaded
+                        or not self.FEED_ADAPTER.matches(
+                            params["response"]["url"]
+                        )
+                    ):
+                        continue
+                    pending.add(request_id)
+                elif (
+                    method == "Network.loadingFinished"
+                    and request_id in pending
+                ):
+                    pending.remove(request_id)
+                    loaded.append(request_id)
+                else:
+                    continue
+                last_change = time.monotonic()
+            return not pending and time.monotonic() - last_change >= quiet
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                settled
+            )
+        except TimeoutException:
+            self.logging.warning(
+                f"Feed not settled: {len(loaded)} responses loaded, "
+                f"{len(pending)} pending"
+            )
+        return loaded
+
+    def get_feed_events(
+        self, quiet: float = 1, timeout: float = 10
+    ) -> List[dict]:
+        """
+        Collect the values of events from the JSON responses captured in
+        the performance log, without scrolling the webpage. The responses
+        are read once they finished loading and the feed went quiet.
+
+        Parameters:
+        -----------
+        - quiet (float): Seconds without new responses of the feed
+            treated as loaded.
+        - timeout (float): Seconds to wait for the feed at most.
+
+        Returns:
+        --------
+        List[dict]: Values of the events ready for the FeedParser, empty
+            if the network is not captured or no response matched.
+        """
+        if not self.PROFILE.capture_network or self.FEED_ADAPTER is None:
+            return []
+        layout = self.EVENTS_LAYOUT
+        required = set(layout.get("fields", {})) | set(
+            layout.get("group_fields", {})
+        )
+        events = []
+        for request_id in self.wait_for_feed(quiet, timeout):
+            try:
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": request_id}
+                )
+                payload = json.loads(body["body"])
+            except (WebDriverException, ValueError) as e:
+                self.logging.warning(f"Response not captured: {e}")
+                continue
+            events.extend(
+                event
+                for event in self.FEED_ADAPTER.events(payload)
+                if required <= event.keys()
+            )
+        self.logging.info(
+            f"Feed events: {len(events)}, "
+            f"rows on the webpage: {self.count_rows()}"
+        )
+        return events
+
+    def collect(self, result_queue) -> None:
+        """
+        Collect events of the website and give the driver back even if
+        the scraping fails.
+
+        Parameters:
+        -----------
+        - result_queue (Queue): A queue to store the collected events
+            table.
+        """
+        try:
+            self.get_events_values(result_queue)
+        finally:
+            self.close_driver()
+
+    def close_driver(self) -> None:
+        """
+        Give the driver back to the pool or quit it if the scraper
+        launched its own browser.
+        """
+        if self.driver is None:
+            return
+        if self.driver_pool is not None and self.site_path is not None:
+            self.driver_pool.release(self.site_path, self.driver)
+        else:
+            self.driver.quit()
+        self.driver = None
@@ -12,11 +12,11 @@ BetclicThreeWayBets(BetclicScraper): A class representing a scraper for
     collecting three-way sports betting data from Betclic.
 """
 
-import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-from scrapers.base import Scraper
-from utils.parsers import BetclicParser
+from scrapers.base import BrowserProfile, Scraper, class_xpath
+from scrapers.feeds import BetclicFeedAdapter
+from utils.parsers import BetclicParser, FeedParser
 from utils.events import (
     TwoWayBetEvent,
     ThreeWayBetEvent,
@@ -34,17 +34,30 @@ class BetclicScraper(Scraper):
     Attributes:
     -----------
     - site_path (str): The URL of the Betclic website.
-    - competition_boxes (list): A list to store competition boxes
-        on the Betclic webpage.
-    - events_objects (dict): A dictionary to store event objects
-        collected from Betclic.
+    - PROFILE (BrowserProfile): The browser profile capturing the
+        responses of the Betclic offer feed.
+    - FEED_ADAPTER (BetclicFeedAdapter): The adapter of the feed.
+    - EVENTS_LAYOUT (dict): XPaths of the groups of events of one day
+        and their events on the Betclic webpage, read when the feed
+        was not captured.
     - logging (Logger): The logger for handling log messages.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
-        self.competition_boxes: list = []
-        self.events_objects: dict = {}
+    PROFILE = BrowserProfile(capture_network=True)
+    FEED_ADAPTER = BetclicFeedAdapter()
+    EVENTS_LAYOUT = {
+        "groups": (
+            "/html/body/app-desktop/div[1]/div/bcdk-content-scroller/div"
+            "/sports-all-offer/sports-events-list/bcdk-vertical-scroller"
+            "/div/div[2]/div/div/div[*]"
+        ),
+        "group_classes": ["groupEvents ng-star-inserted", "groupEvents"],
+        "group_fields": {"event_date": class_xpath("groupEvents_headTitle")},
+        "events": "./div[2]/sports-events-event[*]",
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.logging = setup_logger(name="BETCLIC", print_logs=True)
         self.logging.info(f"Starting to collect data: {self.site_path}")
 
@@ -62,68 +75,25 @@ class BetclicScraper(Scraper):
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
-    def get_whole_site(self):
+    def stream_rows(self):
         """
-        Scroll through the entire webpage to ensure all content is loaded.
-        """
-        last_height = self.driver.execute_script(
-            "return document.body.scrollHeight"
-        )
-        while True:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            time.sleep(3)
-            new_height = self.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
-            if new_height == last_height:
-                break
-            last_height = new_height
-        time.sleep(1)
+        Stream the rows of the virtualized list of events while
+        scrolling through the site.
 
-    def get_segments(self):
-        """
-        Collect and store the segment elements from the current webpage.
-        """
-        try:
-            boxes = self.driver.find_elements(
-                By.XPATH,
-                "/html/body/app-desktop/div[1]/div/bcdk-content-scroller/div/sports-all-offer/sports-events-list/bcdk-vertical-scroller/div/div[2]/div/div/div[*]",
-            )
-            for box in boxes:
-                if (
-                    box.get_attribute("class")
-                    == "groupEvents ng-star-inserted"
-                ) or (box.get_attribute("class") == "groupEvents"):
-                    self.competition_boxes.append(box)
-        except NoSuchElementException as e:
-            self.logging.warning(f"No segment elements:{e}")
-
-    def get_all_events_objects(self):
-        """
-        Collect and store all event objects from the current webpage.
+        Returns:
+        --------
+        Iterator[dict]: Values of the events, every event once.
         """
-        for box in self.competition_boxes:
-            for event in box.find_elements(
-                By.XPATH, "./div[2]/sports-events-event[*]"
-            ):
-                self.events_objects[event] = box.find_element(
-                    By.CLASS_NAME, "groupEvents_headTitle"
-                ).text
+        for batch in self.stream_events():
+            yield from batch
 
     def get_events_from_site(self):
         """
-        Attempts to collect events by closing cookie messages, scrolling
-        through the entire site, extracting segments, and finally obtaining
-        all event objects from the segments.
+        Attempts to prepare the site by closing cookie messages, events
+        are streamed while scrolling through the site.
         """
         try:
             self.close_cookie_msg()
-            self.get_whole_site()
-            self.get_whole_site()
-            self.get_segments()
-            self.get_all_events_objects()
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Events collected: {self.site_path}")
@@ -149,8 +119,18 @@ class BetclicTwoWayBets(BetclicScraper):
     site_path (str): The URL of the Betclic webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **BetclicScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[1]/div",
+            "away_player": "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[3]/div",
+            "home_team_win": "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[1]/div[1]/span[2]",
+            "away_team_win": "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[2]/div[1]/span[2]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = TwoWayBetEventsTable("BETCLIC")
 
     def get_events_values(self, result_queue) -> None:
@@ -161,7 +141,8 @@ class BetclicTwoWayBets(BetclicScraper):
         This method scrapes and extracts relevant information
         from the Betclic webpage for two-way sports betting events.
         The collected data is then formatted and added to
-        the TwoWayBetEventsTable using the BetclicParser.
+        the TwoWayBetEventsTable using the BetclicParser, or the
+        FeedParser when the events were read from the captured feed.
 
         Parameters:
         -----------
@@ -172,39 +153,19 @@ class BetclicTwoWayBets(BetclicScraper):
         --------
         None
         """
-        self.get_events_from_site()
-        for event, date in self.events_objects.items():
+        events, parser = self.get_feed_events(), FeedParser()
+        if not events:
+            self.get_events_from_site()
+            events, parser = self.stream_rows(), BetclicParser()
+        for event_data in events:
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH,
-                        "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[1]/div",
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH,
-                        "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[3]/div",
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH,
-                        "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[1]/div[1]/span[2]",
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH,
-                        "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[2]/div[1]/span[2]",
-                    ).text,
-                    "event_date": date,
-                }
                 self.events_data.put(
-                    TwoWayBetEvent.create_from_data(
-                        event_data, BetclicParser()
-                    )
+                    TwoWayBetEvent.create_from_data(event_data, parser)
                 )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
 
 
@@ -228,8 +189,19 @@ class BetclicThreeWayBets(BetclicScraper):
     site_path (str): The URL of the Betclic webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **BetclicScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[1]/div",
+            "away_player": "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[3]/div",
+            "home_team_win": "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[1]/div/span[2]",
+            "draw": "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[2]/div/span[2]",
+            "away_team_win": "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[3]/div/span[2]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = ThreeWayBetEventsTable("BETCLIC")
 
     def get_events_values(self, result_queue) -> None:
@@ -240,7 +212,8 @@ class BetclicThreeWayBets(BetclicScraper):
         This method scrapes and extracts relevant information
         from the Betclic webpage for three-way sports betting events.
         The collected data is then formatted and added to
-        the ThreeWayBetEventsTable using the BetclicParser.
+        the ThreeWayBetEventsTable using the BetclicParser, or the
+        FeedParser when the events were read from the captured feed.
 
         Parameters:
         -----------
@@ -251,42 +224,17 @@ class BetclicThreeWayBets(BetclicScraper):
         --------
         None
         """
-        self.get_events_from_site()
-        for event, date in self.events_objects.items():
+        events, parser = self.get_feed_events(), FeedParser()
+        if not events:
+            self.get_events_from_site()
+            events, parser = self.stream_rows(), BetclicParser()
+        for event_data in events:
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH,
-                        "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[1]/div",
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH,
-                        "./a/div/scoreboards-scoreboard/scoreboards-scoreboard-global/div/div[3]/div",
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH,
-                        "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[1]/div/span[2]",
-                    ).text,
-                    "draw": event.find_element(
-                        By.XPATH,
-                        "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[2]/div/span[2]",
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH,
-                        "./a/sports-events-event-markets-v2/sports-markets-default-v2/div/sports-selections-selection[3]/div/span[2]",
-                    ).text,
-                    "event_date": date,
-                }
-
                 self.events_data.put(
-                    ThreeWayBetEvent.create_from_data(
-                        event_data, BetclicParser()
-                    )
+                    ThreeWayBetEvent.create_from_data(event_data, parser)
                 )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
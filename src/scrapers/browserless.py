@@ -0,0 +1,201 @@
+"""
+Module for the browserless scrapers, reading bookmakers whose webpages
+embed the offer server-side with an HTTP client instead of Chrome.
+
+Classes:
+---------
+HttpScraper: A base class for scraping the offer embedded in
+    the webpage, sharing one pooled HTTP session between scrapers.
+
+Functions:
+----------
+create_session: Create an HTTP session keeping alive a pool of
+    connections per host.
+"""
+
+import json
+import re
+from threading import Lock
+from typing import List
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from scrapers.feeds import ResponseAdapter
+from utils.parsers import FeedParser
+from utils.technical import setup_logger
+
+
+def create_session(pool_size: int = 10, retries: int = 2) -> requests.Session:
+    """
+    Create an HTTP session keeping alive a pool of connections per host
+    and retrying failed requests.
+
+    Parameters:
+    -----------
+    - pool_size (int): The number of connections kept per host.
+    - retries (int): The number of retries of a failed request.
+
+    Returns:
+    --------
+    requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HttpScraper.HEADERS)
+    return session
+
+
+class HttpScraper:
+    """
+    A base class for scraping the offer embedded in the webpage with
+    an HTTP client. It shares the interface of Scraper, so bookmakers can
+    switch between the backends in ScrapersDict.
+
+    Attributes:
+    -----------
+    - HEADERS (dict): Headers sent with every request.
+    - TIMEOUT (int): Seconds to wait for the webpage.
+    - NEXT_DATA (Pattern): The script of the Next.js data of the webpage.
+    - FEED_ADAPTER (ResponseAdapter): Adapter of the embedded offer.
+    - EVENT (type): The class of events put into the table.
+    - OUTCOMES (list): Names of the odds every event must have.
+    - session (requests.Session): The session shared by all scrapers.
+    - site_path (str): The URL of the webpage to scrape.
+    - logging (Logger): The logger for handling log messages.
+    """
+
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+        ),
+        "Accept-Language": "pl-PL,pl;q=0.9",
+    }
+    TIMEOUT = 20
+    NEXT_DATA = re.compile(
+        r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+    )
+    FEED_ADAPTER: ResponseAdapter = None
+    EVENT: type = None
+    OUTCOMES: List[str] = []
+    session: requests.Session = None
+    session_lock = Lock()
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        self.site_path = site_path
+        self.logging = setup_logger(name="HTTP", print_logs=True)
+
+    @classmethod
+    def init_with(cls, site_path, driver_pool=None):
+        """
+        Class method to create an instance of the scraper.
+
+        Parameters:
+        -----------
+        - site_path (str): The URL of the webpage to scrape.
+        - driver_pool (DriverPool, optional): Ignored, the scraper does
+            not need a browser.
+
+        Returns:
+        --------
+        HttpScraper: An instance of the scraper.
+        """
+        return cls(site_path, driver_pool)
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Get the session shared by all browserless scrapers, creating it
+        on the first call.
+
+        Returns:
+        --------
+        requests.Session: The shared session.
+        """
+        with HttpScraper.session_lock:
+            if HttpScraper.session is None:
+                HttpScraper.session = create_session()
+            return HttpScraper.session
+
+    def get_payload(self, html: str):
+        """
+        Get the offer embedded in the webpage as the Next.js data.
+
+        Parameters:
+        -----------
+        - html (str): The webpage.
+
+        Returns:
+        --------
+        dict or None: The decoded data, None if the webpage has none.
+        """
+        match = self.NEXT_DATA.search(html)
+        if match is None:
+            return None
+        return json.loads(match.group(1))
+
+    def get_events(self) -> List[dict]:
+        """
+        Download the webpage and adapt its embedded offer.
+
+        Returns:
+        --------
+        List[dict]: Values of the events having all odds of the table.
+        """
+        response = self.get_session().get(self.site_path, timeout=self.TIMEOUT)
+        response.raise_for_status()
+        payload = self.get_payload(response.text)
+        if payload is None:
+            self.logging.warning(f"No embedded offer: {self.site_path}")
+            return []
+        return [
+            event
+            for event in self.FEED_ADAPTER.events(payload)
+            if all(event.get(outcome) is not None for outcome in self.OUTCOMES)
+        ]
+
+    def get_events_values(self, result_queue) -> None:
+        """
+        Collect the events of the webpage into the events table.
+
+        Parameters:
+        -----------
+        - result_queue (Queue): A queue to store the collected events
+            table.
+        """
+        for event_data in self.get_events():
+            try:
+                self.events_data.put(
+                    self.EVENT.create_from_data(event_data, FeedParser())
+                )
+            except Exception as e:
+                self.logging.error(f"Unknown bug, more here: {e}")
+        self.logging.info(f"Data collected: {self.site_path}")
+        result_queue.put(self.events_data)
+
+    def collect(self, result_queue) -> None:
+        """
+        Collect events of the webpage, logging failed requests instead of
+        raising them in the thread of the scraper.
+
+        Parameters:
+        -----------
+        - result_queue (Queue): A queue to store the collected events
+            table.
+        """
+        if self.site_path is None:
+            return
+        try:
+            self.get_events_values(result_queue)
+        except requests.RequestException as e:
+            self.logging.error(f"Request failed: {self.site_path} {e}")
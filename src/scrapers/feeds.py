@@ -0,0 +1,328 @@
+"""
+Module for the adapters of the JSON feeds of bookmakers, used by the
+scrapers capturing the responses of the bookmakers' web applications
+instead of reading the rendered webpage.
+
+The adapters are experimental: their URL patterns and field names follow
+the web applications of the bookmakers but were not checked against
+recorded responses. Events missing any value are skipped, so
+the scrapers fall back to the rendered webpage when a feed changes.
+
+Classes:
+---------
+ResponseAdapter: A base class turning captured JSON responses into
+    values of events ready for the FeedParser.
+SuperbetFeedAdapter(ResponseAdapter): An adapter of the Superbet offer
+    feed.
+BetclicFeedAdapter(ResponseAdapter): An adapter of the Betclic offer
+    feed.
+ForbetFeedAdapter(ResponseAdapter): An adapter of the Forbet offer
+    embedded in the Next.js data of the webpage.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+class ResponseAdapter:
+    """
+    A base class turning captured JSON responses into values of events.
+
+    Attributes:
+    -----------
+    - URL_PATTERNS (list): Regular expressions of the URLs of responses
+        carrying the odds.
+    - OUTCOMES (list): Names of the values of odds in the order of
+        the selections of the main market.
+    - MAIN_MARKETS (set): Lowercase names of the match result markets
+        of the bookmakers, the only markets whose odds are read.
+    """
+
+    URL_PATTERNS: List[str] = []
+    OUTCOMES = {
+        2: ["home_team_win", "away_team_win"],
+        3: ["home_team_win", "draw", "away_team_win"],
+    }
+    MAIN_MARKETS = {
+        "1x2",
+        "wynik meczu",
+        "końcowy wynik",
+        "zwycięzca meczu",
+        "zwycięzca",
+    }
+
+    def is_main_market(self, name: Optional[str]) -> bool:
+        """
+        Check if the market is the match result market.
+
+        Parameters:
+        -----------
+        - name (str or None): The name of the market in the feed.
+
+        Returns:
+        --------
+        bool: True if the odds of the market should be read.
+        """
+        return (name or "").strip().lower() in self.MAIN_MARKETS
+
+    def matches(self, url: str) -> bool:
+        """
+        Check if the response of the URL carries the odds.
+
+        Parameters:
+        -----------
+        - url (str): The URL of the response.
+
+        Returns:
+        --------
+        bool: True if the response should be adapted.
+        """
+        return any(re.search(pattern, url) for pattern in self.URL_PATTERNS)
+
+    def get_odds(self, prices: List[float]) -> Dict[str, float]:
+        """
+        Name the odds of the main market by their order.
+
+        Parameters:
+        -----------
+        - prices (List[float]): Odds of the selections of the market.
+
+        Returns:
+        --------
+        Dict[str, float]: Odds by the names of the outcomes, empty for
+            markets with other number of selections.
+        """
+        return dict(zip(self.OUTCOMES.get(len(prices), []), prices))
+
+    def events(self, payload) -> List[dict]:
+        """
+        Turn the JSON response into values of events.
+
+        Parameters:
+        -----------
+        - payload (dict or list): The decoded JSON response.
+
+        Returns:
+        --------
+        List[dict]: Values of the events ready for the FeedParser.
+        """
+        raise NotImplementedError
+
+
+class SuperbetFeedAdapter(ResponseAdapter):
+    """
+    An adapter of the Superbet offer feed. Events keep the participants
+    in the matchName joined by a middle dot and the odds of all markets
+    in one list with the market id and name of every outcome.
+
+    Experimental, the layout of the feed is not verified.
+    """
+
+    URL_PATTERNS = [r"superbet.*offer.*/events"]
+    NAME_SEPARATOR = "·"
+
+    def get_main_market(self, odds: Iterable[dict]) -> List[float]:
+        """
+        Get the prices of the match result market of the event.
+
+        Parameters:
+        -----------
+        - odds (Iterable[dict]): Outcomes of all markets of the event.
+
+        Returns:
+        --------
+        List[float]: Prices of the outcomes of the match result market,
+            empty if the event does not offer it.
+        """
+        markets: Dict[object, List[float]] = {}
+        for outcome in odds:
+            if self.is_main_market(outcome.get("marketName")):
+                markets.setdefault(outcome.get("marketId"), []).append(
+                    outcome.get("price")
+                )
+        return next(iter(markets.values()), [])
+
+    def events(self, payload) -> List[dict]:
+        events = []
+        data = payload.get("data") if isinstance(payload, dict) else None
+        for event in data or []:
+            home, _, away = event.get("matchName", "").partition(
+                self.NAME_SEPARATOR
+            )
+            prices = self.get_main_market(event.get("odds") or [])
+            if not home or not away or not prices:
+                continue
+            events.append(
+                {
+                    "home_player": home,
+                    "away_player": away,
+                    "event_date": event.get("matchDate"),
+                    "competition": event.get("tournamentName"),
+                    **self.get_odds(prices),
+                }
+            )
+        return events
+
+
+class BetclicFeedAdapter(ResponseAdapter):
+    """
+    An adapter of the Betclic offer feed. Events keep the participants
+    as contestants and the selections of every market in the groups of
+    markets.
+
+    Experimental, the layout of the feed is not verified.
+    """
+
+    URL_PATTERNS = [r"begmedia.*/events"]
+
+    def get_main_market(self, event: dict) -> List[float]:
+        """
+        Get the odds of the selections of the match result market of
+        the event.
+
+        Parameters:
+        -----------
+        - event (dict): The event of the feed.
+
+        Returns:
+        --------
+        List[float]: Odds of the selections of the main market, empty if
+            the event does not offer it.
+        """
+        selections = next(
+            (
+                market.get("selections") or []
+                for group in event.get("grouped_markets") or []
+                for market in group.get("markets") or []
+                if self.is_main_market(market.get("name"))
+            ),
+            [],
+        )
+        flat = []
+        for selection in selections:
+            flat.extend(
+                selection if isinstance(selection, list) else [selection]
+            )
+        return [selection.get("odds") for selection in flat]
+
+    @staticmethod
+    def get_competition(event: dict) -> Optional[str]:
+        """
+        Get the name of the competition of the event.
+
+        Parameters:
+        -----------
+        - event (dict): The event of the feed.
+
+        Returns:
+        --------
+        str or None: The name of the competition.
+        """
+        competition = event.get("competition")
+        if isinstance(competition, dict):
+            return competition.get("name")
+        return competition
+
+    def events(self, payload) -> List[dict]:
+        events = []
+        for event in payload if isinstance(payload, list) else []:
+            contestants = event.get("contestants") or []
+            prices = self.get_main_market(event)
+            if len(contestants) != 2 or not prices:
+                continue
+            events.append(
+                {
+                    "home_player": contestants[0].get("name"),
+                    "away_player": contestants[1].get("name"),
+                    "event_date": event.get("date"),
+                    "competition": self.get_competition(event),
+                    **self.get_odds(prices),
+                }
+            )
+        return events
+
+
+class ForbetFeedAdapter(ResponseAdapter):
+    """
+    An adapter of the Forbet offer embedded in the __NEXT_DATA__ script
+    of the webpage. Events are nested in the page properties, so they are
+    found by their keys: the name joining the participants with a dash,
+    the start as a Unix timestamp in milliseconds and the games with
+    the outcomes of every market.
+
+    Experimental, the layout of the offer is not verified.
+    """
+
+    URL_PATTERNS = [r"iforbet\.pl"]
+    NAME_SEPARATOR = " - "
+
+    def find_events(self, node) -> Iterable[dict]:
+        """
+        Walk the JSON tree and yield the events of the offer.
+
+        Parameters:
+        -----------
+        - node (dict or list): The part of the JSON tree to search.
+
+        Returns:
+        --------
+        Iterable[dict]: Events of the offer.
+        """
+        if isinstance(node, dict):
+            if "eventName" in node and "eventGames" in node:
+                yield node
+                return
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            return
+        for child in children:
+            yield from self.find_events(child)
+
+    def get_main_market(self, event: dict) -> List[float]:
+        """
+        Get the odds of the outcomes of the match result game of
+        the event.
+
+        Parameters:
+        -----------
+        - event (dict): The event of the offer.
+
+        Returns:
+        --------
+        List[float]: Odds of the outcomes of the main market, empty if
+            the event does not offer it.
+        """
+        game = next(
+            (
+                game
+                for game in event.get("eventGames") or []
+                if self.is_main_market(game.get("gameName"))
+            ),
+            {},
+        )
+        return [
+            outcome.get("outcomeOdds")
+            for outcome in game.get("outcomes") or []
+        ]
+
+    def events(self, payload) -> List[dict]:
+        events = []
+        for event in self.find_events(payload):
+            home, _, away = (event.get("eventName") or "").partition(
+                self.NAME_SEPARATOR
+            )
+            prices = self.get_main_market(event)
+            if not home or not away or not prices:
+                continue
+            events.append(
+                {
+                    "home_player": home,
+                    "away_player": away,
+                    "event_date": event.get("eventStart"),
+                    "competition": event.get("category3Name"),
+                    **self.get_odds(prices),
+                }
+            )
+        return events
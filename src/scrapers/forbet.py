@@ -1,6 +1,7 @@
 import traceback
-import time
 from scrapers.base import Scraper
+from scrapers.browserless import HttpScraper
+from scrapers.feeds import ForbetFeedAdapter
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from utils.parsers import ForbetParser
@@ -10,6 +11,7 @@ from utils.events import (
     TwoWayBetEventsTable,
     ThreeWayBetEventsTable,
 )
+from utils.technical import setup_logger
 
 
 class ForbetScraper(Scraper):
@@ -20,17 +22,21 @@ class ForbetScraper(Scraper):
     Attributes:
     -----------
     - site_path (str): The URL of the Forbet website.
-    - competition_boxes (list): A list to store competition boxes
+    - EVENTS_LAYOUT (dict): XPaths of the competitions and their events
         on the Forbet webpage.
-    - events_objects (list): A dictionary to store event objects
-        collected from Forbet.
+    - COOKIES_BUTTON (str): XPath of the button accepting cookies.
     - logging (Logger): The logger for handling log messages.
     """
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
-        self.main_boxes: list = []
-        self.competition_boxes: list = []
-        self.events_objects: dict = {}
+
+    EVENTS_LAYOUT = {
+        "groups": '//*[@id="__next"]/div/div/main/div/div/div/div/div[1]/section/div/section[*]//div/section[*]',
+        "group_fields": {"event_date": ".//header/h3"},
+        "events": ".//div[*]",
+    }
+    COOKIES_BUTTON = "/html/body/div[1]/div[1]/div/div/div[2]/button[3]"
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
 
     def close_adult_msg(self):
         try:
@@ -45,9 +51,9 @@ class ForbetScraper(Scraper):
 
     def close_cookies_msg(self):
         try:
-            time.sleep(5)
+            self.wait_for(self.COOKIES_BUTTON)
             confirm_button = self.driver.find_element(
-                By.XPATH, "/html/body/div[1]/div[1]/div/div/div[2]/button[3]"
+                By.XPATH, self.COOKIES_BUTTON
             )
             confirm_button.click()
         except NoSuchElementException:
@@ -55,34 +61,12 @@ class ForbetScraper(Scraper):
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
-    def get_main_sections(self):
-        """
-        Collect and store the main events segment elements from the
-        current webpage.
-        """
-        time.sleep(5)
-        try:
-            _main_boxes = self.driver.find_elements(
-                By.XPATH,
-                '//*[@id="__next"]/div/div/main/div/div/div/div/div[1]/section/div/section[*]',
-            )
-            for box in _main_boxes:
-                self.main_boxes.append(box)
-        except NoSuchElementException:
-            self.logging.warning("No segment elements")
-
-    def get_competition_boxes(self):
-        for box in self.main_boxes:
-            competition_box = box.find_elements(By.XPATH, ".//div/section[*]")
-            for comp_box in competition_box:
-                self.competition_boxes.append(comp_box)
-
     def get_events_from_site(self):
         try:
             self.close_adult_msg()
             self.close_cookies_msg()
-            self.get_main_sections()
-            self.get_competition_boxes()
+            self.wait_for(self.EVENTS_LAYOUT["groups"])
+            self.wait_until_quiet()
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
@@ -109,8 +93,18 @@ class ForbetTwoWayBets(ForbetScraper):
     site_path (str): The URL of the Forbet webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **ForbetScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": ".//a[1]/header",
+            "away_player": ".//a[1]/header",
+            "home_team_win": ".//div[3]/div[1]/button[1]",
+            "away_team_win": ".//div[3]/div[1]/button[2]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = TwoWayBetEventsTable("FORBET")
 
     def get_events_values(self, result_queue):
@@ -133,43 +127,20 @@ class ForbetTwoWayBets(ForbetScraper):
         None
         """
         self.get_events_from_site()
-        for element in self.competition_boxes:
-            raw_date = element.find_element(By.XPATH, ".//header/h3").text
-            for event in element.find_elements(By.XPATH, ".//div[*]"):
-                try:
-                    event_data = {
-                        "home_player": event.find_element(
-                            By.XPATH, ".//a[1]/header"
-                        ).text,
-                        "away_player": event.find_element(
-                            By.XPATH, ".//a[1]/header"
-                        ).text,
-                        "home_team_win": event.find_element(
-                            By.XPATH,
-                            ".//div[3]/div[1]/button[1]",
-                        ).text,
-                        "away_team_win": event.find_element(
-                            By.XPATH,
-                            ".//div[3]/div[1]/button[2]",
-                        ).text,
-                        "event_date": raw_date,
-                    }
-                    self.events_data.put(
-                        TwoWayBetEvent.create_from_data(
-                            event_data, ForbetParser()
-                        )
-                    )
-                except NoSuchElementException as e:
-                    pass
-                except Exception as e:
-                    exception_message = str(e)
-                    traceback_str = traceback.format_exc()
-                    self.logging.error(
-                        f"Unknown bug, more here:
-                        {traceback_str} {exception_message}"
-                    )
+        for event_data in self.extract_events():
+            try:
+                self.events_data.put(
+                    TwoWayBetEvent.create_from_data(event_data, ForbetParser())
+                )
+            except Exception as e:
+                exception_message = str(e)
+                traceback_str = traceback.format_exc()
+                self.logging.error(
+                    f"Unknown bug, more here: "
+                    f"{traceback_str} {exception_message}"
+                )
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
 
 
@@ -193,8 +164,19 @@ class ForbetThreeWayBets(ForbetScraper):
     site_path (str): The URL of the Forbet webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **ForbetScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": ".//a[1]/header",
+            "away_player": ".//a[1]/header",
+            "home_team_win": ".//div[3]/div[1]/button[1]",
+            "draw": ".//div[3]/div[1]/button[2]",
+            "away_team_win": ".//div[3]/div[1]/button[3]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = ThreeWayBetEventsTable("FORBET")
 
     def get_events_values(self, result_queue):
@@ -217,44 +199,79 @@ class ForbetThreeWayBets(ForbetScraper):
         None
         """
         self.get_events_from_site()
-        for element in self.competition_boxes:
-            raw_date = element.find_element(By.XPATH, ".//header/h3").text
-            for event in element.find_elements(By.XPATH, ".//div[*]"):
-                try:
-                    event_data = {
-                        "home_player": event.find_element(
-                            By.XPATH, ".//a[1]/header"
-                        ).text,
-                        "away_player": event.find_element(
-                            By.XPATH, ".//a[1]/header"
-                        ).text,
-                        "home_team_win": event.find_element(
-                            By.XPATH,
-                            ".//div[3]/div[1]/button[1]",
-                        ).text,
-                        "draw": event.find_element(
-                            By.XPATH, ".//div[3]/div[1]/button[2]"
-                        ).text,
-                        "away_team_win": event.find_element(
-                            By.XPATH,
-                            ".//div[3]/div[1]/button[3]",
-                        ).text,
-                        "event_date": raw_date,
-                    }
-                    self.events_data.put(
-                        ThreeWayBetEvent.create_from_data(
-                            event_data, ForbetParser()
-                        )
-                    )
-                except NoSuchElementException as e:
-                    pass
-                except Exception as e:
-                    exception_message = str(e)
-                    traceback_str = traceback.format_exc()
-                    self.logging.error(
-                        f"Unknown bug, more here:
-                        {traceback_str} {exception_message}"
+        for event_data in self.extract_events():
+            try:
+                self.events_data.put(
+                    ThreeWayBetEvent.create_from_data(
+                        event_data, ForbetParser()
                     )
+                )
+            except Exception as e:
+                exception_message = str(e)
+                traceback_str = traceback.format_exc()
+                self.logging.error(
+                    f"Unknown bug, more here: "
+                    f"{traceback_str} {exception_message}"
+                )
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
+
+
+class ForbetHttpScraper(HttpScraper):
+    """
+    A browserless scraper reading the Forbet offer from the Next.js data
+    embedded in the webpage, inherits from HttpScraper.
+
+    Attributes:
+    -----------
+    - site_path (str): The URL of the Forbet website.
+    - FEED_ADAPTER (ForbetFeedAdapter): The adapter of the embedded offer.
+    - logging (Logger): The logger for handling log messages.
+    """
+
+    FEED_ADAPTER = ForbetFeedAdapter()
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
+        self.logging = setup_logger(name="FORBET", print_logs=True)
+
+
+class ForbetHttpTwoWayBets(ForbetHttpScraper):
+    """
+    A class representing a browserless scraper for collecting two-way
+    sports betting data from Forbet.
+
+    Attributes:
+    ------------
+    events_data (TwoWayBetEventsTable): An instance of the
+    TwoWayBetEventsTable class for storing and managing two-way
+    sports betting event data.
+    """
+
+    EVENT = TwoWayBetEvent
+    OUTCOMES = ["home_team_win", "away_team_win"]
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
+        self.events_data = TwoWayBetEventsTable("FORBET")
+
+
+class ForbetHttpThreeWayBets(ForbetHttpScraper):
+    """
+    A class representing a browserless scraper for collecting three-way
+    sports betting data from Forbet.
+
+    Attributes:
+    ------------
+    events_data (ThreeWayBetEventsTable): An instance of the
+    ThreeWayBetEventsTable class for storing and managing three-way
+    sports betting event data.
+    """
+
+    EVENT = ThreeWayBetEvent
+    OUTCOMES = ["home_team_win", "draw", "away_team_win"]
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
+        self.events_data = ThreeWayBetEventsTable("FORBET")
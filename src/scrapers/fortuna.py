@@ -12,10 +12,9 @@ FortunaThreeWayBets(FortunaScraper): A class representing a scraper for
     collecting three-way sports betting data from Fortuna.
 """
 
-import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-from scrapers.base import Scraper
+from scrapers.base import Scraper, class_xpath
 from utils.parsers import FortunaParser
 from utils.events import (
     TwoWayBetEvent,
@@ -34,17 +33,20 @@ class FortunaScraper(Scraper):
     Attributes:
     -----------
     - site_path (str): The URL of the Fortuna website.
-    - competition_boxes (list): A list to store competition boxes
-        on the Fortuna webpage.
-    - events_objects (list): A dictionary to store event objects
-        collected from Fortuna.
+    - EVENTS_LAYOUT (dict): XPaths of the competitions and their events
+        on the Fortuna webpage, rows of sub-markets are skipped.
     - logging (Logger): The logger for handling log messages.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
-        self.competition_boxes: list = []
-        self.events_objects: list = []
+    EVENTS_LAYOUT = {
+        "groups": '//*[@id="sport-events-list-content"]/section[*]',
+        "group_fields": {"competition": ".//h2"},
+        "events": ".//div[2]/div/div/table/tbody/tr[*]",
+        "skip_classes": ["row-sub-markets"],
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.logging = setup_logger(name="FORTUNA", print_logs=True)
         self.logging.info(f"Starting to collect data: {self.site_path}")
 
@@ -62,60 +64,14 @@ class FortunaScraper(Scraper):
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
-    def get_whole_site(self):
-        """
-        Scroll through the entire webpage to ensure all content is loaded.
-        """
-        last_height = self.driver.execute_script(
-            "return document.body.scrollHeight"
-        )
-        while True:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            time.sleep(3)
-            new_height = self.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
-            if new_height == last_height:
-                break
-            last_height = new_height
-        time.sleep(1)
-
-    def get_segments(self):
-        """
-        Collect and store the segment elements from the current webpage.
-        """
-        try:
-            self.competition_boxes = self.driver.find_elements(
-                By.XPATH, '//*[@id="sport-events-list-content"]/section[*]'
-            )
-        except NoSuchElementException:
-            self.logging.warning("No segment elements")
-
-    def get_all_events_objects(self):
-        """
-        Collect and store all event objects from the current webpage.
-        """
-        for box in self.competition_boxes:
-            for event in box.find_elements(
-                By.XPATH, ".//div[2]/div/div/table/tbody/tr[*]"
-            ):
-                if event.get_attribute("class") != "row-sub-markets":
-                    self.events_objects.append(event)
-
     def get_events_from_site(self):
         """
-        Attempts to collect events by closing cookie messages, scrolling
-        through the entire site, extracting segments, and finally obtaining
-        all event objects from the segments.
+        Attempts to load all events by closing cookie messages and
+        scrolling through the entire site.
         """
         try:
             self.close_cookie_msg()
             self.get_whole_site()
-            self.get_whole_site()  # to be sure that whole site is unwraped
-            self.get_segments()
-            self.get_all_events_objects()
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Events collected: {self.site_path}")
@@ -141,8 +97,19 @@ class FortunaTwoWayBets(FortunaScraper):
     site_path (str): The URL of the Fortuna webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **FortunaScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": ".//td[1]/div/div[1]/span[1]",
+            "away_player": ".//td[1]/div/div[1]/span[1]",
+            "home_team_win": ".//td[2]/a/span",
+            "away_team_win": ".//td[3]/a/span",
+            "event_date": class_xpath("event-datetime"),
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = TwoWayBetEventsTable("FORTUNA")
 
     def get_events_values(self, result_queue):
@@ -165,25 +132,8 @@ class FortunaTwoWayBets(FortunaScraper):
         None
         """
         self.get_events_from_site()
-        for event in self.events_objects:
+        for event_data in self.extract_events():
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH, ".//td[1]/div/div[1]/span[1]"
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH, ".//td[1]/div/div[1]/span[1]"
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH, ".//td[2]/a/span"
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH, ".//td[3]/a/span"
-                    ).text,
-                    "event_date": event.find_element(
-                        By.CLASS_NAME, "event-datetime"
-                    ).text,
-                }
                 if len(event_data["home_player"].split(" - ")) < 2:
                     pass
                 else:
@@ -192,12 +142,10 @@ class FortunaTwoWayBets(FortunaScraper):
                             event_data, FortunaParser()
                         )
                     )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
 
 
@@ -221,8 +169,20 @@ class FortunaThreeWayBets(FortunaScraper):
     site_path (str): The URL of the Fortuna webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **FortunaScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": ".//td[1]/div/div[1]/span[1]",
+            "away_player": ".//td[1]/div/div[1]/span[1]",
+            "home_team_win": ".//td[2]/a/span",
+            "draw": ".//td[3]/a/span",
+            "away_team_win": ".//td[4]/a/span",
+            "event_date": class_xpath("event-datetime"),
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = ThreeWayBetEventsTable("FORTUNA")
 
     def get_events_values(self, result_queue):
@@ -245,28 +205,8 @@ class FortunaThreeWayBets(FortunaScraper):
         None
         """
         self.get_events_from_site()
-        for event in self.events_objects:
+        for event_data in self.extract_events():
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH, ".//td[1]/div/div[1]/span[1]"
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH, ".//td[1]/div/div[1]/span[1]"
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH, ".//td[2]/a/span"
-                    ).text,
-                    "draw": event.find_element(
-                        By.XPATH, ".//td[3]/a/span"
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH, ".//td[4]/a/span"
-                    ).text,
-                    "event_date": event.find_element(
-                        By.CLASS_NAME, "event-datetime"
-                    ).text,
-                }
                 if len(event_data["home_player"].split(" - ")) < 2:
                     pass
                 else:
@@ -275,10 +215,8 @@ class FortunaThreeWayBets(FortunaScraper):
                             event_data, FortunaParser()
                         )
                     )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
@@ -12,7 +12,6 @@ STSThreeWayBets(STSScraper): A class representing a scraper for
     collecting three-way sports betting data from STS.
 """
 
-import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from scrapers.base import Scraper
@@ -34,17 +33,23 @@ class STSScraper(Scraper):
     Attributes:
     -----------
     - site_path (str): The URL of the STS website.
-    - competition_boxes (list): A list to store competition boxes
+    - EVENTS_LAYOUT (dict): XPaths of the competitions and their events
         on the STS webpage.
-    - events_objects (list): A dictionary to store event objects
-        collected from STS.
     - logging (Logger): The logger for handling log messages.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
-        self.competition_boxes: list = []
-        self.events_objects: list = []
+    EVENTS_LAYOUT = {
+        "groups": (
+            "/html/body/app-mweb/div/div/div/div[1]/div/div[2]/app-prematch"
+            "/app-sport/div[2]/app-popular/div/app-show-more-container"
+            "/bb-leagues-wrapper/bb-league[*]"
+        ),
+        "group_fields": {"competition": "./div/div[1]"},
+        "events": "./div/div[2]/bb-match[*]",
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.logging = setup_logger(name="STS", print_logs=True)
         self.logging.info(f"Starting to collect data: {self.site_path}")
 
@@ -63,56 +68,44 @@ class STSScraper(Scraper):
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
-    def get_whole_site(self):
+    def get_whole_site(self, max_steps: int = 100) -> None:
         """
-        Scroll through the entire webpage to ensure all content is loaded.
+        Click the button showing more competitions until it disappears,
+        the webpage does not settle or the limit of steps is reached.
+
+        Parameters:
+        -----------
+        - max_steps (int): The limit of clicks of the button.
         """
-        while True:
+        for _ in range(max_steps):
             try:
                 close_button = self.driver.find_element(
                     By.XPATH,
-                    "/html/body/app-mweb/div/div/div/div[1]/div/div[2]/app-prematch/app-sport/div[2]/app-popular/div/app-show-more-container/app-show-more-progress-info/div/sts-shared-static-button/button/span/span[2]/span",
+                    "/html/body/app-mweb/div/div/div/div[1]/div/div[2]"
+                    "/app-prematch/app-sport/div[2]/app-popular/div"
+                    "/app-show-more-container/app-show-more-progress-info"
+                    "/div/sts-shared-static-button/button/span/span[2]/span",
                 )
                 close_button.click()
-                time.sleep(0.5)
+                if not self.wait_until_quiet():
+                    self.logging.warning(
+                        "Webpage not settled, showing more stopped"
+                    )
+                    break
             except NoSuchElementException:
                 break
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
-
-    def get_segments(self):
-        """
-        Collect and store the segment elements from the current webpage.
-        """
-        try:
-            self.competition_boxes = self.driver.find_elements(
-                By.XPATH,
-                "/html/body/app-mweb/div/div/div/div[1]/div/div[2]/app-prematch/app-sport/div[2]/app-popular/div/app-show-more-container/bb-leagues-wrapper/bb-league[*]",
-            )
-        except NoSuchElementException:
-            self.logging.warning("No segment elements")
-
-    def get_all_events_objects(self):
-        """
-        Collect and store all event objects from the current webpage.
-        """
-        for box in self.competition_boxes:
-            for event in box.find_elements(
-                By.XPATH, "./div/div[2]/bb-match[*]"
-            ):
-                self.events_objects.append(event)
+                break
 
     def get_events_from_site(self):
         """
-        Attempts to collect events by closing cookie messages, scrolling
-        through the entire site, extracting segments, and finally obtaining
-        all event objects from the segments.
+        Attempts to load all events by closing cookie messages and
+        scrolling through the entire site.
         """
         try:
             self.close_cookie_msg()
             self.get_whole_site()
-            self.get_segments()
-            self.get_all_events_objects()
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Events collected: {self.site_path}")
@@ -138,8 +131,19 @@ class STSTwoWayBets(STSScraper):
     site_path (str): The URL of the STS webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **STSScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./div/div[2]/div[1]/a/bb-score/div/div/div/p[1]",
+            "away_player": "./div/div[2]/div[1]/a/bb-score/div/div/div/p[2]",
+            "home_team_win": "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[1]/div/div/div[2]",
+            "away_team_win": "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[2]/div/div/div[2]",
+            "event_date": "./div/div[1]/div[1]/a/bb-score-header/div/div/div/div/span[1]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = TwoWayBetEventsTable("STS")
 
     def get_events_values(self, result_queue):
@@ -162,39 +166,15 @@ class STSTwoWayBets(STSScraper):
         None
         """
         self.get_events_from_site()
-        for event in self.events_objects:
+        for event_data in self.extract_events():
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[1]/a/bb-score/div/div/div/p[1]",
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[1]/a/bb-score/div/div/div/p[2]",
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[1]/div/div/div[2]",
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[2]/div/div/div[2]",
-                    ).text,
-                    "event_date": event.find_element(
-                        By.XPATH,
-                        "./div/div[1]/div[1]/a/bb-score-header/div/div/div/div/span[1]",
-                    ).text,
-                }
                 self.events_data.put(
                     TwoWayBetEvent.create_from_data(event_data, STSParser())
                 )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
 
 
@@ -218,8 +198,20 @@ class STSThreeWayBets(STSScraper):
     site_path (str): The URL of the STS webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **STSScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./div/div[2]/div[1]/a/bb-score/div/div/div/p[1]",
+            "away_player": "./div/div[2]/div[1]/a/bb-score/div/div/div/p[2]",
+            "home_team_win": "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[1]/div/div/div[2]",
+            "draw": "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[2]/div/div/div[2]",
+            "away_team_win": "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[3]/div/div/div[2]",
+            "event_date": "./div/div[1]/div[1]/a/bb-score-header/div/div/div/div/span[1]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = ThreeWayBetEventsTable("STS")
 
     def get_events_values(self, result_queue):
@@ -242,41 +234,13 @@ class STSThreeWayBets(STSScraper):
         None
         """
         self.get_events_from_site()
-        for event in self.events_objects:
+        for event_data in self.extract_events():
             try:
-                event_data = {
-                    "home_player": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[1]/a/bb-score/div/div/div/p[1]",
-                    ).text,
-                    "away_player": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[1]/a/bb-score/div/div/div/p[2]",
-                    ).text,
-                    "home_team_win": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[1]/div/div/div[2]",
-                    ).text,
-                    "draw": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[2]/div/div/div[2]",
-                    ).text,
-                    "away_team_win": event.find_element(
-                        By.XPATH,
-                        "./div/div[2]/div[2]/bb-opportunity/div/div/bb-odd[3]/div/div/div[2]",
-                    ).text,
-                    "event_date": event.find_element(
-                        By.XPATH,
-                        "./div/div[1]/div[1]/a/bb-score-header/div/div/div/div/span[1]",
-                    ).text,
-                }
                 self.events_data.put(
                     ThreeWayBetEvent.create_from_data(event_data, STSParser())
                 )
-            except NoSuchElementException:
-                pass
             except Exception as e:
                 self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
@@ -11,12 +11,13 @@ SuperbetTwoWayBets(SuperbetScraper):A class representing a scraper for
 SuperbetThreeWayBets(SuperbetScraper): A class representing a scraper for
     collecting three-way sports betting data from Superbet.
 """
+
 import traceback
-import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-from scrapers.base import Scraper
-from utils.parsers import SuperbetParser
+from scrapers.base import BrowserProfile, Scraper
+from scrapers.feeds import SuperbetFeedAdapter
+from utils.parsers import FeedParser, SuperbetParser
 from utils.events import (
     TwoWayBetEvent,
     ThreeWayBetEvent,
@@ -34,14 +35,25 @@ class SuperbetScraper(Scraper):
     Attributes:
     -----------
     - site_path (str): The URL of the Superbet website.
-    - events_objects (list): A dictionary to store event objects
-        collected from Superbet.
+    - PROFILE (BrowserProfile): The browser profile capturing the
+        responses of the Superbet offer feed.
+    - FEED_ADAPTER (SuperbetFeedAdapter): The adapter of the feed.
+    - EVENTS_LAYOUT (dict): XPaths of the events on the Superbet
+        webpage, read when the feed was not captured. Events are
+        deduplicated page-side by their participants, Superbet lists
+        one fixture under several event-<id> elements.
     - logging (Logger): The logger for handling log messages.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
-        self.events_objects: list = []
+    PROFILE = BrowserProfile(capture_network=True)
+    FEED_ADAPTER = SuperbetFeedAdapter()
+    EVENTS_LAYOUT = {
+        "events": '//*[contains(@id, "event-")]/div/div[1]',
+        "key_closest": '[id*="event-"]',
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.logging = setup_logger(name="SUPERBET", print_logs=True)
         self.logging.info(f"Starting to collect data: {self.site_path}")
 
@@ -59,35 +71,34 @@ class SuperbetScraper(Scraper):
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
 
-    def get_whole_site(self):
+    def get_feed_events(self, quiet: float = 1, timeout: float = 10):
         """
-        Scroll through the entire webpage to ensure all content is loaded.
+        Collect the values of events from the captured feed, keeping
+        only the first listing of every pair of participants.
+
+        Parameters:
+        -----------
+        - quiet (float): Seconds without new responses of the feed
+            treated as loaded.
+        - timeout (float): Seconds to wait for the feed at most.
+
+        Returns:
+        --------
+        List[dict]: Values of the events ready for the FeedParser.
         """
-        last_height = self.driver.execute_script(
-            "return document.body.scrollHeight"
-        )
-        while True:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            time.sleep(3)
-            new_height = self.driver.execute_script(
-                "return document.body.scrollHeight"
-            )
-            if new_height == last_height:
-                break
-            last_height = new_height
-        self.driver.execute_script("window.scrollTo(0, 0);")
+        events = {}
+        for event_data in super().get_feed_events(quiet, timeout):
+            name = event_data["home_player"] + event_data["away_player"]
+            events.setdefault(name, event_data)
+        return list(events.values())
 
     def get_events_from_site(self):
         """
-        Attempts to collect events by closing cookie messages, scrolling
-        through the entire site.
+        Attempts to prepare the site by closing cookie messages, events
+        are streamed while scrolling through the site.
         """
         try:
             self.close_cookie_msg()
-            self.get_whole_site()
-            self.get_whole_site()
         except Exception as e:
             self.logging.error(f"Unknown bug, more here: {e}")
         self.logging.info(f"Events collected: {self.site_path}")
@@ -113,8 +124,19 @@ class SuperbetTwoWayBets(SuperbetScraper):
     site_path (str): The URL of the Superbet webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **SuperbetScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./div[1]/div[2]/div[1]/span[1]",
+            "away_player": "./div[1]/div[2]/div[1]/span[2]",
+            "home_team_win": "./div[2]/div[2]/div/div[1]/button/span[4]/span[2]",
+            "away_team_win": "./div[2]/div[2]/div/div[2]/button/span[4]/span[2]",
+            "event_date": "./div[1]/div[1]/span[1]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = TwoWayBetEventsTable("SUPERBET")
 
     def get_events_values(self, result_queue):
@@ -123,9 +145,11 @@ class SuperbetTwoWayBets(SuperbetScraper):
         the Superbet webpage.
 
         This method scrapes and extracts relevant information
-        from the Superbet webpage for two-way sports betting events.
+        from the Superbet webpage for two-way sports betting events,
+        streaming the rows of the virtualized list while scrolling.
         The collected data is then formatted and added to
-        the TwoWayBetEventsTable using the SuperbetParser.
+        the TwoWayBetEventsTable using the SuperbetParser, or the
+        FeedParser when the events were read from the captured feed.
 
         Parameters:
         -----------
@@ -136,64 +160,36 @@ class SuperbetTwoWayBets(SuperbetScraper):
         --------
         None
         """
+        feed_events = self.get_feed_events()
+        for event_data in feed_events:
+            try:
+                self.events_data.put(
+                    TwoWayBetEvent.create_from_data(event_data, FeedParser())
+                )
+            except Exception as e:
+                self.logging.error(f"Unknown bug, more here: {e}")
+        if feed_events:
+            self.logging.info(f"Data collected from feed: {self.site_path}")
+            self.close_driver()
+            result_queue.put(self.events_data)
+            return
         self.get_events_from_site()
-        height = self.driver.execute_script("return window.scrollY;")
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        while True:
-            elements = self.driver.find_elements(
-                By.XPATH, '//*[contains(@id, "event-")]/div/div[1]'
-            )
-            for element in elements:
+        for batch in self.stream_events(step=4000):
+            for event_data in batch:
                 try:
-                    home_name = element.find_element(
-                        By.XPATH, "./div[1]/div[2]/div[1]/span[1]"
-                    ).text
-                    away_name = element.find_element(
-                        By.XPATH, "./div[1]/div[2]/div[1]/span[2]"
-                    ).text
-                    if f"{home_name}{away_name}" in self.events_objects:
-                        pass
-                    else:
-                        event_data = {
-                            "home_player": home_name,
-                            "away_player": away_name,
-                            "home_team_win": element.find_element(
-                                By.XPATH,
-                                "./div[2]/div[2]/div/div[1]/button/span[4]/span[2]",
-                            ).text,
-                            "away_team_win": element.find_element(
-                                By.XPATH,
-                                "./div[2]/div[2]/div/div[2]/button/span[4]/span[2]",
-                            ).text,
-                            "event_date": element.find_element(
-                                By.XPATH,
-                                "./div[1]/div[1]/span[1]",
-                            ).text,
-                        }
-                        self.events_data.put(
-                            TwoWayBetEvent.create_from_data(
-                                event_data, SuperbetParser()
-                            )
+                    self.events_data.put(
+                        TwoWayBetEvent.create_from_data(
+                            event_data, SuperbetParser()
                         )
-                        self.events_objects.append(f"{home_name}{away_name}")
-                except NoSuchElementException:
-                    pass
+                    )
                 except Exception as e:
                     exception_message = str(e)
                     traceback_str = traceback.format_exc()
                     self.logging.error(
                         f"Unknown bug, more here: {traceback_str} {exception_message}"
                     )
-            self.driver.execute_script(
-                f"window.scrollTo(0, window.scrollY + {4000});"
-            )
-            time.sleep(0.01)
-            new_height = self.driver.execute_script("return window.scrollY;")
-            if height == new_height:
-                break
-            height = new_height
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
 
 
@@ -217,8 +213,20 @@ class SuperbetThreeWayBets(SuperbetScraper):
     site_path (str): The URL of the Superbet webpage to scrape.
     """
 
-    def __init__(self, site_path: str) -> None:
-        super().__init__(site_path)
+    EVENTS_LAYOUT = {
+        **SuperbetScraper.EVENTS_LAYOUT,
+        "fields": {
+            "home_player": "./div[1]/div[2]/div[1]/span[1]",
+            "away_player": "./div[1]/div[2]/div[1]/span[2]",
+            "home_team_win": "./div[2]/div[2]/div/div[1]/button/span[4]/span[2]",
+            "draw": "./div[2]/div[2]/div/div[2]/button/span[4]/span[2]",
+            "away_team_win": "./div[2]/div[2]/div/div[3]/button/span[4]/span[2]",
+            "event_date": "./div[1]/div[1]/span[1]",
+        },
+    }
+
+    def __init__(self, site_path: str, driver_pool=None) -> None:
+        super().__init__(site_path, driver_pool)
         self.events_data = ThreeWayBetEventsTable("SUPERBET")
 
     def get_events_values(self, result_queue):
@@ -227,9 +235,11 @@ class SuperbetThreeWayBets(SuperbetScraper):
         the Superbet webpage.
 
         This method scrapes and extracts relevant information
-        from the Superbet webpage for three-way sports betting events.
+        from the Superbet webpage for three-way sports betting events,
+        streaming the rows of the virtualized list while scrolling.
         The collected data is then formatted and added to
-        the ThreeWayBetEventsTable using the SuperbetParser.
+        the ThreeWayBetEventsTable using the SuperbetParser, or the
+        FeedParser when the events were read from the captured feed.
 
         Parameters:
         -----------
@@ -240,66 +250,34 @@ class SuperbetThreeWayBets(SuperbetScraper):
         --------
         None
         """
+        feed_events = self.get_feed_events()
+        for event_data in feed_events:
+            try:
+                self.events_data.put(
+                    ThreeWayBetEvent.create_from_data(event_data, FeedParser())
+                )
+            except Exception as e:
+                self.logging.error(f"Unknown bug, more here: {e}")
+        if feed_events:
+            self.logging.info(f"Data collected from feed: {self.site_path}")
+            self.close_driver()
+            result_queue.put(self.events_data)
+            return
         self.get_events_from_site()
-        height = self.driver.execute_script("return window.scrollY;")
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        while True:
-            elements = self.driver.find_elements(
-                By.XPATH, '//*[contains(@id, "event-")]/div/div[1]'
-            )
-            for element in elements:
+        for batch in self.stream_events(step=4000):
+            for event_data in batch:
                 try:
-                    home_name = element.find_element(
-                        By.XPATH, "./div[1]/div[2]/div[1]/span[1]"
-                    ).text
-                    away_name = element.find_element(
-                        By.XPATH, "./div[1]/div[2]/div[1]/span[2]"
-                    ).text
-                    if f"{home_name}{away_name}" in self.events_objects:
-                        pass
-                    else:
-                        event_data = {
-                            "home_player": home_name,
-                            "away_player": away_name,
-                            "home_team_win": element.find_element(
-                                By.XPATH,
-                                "./div[2]/div[2]/div/div[1]/button/span[4]/span[2]",
-                            ).text,
-                            "draw": element.find_element(
-                                By.XPATH,
-                                "./div[2]/div[2]/div/div[2]/button/span[4]/span[2]",
-                            ).text,
-                            "away_team_win": element.find_element(
-                                By.XPATH,
-                                "./div[2]/div[2]/div/div[3]/button/span[4]/span[2]",
-                            ).text,
-                            "event_date": element.find_element(
-                                By.XPATH,
-                                "./div[1]/div[1]/span[1]",
-                            ).text,
-                        }
-                        self.events_data.put(
-                            ThreeWayBetEvent.create_from_data(
-                                event_data, SuperbetParser()
-                            )
+                    self.events_data.put(
+                        ThreeWayBetEvent.create_from_data(
+                            event_data, SuperbetParser()
                         )
-                        self.events_objects.append(f"{home_name}{away_name}")
-                except NoSuchElementException:
-                    pass
+                    )
                 except Exception as e:
                     exception_message = str(e)
                     traceback_str = traceback.format_exc()
                     self.logging.error(
                         f"Unknown bug, more here: {traceback_str} {exception_message}"
                     )
-            self.driver.execute_script(
-                f"window.scrollTo(0, window.scrollY + {4000});"
-            )
-            time.sleep(0.01)
-            new_height = self.driver.execute_script("return window.scrollY;")
-            if height == new_height:
-                break
-            height = new_height
         self.logging.info(f"Data collected: {self.site_path}")
-        self.driver.quit()
+        self.close_driver()
         result_queue.put(self.events_data)
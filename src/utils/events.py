@@ -18,16 +18,27 @@ Classes:
 7. MainEventsBoard: Class representing the main board containing various
     bettings for event.
 8. Event: Class representing a specific sports betting event.
+
+Functions:
+----------
+1. date_key: Converts the date of an event to the ISO format.
+2. intern_name: Interns the name of an event or a participant.
 """
 
-from typing import List, Dict
+from sys import intern
+from typing import List, Dict, Sequence, Tuple
 from copy import deepcopy
 from threading import Thread
 from queue import Queue
-from pandas import DataFrame, Series
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import AgglomerativeClustering
-from utils.technical import Constant
+from pandas import DataFrame, Series, concat, to_numeric
+from utils.matching import (
+    EventsMatcher,
+    MatchingCache,
+    UnionFind,
+    cluster_strings,
+    create_matcher,
+    league_key,
+)
 
 
 class BetEvent:
@@ -40,15 +51,56 @@ class BetEvent:
     - home_player (str): The name of the home player or team.
     - away_player (str): The name of the away player or team.
     - event_date (str): The date of the betting event.
+    - competition (str): The name of the league or tournament, None if
+        the bookmaker does not group events by competitions.
+
+    Events are slotted records, FIELDS lists the parameters of
+    the constructor in their order.
     """
 
+    __slots__ = (
+        "event_name",
+        "home_player",
+        "away_player",
+        "event_date",
+        "competition",
+    )
+    FIELDS = __slots__
+
     def __init__(
-        self, event_name, home_player, away_player, event_date
+        self,
+        event_name,
+        home_player,
+        away_player,
+        event_date,
+        competition=None,
     ) -> None:
         self.event_name = event_name
         self.home_player = home_player
         self.away_player = away_player
         self.event_date = event_date
+        self.competition = competition
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence]) -> List["BetEvent"]:
+        """
+        Creates many events from column arrays.
+
+        Parameters:
+        - columns (Dict[str, Sequence]): A dictionary mapping the FIELDS
+            of the class to sequences of equal length. The competition
+            column is optional.
+
+        Returns:
+        - List[BetEvent]: Events of the class, one for every position of
+            the sequences.
+        """
+        length = len(columns["event_name"])
+        values = [
+            columns[field] if field in columns else [None] * length
+            for field in cls.FIELDS
+        ]
+        return [cls(*event_values) for event_values in zip(*values)]
 
 
 class TwoWayBetEvent(BetEvent):
@@ -69,8 +121,20 @@ class TwoWayBetEvent(BetEvent):
     - event_date (str): The date of the betting event.
     - home_team_win (float): The odds for the home team to win.
     - away_team_win (float): The odds for the away team to win.
+    - competition (str, optional): The name of the league or tournament.
     """
 
+    __slots__ = ("home_team_win", "away_team_win")
+    FIELDS = (
+        "event_name",
+        "home_player",
+        "away_player",
+        "event_date",
+        "home_team_win",
+        "away_team_win",
+        "competition",
+    )
+
     def __init__(
         self,
         event_name,
@@ -79,12 +143,14 @@ class TwoWayBetEvent(BetEvent):
         event_date,
         home_team_win,
         away_team_win,
+        competition=None,
     ) -> None:
         super().__init__(
             event_name,
             home_player,
             away_player,
             event_date,
+            competition,
         )
         self.home_team_win = home_team_win
         self.away_team_win = away_team_win
@@ -111,6 +177,9 @@ class TwoWayBetEvent(BetEvent):
         event_date = parser.parse_date(bukmacher_data["event_date"])
         home_team_win = parser.parse_home_win(bukmacher_data["home_team_win"])
         away_team_win = parser.parse_away_win(bukmacher_data["away_team_win"])
+        competition = parser.parse_competition(
+            bukmacher_data.get("competition")
+        )
         return cls(
             event_name,
             home_player,
@@ -118,6 +187,7 @@ class TwoWayBetEvent(BetEvent):
             event_date,
             home_team_win,
             away_team_win,
+            competition,
         )
 
 
@@ -141,8 +211,21 @@ class ThreeWayBetEvent(BetEvent):
     - home_team_win (float): The odds for the home team to win.
     - draw (float): The odds for a draw.
     - away_team_win (float): The odds for the away team to win.
+    - competition (str, optional): The name of the league or tournament.
     """
 
+    __slots__ = ("home_team_win", "draw", "away_team_win")
+    FIELDS = (
+        "event_name",
+        "home_player",
+        "away_player",
+        "event_date",
+        "home_team_win",
+        "draw",
+        "away_team_win",
+        "competition",
+    )
+
     def __init__(
         self,
         event_name,
@@ -152,8 +235,11 @@ class ThreeWayBetEvent(BetEvent):
         home_team_win,
         draw,
         away_team_win,
+        competition=None,
     ) -> None:
-        super().__init__(event_name, home_player, away_player, event_date)
+        super().__init__(
+            event_name, home_player, away_player, event_date, competition
+        )
         self.home_team_win = home_team_win
         self.away_team_win = away_team_win
         self.draw = draw
@@ -181,6 +267,9 @@ class ThreeWayBetEvent(BetEvent):
         home_team_win = parser.parse_home_win(bukmacher_data["home_team_win"])
         draw = parser.parse_draw(bukmacher_data["draw"])
         away_team_win = parser.parse_away_win(bukmacher_data["away_team_win"])
+        competition = parser.parse_competition(
+            bukmacher_data.get("competition")
+        )
         return cls(
             event_name,
             home_player,
@@ -189,6 +278,7 @@ class ThreeWayBetEvent(BetEvent):
             home_team_win,
             draw,
             away_team_win,
+            competition,
         )
 
 
@@ -196,20 +286,39 @@ class BetEventsTable:
     """
     Represents a table of betting events for a specific bookmaker.
 
+    Events are collected into per-column lists and the DataFrame is
+    built once, on the first read of the data attribute, instead of
+    being copied for every added event. The DTYPES of the columns are
+    enforced whenever the DataFrame is built or replaced: odds are
+    float32, dates and competitions are categories of ISO dates and
+    names, names of events and participants are interned strings.
+
     Attributes:
     - bookmaker (str): The name or identifier of the bookmaker.
     - data (DataFrame): A pandas DataFrame containing information about
-        betting events.
+        betting events. The competition column is empty for bookmakers
+        which do not group events by competitions.
+    - buffer (dict): A dictionary mapping columns to the lists of values
+        of the events added since the last read of the data.
 
     Parameters:
     - bookmaker (str): The name or identifier of the bookmaker.
     """
 
+    COLUMNS = [
+        "event_name",
+        "home_player",
+        "away_player",
+        "event_date",
+        "competition",
+    ]
+    NAMES = ["event_name", "home_player", "away_player"]
+    DTYPES = {"event_date": "category", "competition": "category"}
+
     def __init__(self, bookmaker) -> None:
         self.bookmaker = bookmaker
-        self.data = DataFrame(
-            columns=["event_name", "home_player", "away_player", "event_date"]
-        )
+        self.frame = self.apply_dtypes(DataFrame(columns=self.COLUMNS))
+        self.buffer: Dict[str, list] = {column: [] for column in self.COLUMNS}
 
     def __str__(self) -> str:
         """
@@ -220,6 +329,65 @@ class BetEventsTable:
         """
         return f"{self.bookmaker}"
 
+    @property
+    def data(self) -> DataFrame:
+        """
+        DataFrame of all events of the table, the buffered events are
+        appended to it in one step.
+        """
+        if self.buffer[self.COLUMNS[0]]:
+            events = DataFrame(self.buffer, columns=self.COLUMNS)
+            if self.frame.empty:
+                self.frame = self.apply_dtypes(events)
+            else:
+                self.frame = self.apply_dtypes(
+                    concat([self.frame, events], ignore_index=True)
+                )
+            self.buffer = {column: [] for column in self.COLUMNS}
+        return self.frame
+
+    @data.setter
+    def data(self, value: DataFrame) -> None:
+        self.frame = self.apply_dtypes(value)
+        self.buffer = {column: [] for column in self.COLUMNS}
+
+    def apply_dtypes(self, frame: DataFrame) -> DataFrame:
+        """
+        Converts the columns of the table to their DTYPES.
+
+        Parameters:
+        - frame (DataFrame): Events of the table.
+
+        Returns:
+        - DataFrame: Events with converted columns, columns missing in
+            the frame are skipped.
+        """
+        frame = frame.copy()
+        for column in self.NAMES:
+            if column in frame:
+                frame[column] = frame[column].map(intern_name).astype(object)
+        if "event_date" in frame:
+            frame["event_date"] = frame["event_date"].map(date_key)
+        for column, dtype in self.DTYPES.items():
+            if column not in frame:
+                continue
+            if dtype != "category":
+                frame[column] = to_numeric(frame[column], errors="coerce")
+            frame[column] = frame[column].astype(dtype)
+        return frame
+
+    def put(self, event_data: object):
+        """
+        Adds event objects when consolidating all events of a given sport
+        at a given bookmaker into a table.
+
+        Parameters:
+        - event_data (object): An instance of BetEvent subclass matching
+            the table containing event data.
+        """
+        for column, values in self.buffer.items():
+            values.append(getattr(event_data, column))
+
 
 class TwoWayBetEventsTable(BetEventsTable):
     """
@@ -233,31 +401,12 @@ class TwoWayBetEventsTable(BetEventsTable):
     - bookmaker (str): The name or identifier of the bookmaker.
     """
 
-    def __init__(self, bookmaker) -> None:
-        super().__init__(bookmaker)
-        self.data["home_team_win"] = []
-        self.data["away_team_win"] = []
-
-    def put(self, event_data: object):
-        """
-        Adds event objects when consolidating all events of a given sport
-        at a given bookmaker into a table.
-
-        Parameters:
-        - event_data (object): An instance of TwoWayBetEvent containing
-            event data.
-        """
-        self.data = self.data._append(
-            {
-                "event_name": event_data.event_name,
-                "home_player": event_data.home_player,
-                "away_player": event_data.away_player,
-                "event_date": event_data.event_date,
-                "home_team_win": event_data.home_team_win,
-                "away_team_win": event_data.away_team_win,
-            },
-            ignore_index=True,
-        )
+    COLUMNS = BetEventsTable.COLUMNS + ["home_team_win", "away_team_win"]
+    DTYPES = {
+        **BetEventsTable.DTYPES,
+        "home_team_win": "float32",
+        "away_team_win": "float32",
+    }
 
 
 class ThreeWayBetEventsTable(BetEventsTable):
@@ -272,33 +421,17 @@ class ThreeWayBetEventsTable(BetEventsTable):
     - bookmaker (str): The name or identifier of the bookmaker.
     """
 
-    def __init__(self, bookmaker) -> None:
-        super().__init__(bookmaker)
-        self.data["home_team_win"] = []
-        self.data["draw"] = []
-        self.data["away_team_win"] = []
-
-    def put(self, event_data: object):
-        """
-        Adds event objects when consolidating all events of a given sport
-        at a given bookmaker into a table.
-
-        Parameters:
-        - event_data (object): An instance of ThreeWayBetEvent containing
-            event data.
-        """
-        self.data = self.data._append(
-            {
-                "event_name": event_data.event_name,
-                "home_player": event_data.home_player,
-                "away_player": event_data.away_player,
-                "event_date": event_data.event_date,
-                "home_team_win": event_data.home_team_win,
-                "draw": event_data.draw,
-                "away_team_win": event_data.away_team_win,
-            },
-            ignore_index=True,
-        )
+    COLUMNS = BetEventsTable.COLUMNS + [
+        "home_team_win",
+        "draw",
+        "away_team_win",
+    ]
+    DTYPES = {
+        **BetEventsTable.DTYPES,
+        "home_team_win": "float32",
+        "draw": "float32",
+        "away_team_win": "float32",
+    }
 
 
 class MainEventsBoard:
@@ -312,16 +445,54 @@ class MainEventsBoard:
     - events_table (pandas.DataFrame): A data frame containing odds
         values for events.
 
+    - matching_cache (MatchingCache): Events matched in the previous
+        cycle, reused to match only new events.
+    - matcher (EventsMatcher): The strategy used to find matching events.
+    - charsets (CharsetEncoder): Encoder of the character sets of event
+        names used by the Jaccard similarity.
+    - matchers (dict): Strategies created by name, shared by the cycles.
+    - matching_mode (str): "anchor" to match events of all bookmakers
+        with the events of the bookmaker with the highest number of
+        records, "graph" to match every pair of bookmakers.
+    - swapped_events (set): Pairs of (bookmaker, event_name) of the events
+        listed with home and away participants in reverse order to
+        the first event of their row.
+
     Parameters:
     -----------
-    - bookmaker (str): The name of the bookmaker.
-    - events_table (TwoWayBetEventsTable or ThreeWayBetEventsTable):
-        The event table for the bookmaker.
+    - matching_cache (MatchingCache, optional): Cache shared between
+        the cycles of the same sport.
+    - matcher (str or EventsMatcher, optional): The matching strategy or
+        its name (see utils.matching.MATCHERS). Default is "auto".
+    - matching_mode (str, optional): The matching mode. Default is
+        "anchor".
     """
 
-    def __init__(self) -> None:
+    MATCHING_MODES = ("anchor", "graph")
+
+    def __init__(
+        self,
+        matching_cache: MatchingCache = None,
+        matcher: str or EventsMatcher = "auto",
+        matching_mode: str = "anchor",
+    ) -> None:
+        if matching_mode not in self.MATCHING_MODES:
+            raise ValueError(
+                f"Unknown matching mode {matching_mode!r}, "
+                f"expected one of {self.MATCHING_MODES}"
+            )
         self.events_dict: dict = {}
         self.events_table = DataFrame()
+        self.matching_cache = (
+            matching_cache if matching_cache is not None else MatchingCache()
+        )
+        if not isinstance(matcher, EventsMatcher):
+            matcher = create_matcher(matcher)
+        self.matcher = matcher
+        self.charsets = matcher.charsets
+        self.matchers = {matcher.name: matcher}
+        self.matching_mode = matching_mode
+        self.swapped_events: set = set()
 
     def put_data(
         self, data: TwoWayBetEventsTable or ThreeWayBetEventsTable
@@ -385,6 +556,79 @@ class MainEventsBoard:
             provisor_events_list[key] = events_names.to_list()
         return provisor_events_list
 
+    def create_leagues_dict(self, date: str) -> Dict[str, Dict[str, str]]:
+        """
+        Create a dictionary mapping bookmakers to the league keys of their
+        events for a given date.
+
+        Parameters:
+        -----------
+        - date (str): The date of the events.
+
+        Returns:
+        --------
+        Dict[str, Dict[str, str]]: A dictionary where keys are bookmakers,
+        and values map event names to league keys (None if the bookmaker
+        did not provide the competition).
+        """
+        leagues_dict = {}
+        for key, events_object in self.events_dict.items():
+            data = events_object.data
+            if "competition" not in data.columns:
+                leagues_dict[key] = {}
+                continue
+            events = data.loc[
+                data["event_date"] == date, ["event_name", "competition"]
+            ]
+            leagues_dict[key] = {
+                event_name: league_key(competition)
+                for event_name, competition in events.itertuples(index=False)
+            }
+        return leagues_dict
+
+    def create_league_buckets(
+        self,
+        work_dict: Dict[str, List[str]],
+        leagues_dict: Dict[str, Dict[str, str]],
+    ) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        """
+        Group candidate events of every bookmaker by league keys.
+
+        Events without the competition label are added to every bucket of
+        their bookmaker, the None bucket contains all events of the date.
+        Buckets are tuples, so the matcher finds their indexes by identity
+        instead of hashing the candidates of every main event.
+
+        Parameters:
+        -----------
+        - work_dict (Dict[str, List[str]]): A dictionary where keys are
+            bookmakers, and values are lists of event names.
+        - leagues_dict (Dict[str, Dict[str, str]]): League keys of
+            the events.
+
+        Returns:
+        --------
+        Dict[str, Dict[str, Tuple[str, ...]]]: A dictionary where keys are
+        bookmakers, and values map league keys to candidate event names.
+        """
+        buckets = {}
+        for bookmaker, events_names in work_dict.items():
+            leagues = leagues_dict.get(bookmaker, {})
+            unlabeled = []
+            labeled: Dict[str, List[str]] = {}
+            for event_name in events_names:
+                league = leagues.get(event_name)
+                if league is None:
+                    unlabeled.append(event_name)
+                else:
+                    labeled.setdefault(league, []).append(event_name)
+            buckets[bookmaker] = {
+                league: tuple(names + unlabeled)
+                for league, names in labeled.items()
+            }
+            buckets[bookmaker][None] = tuple(events_names)
+        return buckets
+
     def highest_number_of_records(self, data: Dict[str, List[str]]) -> str:
         """
         Find the bookmaker with the highest number of records.
@@ -413,10 +657,78 @@ class MainEventsBoard:
         --------
         float: Jaccard similarity between the two sets.
         """
-        set1 = set(first_string)
-        set2 = set(secound_string)
-        union = len(set1) + len(set2) - len(set1.intersection(set2))
-        return len(set1.intersection(set2)) / union
+        return self.charsets.jaccard(
+            self.charsets.get_features(first_string).mask,
+            self.charsets.get_features(secound_string).mask,
+        )
+
+    def is_swapped(self, first_event: str, second_event: str) -> bool:
+        """
+        Check if two matched events list their participants in reverse
+        order.
+
+        Parameters:
+        -----------
+        - first_event (str): The name of the first event.
+        - second_event (str): The name of the second event.
+
+        Returns:
+        --------
+        bool: True if the home participant of one event is more similar
+        to the away participant of the other one.
+        """
+        first = self.charsets.get_features(first_event)
+        second = self.charsets.get_features(second_event)
+        if not (first.valid and second.valid):
+            return False
+        jaccard = self.charsets.jaccard
+        straight = jaccard(first.home_mask, second.home_mask) + jaccard(
+            first.away_mask, second.away_mask
+        )
+        reverse = jaccard(first.home_mask, second.away_mask) + jaccard(
+            first.away_mask, second.home_mask
+        )
+        return reverse > straight
+
+    def find_swapped_events(self, rows: List[Dict[str, str]]) -> set:
+        """
+        Find the events listed in reverse order to the first event of
+        their row (in the order of bookmakers columns).
+
+        Parameters:
+        -----------
+        - rows (List[Dict[str, str]]): Rows mapping bookmakers to event
+            names.
+
+        Returns:
+        --------
+        set: Pairs of (bookmaker, event_name) of the reversed events.
+        """
+        swapped_events = set()
+        cols = self.get_cols_names()
+        for row in rows:
+            members = [(key, row[key]) for key in cols if row.get(key)]
+            for bookmaker, event_name in members[1:]:
+                if self.is_swapped(members[0][1], event_name):
+                    swapped_events.add((bookmaker, event_name))
+        return swapped_events
+
+    def get_matcher(self, name: str) -> EventsMatcher:
+        """
+        Get the matching strategy of the given name, sharing the character
+        sets encoder of the board.
+
+        Parameters:
+        -----------
+        - name (str): The name of the strategy.
+
+        Returns:
+        --------
+        EventsMatcher: The matching strategy.
+        """
+        if name not in self.matchers:
+            self.matchers[name] = create_matcher(name, self.charsets)
+        return self.matchers[name]
 
     def cluster_strings(self, string_list) -> Dict[int, List[int]]:
         """
@@ -433,28 +745,17 @@ class MainEventsBoard:
         Dict[int, List[int]]: A dictionary where keys are cluster labels
         and values are lists of indices corresponding to the input lists.
         """
-        vectorizer = TfidfVectorizer()
-        X = vectorizer.fit_transform([" ".join(lst) for lst in string_list])
-        clustering = AgglomerativeClustering(
-            n_clusters=None,
-            distance_threshold=Constant.CLUSTER_STRINGS_THRESHOLDS,
-            linkage="average",
-            metric="cosine",
-        )
-        labels = clustering.fit_predict(X.toarray())
-
-        clusters = {}
-        for idx, label in enumerate(labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(idx)
-
-        return clusters
+        return cluster_strings(string_list)
 
     def run_matching_pool(self, main_event, other_events_dict) -> dict:
         """
         Run a matching pool to find matching events.
 
+        Bookmakers listing an event with the equal normalized name, or
+        a similar one among the events with the equal phonetic keys, are
+        resolved by the lookup, threads scoring all candidates are
+        started only for the other bookmakers.
+
         Parameters:
         -----------
         main_event (str): The main event for which matches are sought.
@@ -469,8 +770,12 @@ class MainEventsBoard:
         slots = []
         results = []
         for key, value in other_events_dict.items():
+            exact_match = self.matcher.lookup(main_event, value)
+            if exact_match is not None:
+                matching_events_dict[key] = exact_match
+                continue
             thread = Thread(
-                target=self.find_matching_events_jaccard,
+                target=self.find_matching_events,
                 args=(
                     key,
                     value,
@@ -491,6 +796,19 @@ class MainEventsBoard:
 
         return matching_events_dict
 
+    def find_matching_events(self, key, value, main_event, result_queue):
+        """
+        Find matching events with the matching strategy of the board.
+
+        Parameters:
+        -----------
+        key (str): The key of the event in the dictionary.
+        value (list): The list of events to match against.
+        main_event (str): The main event for which matches are sought.
+        result_queue (Queue): A queue to store the results.
+        """
+        result_queue.put((key, self.matcher.match(main_event, value)))
+
     def find_matching_events_cluster(
         self, key, value, main_event, result_queue
     ):
@@ -504,17 +822,8 @@ class MainEventsBoard:
         main_event (str): The main event for which matches are sought.
         result_queue (Queue): A queue to store the results.
         """
-        best_match = None
-        for second_event in value:
-            events_list = [[main_event], [second_event]]
-            similarity = self.cluster_strings(events_list)
-            if len(similarity) == 1:
-                best_match = second_event
-                # modification by removing the external
-                # list object to speed up calculations
-                value.remove(best_match)
-        reuslt = (key, best_match)
-        result_queue.put(reuslt)
+        best_match = self.get_matcher("cluster").match(main_event, value)
+        result_queue.put((key, best_match))
 
     def find_matching_events_jaccard(
         self, key, value, main_event, result_queue
@@ -522,6 +831,12 @@ class MainEventsBoard:
         """
         Find matching events based on Jaccard similarity.
 
+        A candidate with the equal normalized name is returned without
+        scoring. Otherwise character sets are compared as bitmasks and
+        the whole list of candidates is scored in one vectorized call.
+        The best candidate must be similar as a whole and in both home
+        and away parts.
+
         Parameters:
         -----------
         key (str): The key of the event in the dictionary.
@@ -529,67 +844,270 @@ class MainEventsBoard:
         main_event (str): The main event for which matches are sought.
         result_queue (Queue): A queue to store the results.
         """
-        # test method with lower accuracy but higher speed of calc.
-        best_match = None
-        ratio = 0
-        for second_event in value:
-            try:
-                similarity = self.jaccard_similarity(main_event, second_event)
-                if similarity > 0.6:
-                    if similarity > ratio:
-                        parts1 = [
-                            part.strip() for part in main_event.split("-")
-                        ]
-                        parts2 = [
-                            part.strip() for part in second_event.split("-")
-                        ]
-                        home_similarity = self.jaccard_similarity(
-                            parts1[0], parts2[0]
-                        )
-                        away_similarity = self.jaccard_similarity(
-                            parts1[1], parts2[1]
+        best_match = self.get_matcher("jaccard").match(main_event, value)
+        result_queue.put((key, best_match))
+
+    def attach_to_cached_rows(
+        self, rows: List[Dict[str, str]], work_dict: Dict[str, List[str]]
+    ) -> None:
+        """
+        Attach new events to the cached rows which miss their bookmaker.
+
+        Parameters:
+        -----------
+        - rows (List[Dict[str, str]]): Cached rows mapping bookmakers to
+            event names, completed in place.
+        - work_dict (Dict[str, List[str]]): A dictionary of the new events,
+            the attached events are removed from it.
+        """
+        for bookmaker, events_names in work_dict.items():
+            representatives = {}
+            for idx, row in enumerate(rows):
+                if bookmaker not in row:
+                    representatives[next(iter(row.values()))] = idx
+            if not representatives or not events_names:
+                continue
+            candidates = tuple(representatives)
+            for event_name in list(events_names):
+                best_match = self.run_matching_pool(
+                    event_name, {bookmaker: candidates}
+                )[bookmaker]
+                if best_match is not None and best_match in representatives:
+                    rows[representatives.pop(best_match)][
+                        bookmaker
+                    ] = event_name
+                    events_names.remove(event_name)
+
+    def match_new_events(
+        self,
+        work_dict: Dict[str, List[str]],
+        leagues_dict: Dict[str, Dict[str, str]] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Match events anchoring them on the bookmaker with the highest
+        number of records.
+
+        A main event with a known league is compared only with the events
+        of the same league bucket, other events are compared with all
+        events of the same date.
+
+        Parameters:
+        -----------
+        - work_dict (Dict[str, List[str]]): A dictionary where keys are
+            bookmakers, and values are lists of event names.
+        - leagues_dict (Dict[str, Dict[str, str]], optional): League keys
+            of the events.
+
+        Returns:
+        --------
+        List[Dict[str, str]]: Rows mapping bookmakers to event names,
+        events matched with nothing are kept as single-event rows.
+        """
+        rows = []
+        main_bookmaker = self.highest_number_of_records(work_dict)
+        main_events_dict = work_dict[main_bookmaker]
+        other_events_dict = deepcopy(work_dict)
+        del other_events_dict[main_bookmaker]
+        leagues_dict = leagues_dict or {}
+        main_leagues = leagues_dict.get(main_bookmaker, {})
+        buckets = self.create_league_buckets(other_events_dict, leagues_dict)
+        matched = set()
+        for main_event in main_events_dict:
+            league = main_leagues.get(main_event)
+            matching_events_dict = self.run_matching_pool(
+                main_event,
+                {
+                    bookmaker: bucket.get(league, bucket[None])
+                    for bookmaker, bucket in buckets.items()
+                },
+            )
+            matching_events_dict[main_bookmaker] = main_event
+            rows.append(matching_events_dict)
+            matched.update(matching_events_dict.items())
+        for bookmaker, events_names in other_events_dict.items():
+            for event_name in events_names:
+                if (bookmaker, event_name) not in matched:
+                    rows.append({bookmaker: event_name})
+        return rows
+
+    def match_events_graph(
+        self,
+        work_dict: Dict[str, List[str]],
+        leagues_dict: Dict[str, Dict[str, str]] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Match events between every pair of bookmakers and merge
+        the matches into event clusters.
+
+        Events of the bookmaker with fewer records are matched with
+        the candidates of the other one. The matches are merged from
+        the most similar, and a match is skipped if it would put two
+        events of the same bookmaker into one cluster. Events missing at
+        the biggest bookmaker are matched too.
+
+        Parameters:
+        -----------
+        - work_dict (Dict[str, List[str]]): A dictionary where keys are
+            bookmakers, and values are lists of event names.
+        - leagues_dict (Dict[str, Dict[str, str]], optional): League keys
+            of the events.
+
+        Returns:
+        --------
+        List[Dict[str, str]]: Rows mapping bookmakers to event names,
+        events matched with nothing are kept as single-event rows.
+        """
+        leagues_dict = leagues_dict or {}
+        buckets = self.create_league_buckets(work_dict, leagues_dict)
+        events = UnionFind()
+        for bookmaker, events_names in work_dict.items():
+            for event_name in events_names:
+                events.add((bookmaker, event_name))
+
+        matches = []
+        bookmakers = sorted(work_dict, key=lambda key: len(work_dict[key]))
+        for idx, first in enumerate(bookmakers, start=1):
+            leagues = leagues_dict.get(first, {})
+            for second in bookmakers[idx:]:
+                bucket = buckets[second]
+                for event_name in work_dict[first]:
+                    best_match = self.matcher.match(
+                        event_name,
+                        bucket.get(leagues.get(event_name), bucket[None]),
+                    )
+                    if best_match is not None:
+                        matches.append(
+                            (
+                                self.jaccard_similarity(
+                                    event_name, best_match
+                                ),
+                                (first, event_name),
+                                (second, best_match),
+                            )
                         )
-                        if (home_similarity > 0.5) and (away_similarity > 0.5):
-                            best_match = second_event
-                            ratio = similarity
-            except:
-                best_match = None
+        matches.sort(key=lambda match: match[0], reverse=True)
+
+        members = {event: {event[0]} for event in events.parents}
+        for _, first, second in matches:
+            first_root, second_root = events.find(first), events.find(second)
+            if first_root == second_root or (
+                members[first_root] & members[second_root]
+            ):
+                continue
+            merged = members.pop(first_root) | members.pop(second_root)
+            members[events.union(first_root, second_root)] = merged
+        return [dict(group) for group in events.groups()]
+
+    def match_date(
+        self,
+        rows: List[Dict[str, str]],
+        work_dict: Dict[str, List[str]],
+        leagues_dict: Dict[str, Dict[str, str]],
+    ) -> List[Dict[str, str]]:
+        """
+        Match the new events of one date.
+
+        Parameters:
+        -----------
+        - rows (List[Dict[str, str]]): Rows of the date taken from
+            the matching cache.
+        - work_dict (Dict[str, List[str]]): A dictionary of the new events
+            of the date.
+        - leagues_dict (Dict[str, Dict[str, str]]): League keys of
+            the events.
 
-        # value.remove(best_match)
-        reuslt = (key, best_match)
-        result_queue.put(reuslt)
+        Returns:
+        --------
+        List[Dict[str, str]]: All rows of the date.
+        """
+        self.attach_to_cached_rows(rows, work_dict)
+        if self.matching_mode == "graph":
+            rows.extend(self.match_events_graph(work_dict, leagues_dict))
+        else:
+            rows.extend(self.match_new_events(work_dict, leagues_dict))
+        return rows
 
     def create_events_table(self) -> DataFrame:
         """
         Create an events table by clustering and matching events from
         different bookmakers.
 
+        Events matched in the previous cycle are taken from the matching
+        cache, only the new events go through the matching.
+
         Returns:
         --------
         DataFrame: A DataFrame containing matched events from different
         bookmakers.
         """
-        self.events_table = DataFrame(columns=self.get_cols_names())
-        dates_list = self.get_unique_dates()
-        for date in dates_list:
-            work_dict = self.create_provisor_dict(date)
-            main_bookmaker = self.highest_number_of_records(work_dict)
-            main_events_dict = work_dict[main_bookmaker]
-            other_events_dict = deepcopy(work_dict)
-            del other_events_dict[main_bookmaker]
-            for main_event in main_events_dict:
-                matching_events_dict = self.run_matching_pool(
-                    main_event, other_events_dict
-                )
-                matching_events_dict[main_bookmaker] = main_event
-                self.events_table = self.events_table._append(
-                    matching_events_dict, ignore_index=True
-                )
+        for matcher in self.matchers.values():
+            matcher.reset()
+        date_buckets = {}
+        for date in self.get_unique_dates():
+            rows, work_dict = self.matching_cache.split(
+                date, self.create_provisor_dict(date)
+            )
+            date_buckets[date] = (
+                rows,
+                work_dict,
+                self.create_leagues_dict(date),
+            )
+        matched_rows = {
+            date: self.match_date(*date_bucket)
+            for date, date_bucket in date_buckets.items()
+        }
+        self.matching_cache.update(matched_rows)
+        self.swapped_events = self.find_swapped_events(
+            [row for rows in matched_rows.values() for row in rows]
+        )
+
+        self.events_table = DataFrame(
+            [row for rows in matched_rows.values() for row in rows],
+            columns=self.get_cols_names(),
+        )
         mask = self.events_table.count(axis=1) == 1
         self.events_table = self.events_table[~mask]
         return self.events_table
 
 
+def date_key(event_date) -> str:
+    """
+    Convert the date of an event to the ISO format, parsers return
+    either date objects or ISO strings.
+
+    Parameters:
+    -----------
+    - event_date (date or str): The date of the event.
+
+    Returns:
+    --------
+    str: The date in the YYYY-MM-DD format, None for missing dates.
+    """
+    if event_date is None or event_date != event_date:
+        return None
+    if hasattr(event_date, "strftime"):
+        return event_date.strftime("%Y-%m-%d")
+    return str(event_date)
+
+
+def intern_name(name) -> str:
+    """
+    Intern the name of an event or a participant, so equal names of all
+    tables share one string object.
+
+    Parameters:
+    -----------
+    - name (str): The name of an event or a participant.
+
+    Returns:
+    --------
+    str: The interned name, other values are returned unchanged.
+    """
+    if isinstance(name, str):
+        return intern(name)
+    return name
+
+
 class Event:
     """
     Represents a sport betting event.
@@ -603,8 +1121,17 @@ class Event:
     def __init__(self, events_data) -> None:
         self.events_data: dict = events_data
 
+    SWAPPED_COLUMNS = {
+        "home_player": "away_player",
+        "away_player": "home_player",
+        "home_team_win": "away_team_win",
+        "away_team_win": "home_team_win",
+    }
+
     @classmethod
-    def create(cls, event_row: Series, events_dict) -> "Event":
+    def create(
+        cls, event_row: Series, events_dict, swapped_events: set = None
+    ) -> "Event":
         """
         Creates an instance of the Event class based on the provided event_row
         and events_dict.
@@ -615,6 +1142,9 @@ class Event:
         - event_row (pandas.Series): A row of data representing an event.
         - events_dict (dict): A dictionary containing data frames for different
             bookmakers.
+        - swapped_events (set, optional): Pairs of (bookmaker, event_name)
+            listed in reverse order, their home and away columns are
+            swapped.
 
         Returns:
         --------
@@ -622,10 +1152,15 @@ class Event:
             provided data.
         """
         events_data = {}
+        swapped_events = swapped_events or set()
         for key, value in event_row.to_dict().items():
             if isinstance(value, str):
                 data_frame = events_dict[key]
                 events_data[key] = data_frame.data.loc[
                     data_frame.data["event_name"] == value
                 ]
+                if (key, value) in swapped_events:
+                    events_data[key] = events_data[key].rename(
+                        columns=cls.SWAPPED_COLUMNS
+                    )
         return cls(events_data)
@@ -0,0 +1,1385 @@
+"""
+Module matching:
+
+Module containing tools used by MainEventsBoard to match events listed
+by different bookmakers.
+
+Classes:
+--------
+1. MatchingCache: Class keeping the events matched in the previous
+    cycle, so they do not have to be matched again.
+2. NameFeatures: Class holding the precomputed character sets of an event
+    name and of its home and away halves.
+3. CharsetEncoder: Class encoding character sets of names as integer
+    bitmasks.
+4. CharsetMatrix: Class holding the bitmasks of a whole list of candidate
+    events as NumPy arrays, scored in one vectorized call.
+5. NgramIndex: Inverted index of character trigrams blocking the
+    candidates before scoring.
+6. EventsMatcher: Base class of the matching strategies.
+7. ExactKeyMatcher, JaccardMatcher, IndexedJaccardMatcher,
+    SortedNeighbourhoodMatcher, TfidfMatcher, LshMatcher, ClusterMatcher:
+    Matching strategies selectable by name.
+8. AutoMatcher: Strategy choosing between JaccardMatcher and
+    IndexedJaccardMatcher by the number of candidates.
+9. UnionFind: Disjoint sets of events merged into event clusters.
+
+Functions:
+----------
+1. strip_accents: Replaces diacritic characters with their ASCII
+    counterparts.
+2. league_key: Maps the competition label of a bookmaker to a canonical
+    league key.
+3. phonetic_key: Builds the transliteration independent key of
+    a participant name.
+4. popcount: Counts the set bits of an integer bitmask.
+5. popcount_array: Counts the set bits of rows of a uint64 NumPy array.
+6. normalize_name: Normalizes the event name to the exact matching key.
+7. canonical_key: Builds the order independent key of the event name.
+8. char_ngrams: Gets the character n-grams of a text.
+9. cluster_strings: Clusters strings with AgglomerativeClustering of
+    TF-IDF vectors.
+10. create_matcher: Creates the matching strategy registered under
+    a name.
+"""
+
+import re
+import unicodedata
+import zlib
+from bisect import bisect_left
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.cluster import AgglomerativeClustering
+from utils.technical import Constant
+
+SPECIAL_CHARACTERS = str.maketrans(
+    {"ł": "l", "Ł": "L", "ø": "o", "Ø": "O", "đ": "d", "Đ": "D", "ß": "ss"}
+)
+
+
+def strip_accents(text: str) -> str:
+    """
+    Replace diacritic characters with their ASCII counterparts.
+
+    Parameters:
+    -----------
+    - text (str): The text to convert.
+
+    Returns:
+    --------
+    str: The text without diacritic characters.
+    """
+    decomposed = unicodedata.normalize(
+        "NFKD", text.translate(SPECIAL_CHARACTERS)
+    )
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+
+
+def league_key(competition: Optional[str]) -> Optional[str]:
+    """
+    Map the competition label of a bookmaker to a canonical league key.
+
+    Bookmakers spell the same league differently ("Polska - Ekstraklasa",
+    "Ekstraklasa, Polska"), so the key is made of the sorted, lower case
+    words of the label without diacritic characters.
+
+    Parameters:
+    -----------
+    - competition (str or None): The competition label.
+
+    Returns:
+    --------
+    str or None: The canonical league key, None if the label is missing.
+    """
+    if not isinstance(competition, str):
+        return None
+    words = re.findall(r"[a-z0-9]+", strip_accents(competition).lower())
+    return " ".join(sorted(set(words))) or None
+
+
+TRANSLITERATIONS = (
+    ("tsch", "c"),
+    ("sch", "s"),
+    ("tch", "c"),
+    ("dzh", "z"),
+    ("dj", "d"),
+    ("zh", "z"),
+    ("sz", "s"),
+    ("sh", "s"),
+    ("cz", "c"),
+    ("ch", "c"),
+    ("ts", "c"),
+    ("tz", "c"),
+    ("kh", "h"),
+    ("ph", "f"),
+    ("ck", "k"),
+    ("q", "k"),
+    ("x", "ks"),
+    ("w", "v"),
+    ("y", "i"),
+    ("j", "i"),
+    ("ou", "u"),
+)
+
+
+def phonetic_key(participant: str) -> str:
+    """
+    Build the transliteration independent key of the participant name.
+
+    Spellings of the same Slavic or Asian name used by different
+    bookmakers ("Schwartzman", "Szwarcman", "Švarcman") are reduced to
+    one form. The key is made of the sorted words of the name, initials
+    are skipped.
+
+    Parameters:
+    -----------
+    - participant (str): The name of the team or the player.
+
+    Returns:
+    --------
+    str: The phonetic key, empty if the name has only initials.
+    """
+    words = []
+    for word in re.findall(r"[a-z]+", strip_accents(participant).lower()):
+        for source, target in TRANSLITERATIONS:
+            word = word.replace(source, target)
+        word = re.sub(r"(.)\1+", r"\1", word)
+        if len(word) > 1:
+            words.append(word)
+    return " ".join(sorted(words))
+
+
+class MatchingCache:
+    """
+    Mapping of the events matched in the previous cycle to the rows they
+    were matched into.
+
+    Between two scans of the same sport most events are already matched,
+    so only the events which are new (or whose names changed) have to go
+    through the matching again.
+
+    Attributes:
+    -----------
+    - rows (dict): A dictionary mapping (bookmaker, event_name, event_date)
+        to the id of the matched row.
+    """
+
+    def __init__(self) -> None:
+        self.rows: Dict[Tuple[str, str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def split(
+        self, date: str, work_dict: Dict[str, List[str]]
+    ) -> Tuple[List[Dict[str, str]], Dict[str, List[str]]]:
+        """
+        Split events of the given date into the rows known from
+        the previous cycle and the events which have to be matched.
+
+        Parameters:
+        -----------
+        - date (str): The date of the events.
+        - work_dict (Dict[str, List[str]]): A dictionary where keys are
+            bookmakers, and values are lists of event names.
+
+        Returns:
+        --------
+        Tuple[List[Dict[str, str]], Dict[str, List[str]]]: Cached rows
+        (bookmaker to event name) and the provisional dictionary of
+        the events which are not cached.
+        """
+        cached_rows: Dict[int, Dict[str, str]] = {}
+        new_events: Dict[str, List[str]] = {}
+        for bookmaker, events_names in work_dict.items():
+            new_events[bookmaker] = []
+            for event_name in events_names:
+                row_id = self.rows.get((bookmaker, event_name, date))
+                if row_id is None:
+                    new_events[bookmaker].append(event_name)
+                else:
+                    cached_rows.setdefault(row_id, {})[bookmaker] = event_name
+        return list(cached_rows.values()), new_events
+
+    def update(self, matched_rows: Dict[str, List[Dict[str, str]]]) -> None:
+        """
+        Replace the cache with the rows matched in the current cycle.
+
+        Parameters:
+        -----------
+        - matched_rows (Dict[str, List[Dict[str, str]]]): A dictionary
+            where keys are dates, and values are lists of rows mapping
+            bookmakers to event names.
+        """
+        rows = {}
+        row_id = 0
+        for date, date_rows in matched_rows.items():
+            for row in date_rows:
+                for bookmaker, event_name in row.items():
+                    if event_name is not None:
+                        rows[(bookmaker, event_name, date)] = row_id
+                row_id += 1
+        self.rows = rows
+
+
+WORD_MASK = (1 << 64) - 1
+BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], np.uint8)
+
+
+def popcount(mask: int) -> int:
+    """
+    Count the set bits of an integer bitmask.
+
+    Parameters:
+    -----------
+    - mask (int): The bitmask.
+
+    Returns:
+    --------
+    int: The number of set bits.
+    """
+    return bin(mask).count("1")
+
+
+def popcount_array(words: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits of every row of a two dimensional uint64 array.
+
+    Parameters:
+    -----------
+    - words (np.ndarray): Array of shape (rows, words) and uint64 dtype.
+
+    Returns:
+    --------
+    np.ndarray: Number of set bits of every row.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    bytes_view = np.ascontiguousarray(words).view(np.uint8)
+    return (
+        BYTE_POPCOUNT[bytes_view]
+        .reshape(len(words), -1)
+        .sum(axis=1, dtype=np.int64)
+    )
+
+
+class NameFeatures:
+    """
+    Precomputed character sets of an event name.
+
+    Attributes:
+    -----------
+    - name (str): The event name.
+    - mask (int): Bitmask of the characters of the whole name.
+    - count (int): Number of distinct characters of the whole name.
+    - home_mask (int): Bitmask of the characters of the home part.
+    - home_count (int): Number of distinct characters of the home part.
+    - away_mask (int): Bitmask of the characters of the away part.
+    - away_count (int): Number of distinct characters of the away part.
+    - valid (bool): False if the name can not be split into the home
+        and away parts.
+    - phonetic_key (str): Phonetic keys of the home and away parts,
+        empty if any of them is missing.
+    """
+
+    __slots__ = (
+        "name",
+        "mask",
+        "count",
+        "home_mask",
+        "home_count",
+        "away_mask",
+        "away_count",
+        "valid",
+        "phonetic_key",
+    )
+
+    def __init__(self, name: str, encoder: "CharsetEncoder") -> None:
+        parts = [part.strip() for part in name.split("-")]
+        self.name = name
+        self.mask = encoder.encode(name)
+        self.count = popcount(self.mask)
+        self.valid = len(parts) > 1
+        self.home_mask = encoder.encode(parts[0])
+        self.home_count = popcount(self.home_mask)
+        self.away_mask = encoder.encode(parts[1]) if self.valid else 0
+        self.away_count = popcount(self.away_mask)
+        home_key = phonetic_key(parts[0])
+        away_key = phonetic_key(parts[1]) if self.valid else ""
+        self.phonetic_key = (
+            f"{home_key} - {away_key}" if home_key and away_key else ""
+        )
+
+
+class CharsetEncoder:
+    """
+    Encodes character sets of names as integer bitmasks.
+
+    Every character gets its own bit the first time it is seen, so the
+    Jaccard similarity of two names is computed with bitwise AND/OR and
+    popcount instead of building Python sets.
+
+    Attributes:
+    -----------
+    - alphabet (dict): A dictionary mapping characters to bit positions.
+    - features (dict): A dictionary mapping names to their NameFeatures.
+    """
+
+    def __init__(self) -> None:
+        self.alphabet: Dict[str, int] = {}
+        self.features: Dict[str, NameFeatures] = {}
+        self.lock = Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = Lock()
+
+    def encode(self, text: str) -> int:
+        """
+        Encode the character set of the text as a bitmask.
+
+        Parameters:
+        -----------
+        - text (str): The text to encode.
+
+        Returns:
+        --------
+        int: The bitmask of the characters of the text.
+        """
+        mask = 0
+        for char in set(text):
+            bit = self.alphabet.get(char)
+            if bit is None:
+                with self.lock:
+                    bit = self.alphabet.setdefault(char, len(self.alphabet))
+            mask |= 1 << bit
+        return mask
+
+    def get_features(self, name: str) -> NameFeatures:
+        """
+        Get the cached character sets of the event name.
+
+        Parameters:
+        -----------
+        - name (str): The event name.
+
+        Returns:
+        --------
+        NameFeatures: Character sets of the name and of its parts.
+        """
+        features = self.features.get(name)
+        if features is None:
+            features = self.features[name] = NameFeatures(name, self)
+        return features
+
+    def jaccard(self, first_mask: int, second_mask: int) -> float:
+        """
+        Calculate the Jaccard similarity of two character sets.
+
+        Parameters:
+        -----------
+        - first_mask (int): The first bitmask.
+        - second_mask (int): The second bitmask.
+
+        Returns:
+        --------
+        float: Jaccard similarity between the two sets.
+        """
+        union = popcount(first_mask | second_mask)
+        if union == 0:
+            return 0.0
+        return popcount(first_mask & second_mask) / union
+
+    def to_words(self, masks: List[int], width: int) -> np.ndarray:
+        """
+        Convert bitmasks into an array of 64 bit words.
+
+        Parameters:
+        -----------
+        - masks (List[int]): The bitmasks.
+        - width (int): The number of 64 bit words of every row.
+
+        Returns:
+        --------
+        np.ndarray: Array of shape (len(masks), width) and uint64 dtype.
+        """
+        words = np.zeros((len(masks), width), dtype=np.uint64)
+        for row, mask in enumerate(masks):
+            for column in range(width):
+                words[row, column] = (mask >> (64 * column)) & WORD_MASK
+        return words
+
+
+class CharsetMatrix:
+    """
+    Character sets of a list of candidate events stored as uint64 arrays.
+
+    Attributes:
+    -----------
+    - names (List[str]): The candidate event names.
+    - width (int): The number of 64 bit words of every row.
+    - masks, home_masks, away_masks (np.ndarray): Character sets of
+        the names and of their home and away parts.
+    - counts, home_counts, away_counts (np.ndarray): Sizes of the sets.
+    - valid (np.ndarray): False for the names without the home and away
+        parts.
+    """
+
+    def __init__(self, names: List[str], encoder: CharsetEncoder) -> None:
+        features = [encoder.get_features(name) for name in names]
+        self.names = names
+        self.encoder = encoder
+        self.width = max(1, (len(encoder.alphabet) + 63) // 64)
+        self.masks = encoder.to_words([f.mask for f in features], self.width)
+        self.home_masks = encoder.to_words(
+            [f.home_mask for f in features], self.width
+        )
+        self.away_masks = encoder.to_words(
+            [f.away_mask for f in features], self.width
+        )
+        self.counts = np.array([f.count for f in features], dtype=np.int64)
+        self.home_counts = np.array(
+            [f.home_count for f in features], dtype=np.int64
+        )
+        self.away_counts = np.array(
+            [f.away_count for f in features], dtype=np.int64
+        )
+        self.valid = np.array([f.valid for f in features], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def jaccard(
+        self, mask: int, count: int, words: np.ndarray, counts: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the Jaccard similarity of one character set with all
+        rows of the array.
+
+        Bits of the mask beyond the width of the array are not present in
+        any row, so they count only to the union.
+
+        Parameters:
+        -----------
+        - mask (int): The bitmask of the main name.
+        - count (int): The number of set bits of the mask.
+        - words (np.ndarray): The bitmasks of the candidates.
+        - counts (np.ndarray): The numbers of set bits of the candidates.
+
+        Returns:
+        --------
+        np.ndarray: Jaccard similarity of every candidate.
+        """
+        main_words = self.encoder.to_words([mask], self.width)
+        intersection = popcount_array(words & main_words)
+        union = counts + count - intersection
+        return np.divide(
+            intersection,
+            union,
+            out=np.zeros(len(union), dtype=np.float64),
+            where=union > 0,
+        )
+
+    def scores(
+        self, features: NameFeatures, rows: np.ndarray = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score all candidates against the main event in one vectorized call.
+
+        Parameters:
+        -----------
+        - features (NameFeatures): Character sets of the main event.
+        - rows (np.ndarray, optional): Indices of the candidates to score,
+            all candidates are scored by default.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Jaccard similarity of
+        the whole names, of the home parts and of the away parts.
+        """
+        if rows is None:
+            rows = slice(None)
+        return (
+            self.jaccard(
+                features.mask,
+                features.count,
+                self.masks[rows],
+                self.counts[rows],
+            ),
+            self.jaccard(
+                features.home_mask,
+                features.home_count,
+                self.home_masks[rows],
+                self.home_counts[rows],
+            ),
+            self.jaccard(
+                features.away_mask,
+                features.away_count,
+                self.away_masks[rows],
+                self.away_counts[rows],
+            ),
+        )
+
+    def best(
+        self, features: NameFeatures, rows: np.ndarray = None
+    ) -> Optional[str]:
+        """
+        Find the most similar candidate accepted by the double Jaccard
+        similarity.
+
+        The candidate must be similar to the main event as a whole and in
+        both home and away parts.
+
+        Parameters:
+        -----------
+        - features (NameFeatures): Character sets of the main event.
+        - rows (np.ndarray, optional): Indices of the candidates to score,
+            all candidates are scored by default.
+
+        Returns:
+        --------
+        str or None: The best candidate, None if no candidate is accepted.
+        """
+        if not features.valid:
+            return None
+        if rows is None:
+            rows = np.arange(len(self.names))
+        if len(rows) == 0:
+            return None
+        similarity, home_similarity, away_similarity = self.scores(
+            features, rows
+        )
+        accepted = (
+            self.valid[rows]
+            & (similarity > Constant.EVENT_SIMILARITY_THRESHOLD)
+            & (home_similarity > Constant.PLAYER_SIMILARITY_THRESHOLD)
+            & (away_similarity > Constant.PLAYER_SIMILARITY_THRESHOLD)
+        )
+        if not accepted.any():
+            return None
+        best = int(np.argmax(np.where(accepted, similarity, -1.0)))
+        return self.names[int(rows[best])]
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize_name(name: str) -> str:
+    """
+    Normalize the event name to the key compared by the exact matching.
+
+    Parameters:
+    -----------
+    - name (str): The event name.
+
+    Returns:
+    --------
+    str: Lower case ASCII words and separators of the name.
+    """
+    return " ".join(re.findall(r"[a-z0-9]+|-", strip_accents(name).lower()))
+
+
+@lru_cache(maxsize=1 << 16)
+def canonical_key(name: str) -> str:
+    """
+    Build the order independent key of the event name.
+
+    The key is made of the sorted words of both participants, so
+    the event listed in reverse order ("away - home") has the same key.
+
+    Parameters:
+    -----------
+    - name (str): The event name.
+
+    Returns:
+    --------
+    str: Sorted lower case ASCII words of the name.
+    """
+    return " ".join(sorted(re.findall(r"[a-z0-9]+", normalize_name(name))))
+
+
+def char_ngrams(text: str, size: int = 3) -> set:
+    """
+    Get the character n-grams of the text padded with spaces.
+
+    Parameters:
+    -----------
+    - text (str): The text.
+    - size (int): The length of the n-grams.
+
+    Returns:
+    --------
+    set: Distinct n-grams of the text.
+    """
+    padded = f" {text} "
+    return {
+        padded[start:end]
+        for start, end in enumerate(range(size, len(padded) + 1))
+    }
+
+
+def cluster_strings(string_list) -> Dict[int, List[int]]:
+    """
+    Cluster strings using hierarchical agglomerative clustering
+    based on TF-IDF vectors.
+
+    Parameters:
+    -----------
+    - string_list (List[Iterable[str]]): List of iterables, each containing
+        strings to be clustered.
+
+    Returns:
+    --------
+    Dict[int, List[int]]: A dictionary where keys are cluster labels
+    and values are lists of indices corresponding to the input lists.
+    """
+    vectorizer = TfidfVectorizer()
+    X = vectorizer.fit_transform([" ".join(lst) for lst in string_list])
+    clustering = AgglomerativeClustering(
+        n_clusters=None,
+        distance_threshold=Constant.CLUSTER_STRINGS_THRESHOLDS,
+        linkage="average",
+        metric="cosine",
+    )
+    labels = clustering.fit_predict(X.toarray())
+
+    clusters = {}
+    for idx, label in enumerate(labels):
+        if label not in clusters:
+            clusters[label] = []
+        clusters[label].append(idx)
+
+    return clusters
+
+
+class NgramIndex:
+    """
+    Inverted index of the character trigrams of candidate events, used to
+    block the candidates before they are scored.
+
+    N-grams present in more than `max_frequency` of the candidates (like
+    " fc") are not indexed, they do not tell the candidates apart.
+
+    Attributes:
+    -----------
+    - names (List[str]): The candidate event names.
+    - postings (dict): A dictionary mapping n-grams to the arrays of
+        indices of the candidates containing them.
+    """
+
+    def __init__(
+        self, names: List[str], size: int = 3, max_frequency: float = 0.1
+    ) -> None:
+        self.names = names
+        self.size = size
+        postings: Dict[str, List[int]] = {}
+        for idx, name in enumerate(names):
+            for gram in char_ngrams(normalize_name(name), size):
+                postings.setdefault(gram, []).append(idx)
+        limit = max(
+            Constant.NGRAM_INDEX_MIN_POSTINGS, max_frequency * len(names)
+        )
+        self.postings = {
+            gram: np.array(ids, dtype=np.int64)
+            for gram, ids in postings.items()
+            if len(ids) <= limit
+        }
+
+    def candidates(self, name: str, min_shared: int = 2) -> np.ndarray:
+        """
+        Find the candidates sharing indexed n-grams with the name.
+
+        Parameters:
+        -----------
+        - name (str): The main event name.
+        - min_shared (int): The minimal number of shared n-grams.
+
+        Returns:
+        --------
+        np.ndarray: Indices of the candidates.
+        """
+        postings = [
+            self.postings[gram]
+            for gram in char_ngrams(normalize_name(name), self.size)
+            if gram in self.postings
+        ]
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+        shared = np.bincount(
+            np.concatenate(postings), minlength=len(self.names)
+        )
+        return np.flatnonzero(shared >= min(min_shared, len(postings)))
+
+
+class EventsMatcher:
+    """
+    Base class of the strategies finding the event of a bookmaker which
+    matches the main event.
+
+    An index of every candidate list is built once and reused for all
+    main events compared with it, until the matcher is reset.
+
+    Attributes:
+    -----------
+    - charsets (CharsetEncoder): Encoder of the character sets of event
+        names, shared with the board.
+    - indexes (dict): Indexes of the candidate lists of the current
+        matching.
+    - key_indexes (dict): Dictionaries of the candidate lists of
+        the current matching by their normalized and canonical keys.
+    - key_buckets (dict): Candidates of the lists of the current
+        matching grouped by their phonetic keys.
+    """
+
+    name = None
+
+    def __init__(self, charsets: CharsetEncoder = None) -> None:
+        self.charsets = charsets if charsets is not None else CharsetEncoder()
+        self.indexes: dict = {}
+        self.key_indexes: dict = {}
+        self.key_buckets: dict = {}
+
+    def reset(self) -> None:
+        """
+        Drop the indexes built for the previous matching.
+        """
+        self.indexes = {}
+        self.key_indexes = {}
+        self.key_buckets = {}
+
+    @staticmethod
+    def get_cached(store: dict, candidates: Sequence[str], build):
+        """
+        Get the index of the candidate list from the store, build it if
+        the list is new or has changed.
+
+        Tuples of candidates, built once per bookmaker by the board, are
+        keyed by their identity in O(1); the store keeps them alive, so
+        their ids are not reused. Lists may change in place, so they are
+        keyed by the tuple of their candidates.
+
+        Parameters:
+        -----------
+        - store (dict): The store of indexes.
+        - candidates (Sequence[str]): The candidate events.
+        - build (callable): Function building the index of a list.
+
+        Returns:
+        --------
+        The index of the candidate list.
+        """
+        if isinstance(candidates, tuple):
+            cached = store.get(id(candidates))
+            if cached is None or cached[0] is not candidates:
+                cached = (candidates, build(list(candidates)))
+                store[id(candidates)] = cached
+            return cached[1]
+        key = tuple(candidates)
+        cached = store.get(key)
+        if cached is None:
+            cached = store[key] = build(list(key))
+        return cached
+
+    def get_index(self, candidates: List[str]):
+        """
+        Get the index of the candidate events, built on the first call.
+
+        Parameters:
+        -----------
+        - candidates (List[str]): The list of candidate events.
+
+        Returns:
+        --------
+        The index built by the `build_index` method.
+        """
+        return self.get_cached(self.indexes, candidates, self.build_index)
+
+    def get_key_index(
+        self, candidates: List[str], key=normalize_name
+    ) -> Dict[str, str]:
+        """
+        Get the dictionary mapping keys of the candidates to the first
+        candidate with the key.
+
+        Parameters:
+        -----------
+        - candidates (List[str]): The list of candidate events.
+        - key (callable): Function building the key of an event name,
+            normalize_name or canonical_key.
+
+        Returns:
+        --------
+        Dict[str, str]: Candidates by their keys.
+        """
+
+        def build(names: List[str]) -> Dict[str, str]:
+            index: Dict[str, str] = {}
+            for name in names:
+                index.setdefault(key(name), name)
+            return index
+
+        return self.get_cached(
+            self.key_indexes.setdefault(key, {}), candidates, build
+        )
+
+    def phonetic_key(self, name: str) -> str:
+        """
+        Get the phonetic key of the event name cached with its features.
+
+        Parameters:
+        -----------
+        - name (str): The event name.
+
+        Returns:
+        --------
+        str: Phonetic keys of the home and away participants.
+        """
+        return self.charsets.get_features(name).phonetic_key
+
+    def get_phonetic_buckets(
+        self, candidates: Sequence[str]
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Get the candidates grouped by the phonetic keys of both
+        participants.
+
+        Parameters:
+        -----------
+        - candidates (Sequence[str]): The candidate events.
+
+        Returns:
+        --------
+        Dict[str, Tuple[str, ...]]: Candidates by their phonetic keys.
+        """
+
+        def build(names: List[str]) -> Dict[str, Tuple[str, ...]]:
+            buckets: Dict[str, List[str]] = {}
+            for name in names:
+                key = self.phonetic_key(name)
+                if key:
+                    buckets.setdefault(key, []).append(name)
+            return {key: tuple(bucket) for key, bucket in buckets.items()}
+
+        return self.get_cached(self.key_buckets, candidates, build)
+
+    def lookup(self, main_event: str, candidates: List[str]) -> Optional[str]:
+        """
+        Look up in O(1) the candidate with the equal normalized name,
+        else score only the candidates with the equal phonetic keys of
+        both participants. The phonetic keys narrow the candidates but
+        do not accept them, the strategy still scores the bucket against
+        its thresholds.
+
+        Parameters:
+        -----------
+        - main_event (str): The main event for which matches are sought.
+        - candidates (List[str]): The list of events to match against.
+
+        Returns:
+        --------
+        str or None: The matching event, None if there is no match.
+        """
+        if not candidates:
+            return None
+        best_match = self.get_key_index(candidates).get(
+            normalize_name(main_event)
+        )
+        main_key = self.phonetic_key(main_event)
+        if best_match is None and main_key:
+            bucket = self.get_phonetic_buckets(candidates).get(main_key)
+            if bucket:
+                best_match = self.best_match(main_event, bucket)
+        return best_match
+
+    def match(self, main_event: str, candidates: List[str]) -> Optional[str]:
+        """
+        Find the candidate matching the main event.
+
+        The candidate with the equal normalized name is looked up in O(1)
+        and the candidates with the equal phonetic keys are scored first,
+        before the strategy scores all candidates.
+        Reversed listings fail the check of home and away parts, so
+        the candidate with the same canonical key is looked up when
+        the strategy finds nothing.
+
+        Parameters:
+        -----------
+        - main_event (str): The main event for which matches are sought.
+        - candidates (List[str]): The list of events to match against.
+
+        Returns:
+        --------
+        str or None: The matching event, None if there is no match.
+        """
+        if not candidates:
+            return None
+        best_match = self.lookup(main_event, candidates)
+        if best_match is None:
+            best_match = self.best_match(main_event, candidates)
+        if best_match is None:
+            best_match = self.get_key_index(candidates, canonical_key).get(
+                canonical_key(main_event)
+            )
+        return best_match
+
+    def build_index(self, candidates: List[str]):
+        """
+        Build the index of the candidate events.
+
+        Parameters:
+        -----------
+        - candidates (List[str]): The list of candidate events.
+        """
+        return candidates
+
+    def best_match(
+        self, main_event: str, candidates: List[str]
+    ) -> Optional[str]:
+        """
+        Find the candidate matching the main event.
+
+        Parameters:
+        -----------
+        - main_event (str): The main event for which matches are sought.
+        - candidates (List[str]): The list of events to match against.
+
+        Returns:
+        --------
+        str or None: The matching event, None if there is no match.
+        """
+        raise NotImplementedError
+
+
+class ExactKeyMatcher(EventsMatcher):
+    """
+    Matches only the events with equal normalized names.
+    """
+
+    name = "exact"
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        return self.get_key_index(candidates).get(normalize_name(main_event))
+
+
+class JaccardMatcher(EventsMatcher):
+    """
+    Scores all candidates with the double Jaccard similarity of character
+    sets. The cheapest strategy for short candidate lists.
+    """
+
+    name = "jaccard"
+
+    def build_index(self, candidates: List[str]) -> CharsetMatrix:
+        return CharsetMatrix(candidates, self.charsets)
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        return self.get_index(candidates).best(
+            self.charsets.get_features(main_event)
+        )
+
+
+class IndexedJaccardMatcher(JaccardMatcher):
+    """
+    Scores with the double Jaccard similarity only the candidates sharing
+    character trigrams with the main event.
+    """
+
+    name = "indexed_jaccard"
+
+    def build_index(
+        self, candidates: List[str]
+    ) -> Tuple[CharsetMatrix, NgramIndex]:
+        return (
+            CharsetMatrix(candidates, self.charsets),
+            NgramIndex(candidates),
+        )
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        matrix, ngrams = self.get_index(candidates)
+        return matrix.best(
+            self.charsets.get_features(main_event),
+            ngrams.candidates(main_event),
+        )
+
+
+class SortedNeighbourhoodMatcher(JaccardMatcher):
+    """
+    Scores with the double Jaccard similarity only the candidates whose
+    home or away participant is a neighbour of the participant of
+    the main event in the sorted list of participants keys.
+
+    Attributes:
+    -----------
+    - window (int): The number of neighbours taken from every sorted
+        list of keys.
+    """
+
+    name = "sorted_neighbourhood"
+
+    def __init__(
+        self,
+        charsets: CharsetEncoder = None,
+        window: int = Constant.SORTED_NEIGHBOURHOOD_WINDOW,
+    ) -> None:
+        super().__init__(charsets)
+        self.window = window
+
+    @staticmethod
+    def participants_keys(name: str) -> Tuple[str, str]:
+        """
+        Get the normalized names of the home and away participants.
+
+        Parameters:
+        -----------
+        - name (str): The event name.
+
+        Returns:
+        --------
+        Tuple[str, str]: The home and away keys, the away key is empty if
+        the name can not be split.
+        """
+        parts = name.split("-")
+        away = parts[1] if len(parts) > 1 else ""
+        return normalize_name(parts[0]), normalize_name(away)
+
+    def build_index(self, candidates: List[str]) -> tuple:
+        keys = [self.participants_keys(name) for name in candidates]
+        sorted_keys = []
+        for side in range(2):
+            order = sorted(range(len(keys)), key=lambda idx: keys[idx][side])
+            sorted_keys.append(
+                (
+                    [keys[idx][side] for idx in order],
+                    np.array(order, dtype=np.int64),
+                )
+            )
+        return CharsetMatrix(candidates, self.charsets), sorted_keys
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        matrix, sorted_keys = self.get_index(candidates)
+        rows = []
+        half = self.window // 2
+        for key, (side_keys, order) in zip(
+            self.participants_keys(main_event), sorted_keys
+        ):
+            position = bisect_left(side_keys, key)
+            start, end = max(0, position - half), position + half
+            rows.append(order[start:end])
+        return matrix.best(
+            self.charsets.get_features(main_event),
+            np.unique(np.concatenate(rows)),
+        )
+
+
+class TfidfMatcher(EventsMatcher):
+    """
+    Finds the candidate with the highest cosine similarity of TF-IDF
+    vectors of character n-grams. The home and away parts must pass
+    the Jaccard threshold of players names.
+    """
+
+    name = "tfidf"
+
+    def build_index(self, candidates: List[str]) -> tuple:
+        vectorizer = TfidfVectorizer(
+            analyzer="char_wb", ngram_range=(2, 3), preprocessor=normalize_name
+        )
+        return (
+            vectorizer,
+            vectorizer.fit_transform(candidates),
+            CharsetMatrix(candidates, self.charsets),
+        )
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        vectorizer, vectors, matrix = self.get_index(candidates)
+        features = self.charsets.get_features(main_event)
+        if not features.valid:
+            return None
+        similarity = (
+            (vectors @ vectorizer.transform([main_event]).T).toarray().ravel()
+        )
+        _, home_similarity, away_similarity = matrix.scores(features)
+        accepted = (
+            matrix.valid
+            & (similarity > Constant.TFIDF_SIMILARITY_THRESHOLD)
+            & (home_similarity > Constant.PLAYER_SIMILARITY_THRESHOLD)
+            & (away_similarity > Constant.PLAYER_SIMILARITY_THRESHOLD)
+        )
+        if not accepted.any():
+            return None
+        return matrix.names[int(np.argmax(np.where(accepted, similarity, -1)))]
+
+
+class LshMatcher(JaccardMatcher):
+    """
+    Finds the candidates with MinHash locality sensitive hashing of
+    character trigrams and scores them with the double Jaccard similarity.
+
+    Attributes:
+    -----------
+    - bands (int): The number of bands of the MinHash signature.
+    - rows (int): The number of hashes in a band.
+    """
+
+    name = "lsh"
+    PRIME = (1 << 31) - 1
+
+    def __init__(
+        self, charsets: CharsetEncoder = None, bands: int = 16, rows: int = 2
+    ) -> None:
+        super().__init__(charsets)
+        self.bands = bands
+        self.rows = rows
+        generator = np.random.default_rng(2023)
+        self.coefficients = generator.integers(
+            1, self.PRIME, size=(2, bands * rows), dtype=np.int64
+        )
+
+    def signature(self, name: str) -> np.ndarray:
+        """
+        Calculate the MinHash signature of the character trigrams.
+
+        Parameters:
+        -----------
+        - name (str): The event name.
+
+        Returns:
+        --------
+        np.ndarray: The signature of `bands * rows` hashes.
+        """
+        grams = char_ngrams(normalize_name(name))
+        hashes = np.array(
+            [zlib.crc32(gram.encode()) % self.PRIME for gram in grams],
+            dtype=np.int64,
+        )
+        values = (
+            self.coefficients[0][:, None] * hashes[None, :]
+            + self.coefficients[1][:, None]
+        ) % self.PRIME
+        return values.min(axis=1)
+
+    def band_keys(self, signature: np.ndarray) -> List[tuple]:
+        """
+        Split the signature into the keys of its bands.
+
+        Parameters:
+        -----------
+        - signature (np.ndarray): The MinHash signature.
+
+        Returns:
+        --------
+        List[tuple]: Keys of the buckets of the bands.
+        """
+        return [
+            (band, hashes.tobytes())
+            for band, hashes in enumerate(
+                signature.reshape(self.bands, self.rows)
+            )
+        ]
+
+    def build_index(self, candidates: List[str]) -> tuple:
+        buckets: Dict[tuple, List[int]] = {}
+        for idx, candidate in enumerate(candidates):
+            for key in self.band_keys(self.signature(candidate)):
+                buckets.setdefault(key, []).append(idx)
+        return CharsetMatrix(candidates, self.charsets), buckets
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        matrix, buckets = self.get_index(candidates)
+        rows = set()
+        for key in self.band_keys(self.signature(main_event)):
+            rows.update(buckets.get(key, ()))
+        return matrix.best(
+            self.charsets.get_features(main_event),
+            np.array(sorted(rows), dtype=np.int64),
+        )
+
+
+class ClusterMatcher(EventsMatcher):
+    """
+    Matches the events clustered together by the AgglomerativeClustering
+    of TF-IDF vectors. Fits a model for every pair of events, so it is
+    suitable only for very short candidate lists.
+    """
+
+    name = "cluster"
+
+    def best_match(self, main_event, candidates):
+        best_match = None
+        for candidate in candidates:
+            if len(cluster_strings([[main_event], [candidate]])) == 1:
+                best_match = candidate
+        return best_match
+
+
+class AutoMatcher(EventsMatcher):
+    """
+    Chooses the strategy by the number of candidates: short lists are
+    scored directly, longer lists go through the trigram index.
+
+    Attributes:
+    -----------
+    - small (EventsMatcher): The strategy of short candidate lists.
+    - large (EventsMatcher): The strategy of long candidate lists.
+    - limit (int): The biggest number of candidates of a short list.
+    """
+
+    name = "auto"
+
+    def __init__(
+        self,
+        charsets: CharsetEncoder = None,
+        limit: int = Constant.AUTO_MATCHER_LIMIT,
+    ) -> None:
+        super().__init__(charsets)
+        self.small = JaccardMatcher(self.charsets)
+        self.large = IndexedJaccardMatcher(self.charsets)
+        self.limit = limit
+
+    def reset(self) -> None:
+        super().reset()
+        self.small.reset()
+        self.large.reset()
+
+    def best_match(self, main_event, candidates):
+        if len(candidates) <= self.limit:
+            return self.small.best_match(main_event, candidates)
+        return self.large.best_match(main_event, candidates)
+
+
+class UnionFind:
+    """
+    Disjoint sets of items with path compression and union by size.
+
+    Attributes:
+    -----------
+    - parents (dict): A dictionary mapping items to their parents.
+    - sizes (dict): A dictionary mapping roots to the sizes of their sets.
+    """
+
+    def __init__(self) -> None:
+        self.parents: dict = {}
+        self.sizes: dict = {}
+
+    def add(self, item) -> None:
+        """
+        Add the item as a single-element set, if it is not known yet.
+
+        Parameters:
+        -----------
+        - item: A hashable item.
+        """
+        if item not in self.parents:
+            self.parents[item] = item
+            self.sizes[item] = 1
+
+    def find(self, item):
+        """
+        Find the root of the set containing the item.
+
+        Parameters:
+        -----------
+        - item: A hashable item added before.
+
+        Returns:
+        --------
+        The root item of the set.
+        """
+        root = item
+        while self.parents[root] != root:
+            root = self.parents[root]
+        while self.parents[item] != root:
+            self.parents[item], item = root, self.parents[item]
+        return root
+
+    def union(self, first, second):
+        """
+        Merge the sets containing the two items.
+
+        Parameters:
+        -----------
+        - first: A hashable item added before.
+        - second: A hashable item added before.
+
+        Returns:
+        --------
+        The root of the merged set.
+        """
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return first
+        if self.sizes[first] < self.sizes[second]:
+            first, second = second, first
+        self.parents[second] = first
+        self.sizes[first] += self.sizes.pop(second)
+        return first
+
+    def groups(self) -> List[list]:
+        """
+        Get all sets in the order the items were added.
+
+        Returns:
+        --------
+        List[list]: Items of every set.
+        """
+        groups: dict = {}
+        for item in self.parents:
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
+
+MATCHERS = {
+    matcher.name: matcher
+    for matcher in (
+        ExactKeyMatcher,
+        JaccardMatcher,
+        IndexedJaccardMatcher,
+        SortedNeighbourhoodMatcher,
+        TfidfMatcher,
+        LshMatcher,
+        ClusterMatcher,
+        AutoMatcher,
+    )
+}
+
+
+def create_matcher(
+    name: str = "auto", charsets: CharsetEncoder = None
+) -> EventsMatcher:
+    """
+    Create the matching strategy registered under the given name.
+
+    Parameters:
+    -----------
+    - name (str): The name of the strategy, one of the MATCHERS keys.
+    - charsets (CharsetEncoder, optional): Encoder shared with the board.
+
+    Returns:
+    --------
+    EventsMatcher: The matching strategy.
+    """
+    if name not in MATCHERS:
+        raise ValueError(
+            f"Unknown matcher {name!r}, expected one of {sorted(MATCHERS)}"
+        )
+    return MATCHERS[name](charsets)
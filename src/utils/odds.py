@@ -0,0 +1,246 @@
+"""
+Module odds:
+
+This module contains the long-format odds of matched events of all
+sports and bookmakers, used to pre-filter events before the arbitrage
+calculation.
+
+Classes:
+--------
+1. OddsStore: Keeps the odds of all sports as one long-format table with
+    categorical columns and screens events for arbitrage with vectorized
+    selections.
+
+Usage:
+------
+store = OddsStore()
+store.put_board("football", board)
+candidates = store.find_arbitrage("football")
+"""
+
+from datetime import datetime
+from typing import Dict
+from pandas import DataFrame, concat, to_numeric
+from utils.technical import Constant
+
+
+class OddsStore:
+    """
+    Long-format odds of matched events, used as a pre-filter of
+    the arbitrage calculation.
+
+    Every row keeps a single odds value of one outcome of one event
+    offered by one bookmaker, so events of all sports and markets share
+    the same columns. Repeated strings are kept as categories and the
+    odds as float32.
+
+    The store is built from a board after its events table is created
+    and it is an additional copy of the odds: the matching and
+    the arbitrage calculators still read the wide frames of the board,
+    the store only selects the events worth calculating.
+
+    Attributes:
+    -----------
+    - frames (dict): A dictionary mapping sports to their long-format
+        odds, replaced in every cycle of the sport.
+    """
+
+    OUTCOMES = {
+        "home_team_win": "home",
+        "draw": "draw",
+        "away_team_win": "away",
+    }
+    SWAPPED_OUTCOMES = {"home": "away", "draw": "draw", "away": "home"}
+    MARKETS = {2: "two_way", 3: "three_way"}
+    COLUMNS = [
+        "event_id",
+        "sport",
+        "bookmaker",
+        "event_name",
+        "market",
+        "outcome",
+        "odds",
+        "scraped_at",
+    ]
+    DTYPES = {
+        "event_id": "int32",
+        "sport": "category",
+        "bookmaker": "category",
+        "event_name": "category",
+        "market": "category",
+        "outcome": "category",
+        "odds": "float32",
+        "scraped_at": "datetime64[ns]",
+    }
+
+    def __init__(self) -> None:
+        self.frames: Dict[str, DataFrame] = {}
+
+    @property
+    def data(self) -> DataFrame:
+        """
+        Long-format odds of all sports.
+        """
+        if not self.frames:
+            return DataFrame(columns=self.COLUMNS).astype(self.DTYPES)
+        return concat(self.frames.values(), ignore_index=True).astype(
+            self.DTYPES
+        )
+
+    def put_board(
+        self, sport: str, board, scraped_at: datetime = None
+    ) -> DataFrame:
+        """
+        Replace the odds of the sport with the odds of the matched events
+        of the board. The board keeps its own tables, the store only
+        copies the odds it screens.
+
+        Parameters:
+        -----------
+        - sport (str): The name of the sport.
+        - board (MainEventsBoard): Board with the created events table.
+        - scraped_at (datetime, optional): Time of the scraping, now by
+            default.
+
+        Returns:
+        --------
+        DataFrame: Long-format odds of the sport. The event_id is the
+            position of the event in the events table of the board.
+        """
+        listings = (
+            board.events_table.reset_index(drop=True)
+            .melt(
+                ignore_index=False,
+                var_name="bookmaker",
+                value_name="event_name",
+            )
+            .dropna(subset=["event_name"])
+        )
+        listings["event_id"] = listings.index
+        odds = []
+        for bookmaker, table in board.events_dict.items():
+            data = table.data
+            outcomes = [column for column in self.OUTCOMES if column in data]
+            if data.empty or not outcomes:
+                continue
+            bookmaker_odds = data[["event_name", *outcomes]].melt(
+                id_vars="event_name", var_name="outcome", value_name="odds"
+            )
+            bookmaker_odds["bookmaker"] = bookmaker
+            bookmaker_odds["market"] = self.MARKETS[len(outcomes)]
+            odds.append(bookmaker_odds)
+        if not odds or listings.empty:
+            self.frames.pop(sport, None)
+            return DataFrame(columns=self.COLUMNS).astype(self.DTYPES)
+
+        frame = listings.merge(
+            concat(odds, ignore_index=True), on=["bookmaker", "event_name"]
+        ).drop_duplicates(["event_id", "bookmaker", "outcome"])
+        frame["odds"] = to_numeric(frame["odds"], errors="coerce")
+        frame = frame.dropna(subset=["odds"])
+        frame["outcome"] = frame["outcome"].map(self.OUTCOMES)
+        swapped = [
+            listing in board.swapped_events
+            for listing in zip(frame["bookmaker"], frame["event_name"])
+        ]
+        frame.loc[swapped, "outcome"] = frame.loc[swapped, "outcome"].map(
+            self.SWAPPED_OUTCOMES
+        )
+        frame["sport"] = sport
+        frame["scraped_at"] = scraped_at or datetime.now()
+        self.frames[sport] = frame[self.COLUMNS].astype(self.DTYPES)
+        return self.frames[sport]
+
+    def select(self, sport: str = None) -> DataFrame:
+        """
+        Get the odds of a single sport or of all sports.
+
+        Parameters:
+        -----------
+        - sport (str, optional): The name of the sport, all sports by
+            default.
+
+        Returns:
+        --------
+        DataFrame: Long-format odds.
+        """
+        if sport is None:
+            return self.data
+        if sport not in self.frames:
+            return DataFrame(columns=self.COLUMNS).astype(self.DTYPES)
+        return self.frames[sport]
+
+    def best_odds(self, sport: str = None) -> DataFrame:
+        """
+        Get the best odds of every outcome of every event together with
+        the bookmaker offering them.
+
+        Parameters:
+        -----------
+        - sport (str, optional): The name of the sport, all sports by
+            default.
+
+        Returns:
+        --------
+        DataFrame: One row per sport, event and outcome.
+        """
+        data = self.select(sport)
+        best = data.groupby(["sport", "event_id", "outcome"], observed=True)[
+            "odds"
+        ].idxmax()
+        return data.loc[best.to_numpy()].reset_index(drop=True)
+
+    def find_arbitrage(
+        self, sport: str = None, tax: float = Constant.TAX_VALUE
+    ) -> DataFrame:
+        """
+        Find events whose best odds of all outcomes give the sum of
+        implied probabilities below one.
+
+        It is a necessary condition of the arbitrage checked by the
+        calculators, so only the returned events have to be calculated.
+
+        Parameters:
+        -----------
+        - sport (str, optional): The name of the sport, all sports by
+            default.
+        - tax (float): The tax value included in implied probabilities.
+
+        Returns:
+        --------
+        DataFrame: Sport, event_id and implied probability of the events.
+        """
+        best = self.best_odds(sport)
+        # Float32 odds are rounded, the margin keeps the screening
+        # from dropping events exactly at the edge.
+        best["probability"] = (1 + tax) / best["odds"].astype("float64")
+        best["outcomes"] = (
+            best["market"]
+            .astype(str)
+            .map({market: size for size, market in self.MARKETS.items()})
+        )
+        events = best.groupby(["sport", "event_id"], observed=True).agg(
+            implied_probability=("probability", "sum"),
+            outcomes=("outcome", "size"),
+            market_outcomes=("outcomes", "max"),
+        )
+        events = events[
+            (events["outcomes"] == events["market_outcomes"])
+            & (events["implied_probability"] < 1 + 1e-6)
+        ]
+        return events[["implied_probability"]].reset_index()
+
+    def memory_usage(self) -> int:
+        """
+        Get the number of bytes used by the odds of all sports.
+
+        Returns:
+        --------
+        int: Memory usage of the store in bytes.
+        """
+        return int(
+            sum(
+                frame.memory_usage(deep=True).sum()
+                for frame in self.frames.values()
+            )
+        )
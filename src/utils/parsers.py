@@ -57,6 +57,24 @@ class Parser:
         """
         return float(odds_str.replace(",", "."))
 
+    @staticmethod
+    def parse_competition(competition_str):
+        """
+        Parse the name of the league or tournament.
+
+        Parameters:
+        -----------
+        - competition_str (str or None): The string representing
+            the competition.
+
+        Returns:
+        --------
+        str or None: The parsed competition name, None if it is missing.
+        """
+        if not competition_str or not competition_str.strip():
+            return None
+        return " ".join(competition_str.split())
+
 
 class FortunaParser(Parser):
     """
@@ -439,4 +457,107 @@ class ForbetParser(Parser):
         --------
         str: The parsed away team name.
         """
-        return event_name.split(" - ")[1].strip().upper()
\ No newline at end of file
+        return event_name.split(" - ")[1].strip().upper()
+
+
+class FeedParser(Parser):
+    """
+    A class providing static methods for parsing values of events read
+    from the JSON feeds of bookmakers.
+    """
+
+    @staticmethod
+    def parse_odds(odds_value):
+        """
+        Parse odds given as a number or a string.
+
+        Parameters:
+        -----------
+        - odds_value (float or str): The odds of the feed.
+
+        Returns:
+        --------
+        float: The parsed odds as a float.
+        """
+        return float(str(odds_value).replace(",", "."))
+
+    @staticmethod
+    def parse_home_win(odds_str):
+        return FeedParser.parse_odds(odds_str)
+
+    @staticmethod
+    def parse_draw(odds_str):
+        return FeedParser.parse_odds(odds_str)
+
+    @staticmethod
+    def parse_away_win(odds_str):
+        return FeedParser.parse_odds(odds_str)
+
+    @staticmethod
+    def parse_date(date_value):
+        """
+        Parse the event date from an ISO timestamp or a Unix timestamp
+        in seconds or milliseconds. Timestamps with a time zone are
+        converted to the local time.
+
+        Parameters:
+        -----------
+        - date_value (str or int): The date of the feed.
+
+        Returns:
+        --------
+        str: The parsed event date in the YYYY-MM-DD format.
+        """
+        if isinstance(date_value, (int, float)):
+            if date_value > 1e11:
+                date_value /= 1000
+            return datetime.fromtimestamp(date_value).strftime("%Y-%m-%d")
+        event_date = datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+        if event_date.tzinfo is not None:
+            event_date = event_date.astimezone()
+        return event_date.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def parse_event_name(*args):
+        """
+        Parse the event name from input arguments.
+
+        Parameters:
+        -----------
+        - *args (str): Names of the home and away participants.
+
+        Returns:
+        --------
+        str: The parsed event name.
+        """
+        return f"{args[0].strip()} - {args[1].strip()}"
+
+    @staticmethod
+    def parse_home_name(home_name):
+        """
+        Parse the home team name.
+
+        Parameters:
+        -----------
+        - home_name (str): The name of the home participant.
+
+        Returns:
+        --------
+        str: The parsed home team name.
+        """
+        return home_name.strip().upper()
+
+    @staticmethod
+    def parse_away_name(away_name):
+        """
+        Parse the away team name.
+
+        Parameters:
+        -----------
+        - away_name (str): The name of the away participant.
+
+        Returns:
+        --------
+        str: The parsed away team name.
+        """
+        return away_name.strip().upper()
@@ -12,14 +12,19 @@ Classes:
 Dictionaries:
 -------------
 1. ScrapersDict: A dictionary mapping bookmakers to their
-    corresponding scraper classes.
+    corresponding scraper classes of the selected backend.
 """
 
 from scrapers.betclic import BetclicTwoWayBets, BetclicThreeWayBets
 from scrapers.sts import STSTwoWayBets, STSThreeWayBets
 from scrapers.superbet import SuperbetTwoWayBets, SuperbetThreeWayBets
 from scrapers.fortuna import FortunaTwoWayBets, FortunaThreeWayBets
-from scrapers.forbet import ForbetTwoWayBets, ForbetThreeWayBets
+from scrapers.forbet import (
+    ForbetTwoWayBets,
+    ForbetThreeWayBets,
+    ForbetHttpTwoWayBets,
+    ForbetHttpThreeWayBets,
+)
 
 
 class EventsTypes:
@@ -29,6 +34,9 @@ class EventsTypes:
     Attributes:
     -----------
     sports (dict): A dictionary mapping sports to their bet types.
+    matching (dict): A dictionary mapping sports to the options of
+        MainEventsBoard matching their events: the name of the matching
+        strategy (see utils.matching) and the matching mode.
 
     Note:
     -----
@@ -52,6 +60,24 @@ class EventsTypes:
             "futsal": 3,
             "snooker": 2,
         }
+        self.matching = {
+            "football": {
+                "matcher": "indexed_jaccard",
+                "matching_mode": "graph",
+            },
+            "hokey": {"matcher": "auto", "matching_mode": "graph"},
+            "tennis": {"matcher": "auto", "matching_mode": "graph"},
+            "basketball": {"matcher": "auto", "matching_mode": "graph"},
+            "volleyball": {"matcher": "auto", "matching_mode": "graph"},
+            "handball": {"matcher": "auto", "matching_mode": "graph"},
+            "mma": {"matcher": "jaccard", "matching_mode": "graph"},
+            "boxing": {"matcher": "jaccard", "matching_mode": "graph"},
+            "baseball": {"matcher": "auto", "matching_mode": "graph"},
+            "rugby": {"matcher": "auto", "matching_mode": "graph"},
+            "table_tennis": {"matcher": "auto", "matching_mode": "graph"},
+            "futsal": {"matcher": "auto", "matching_mode": "graph"},
+            "snooker": {"matcher": "jaccard", "matching_mode": "graph"},
+        }
 
 
 class ScrapersDict:
@@ -61,8 +87,19 @@ class ScrapersDict:
 
     Attributes:
     -----------
+    browser_scrapers (dict): A dictionary mapping bookmaker classes to
+    lists of scraper classes driving Chrome.
+    http_scrapers (dict): A dictionary mapping bookmaker classes to
+    lists of browserless scraper classes, for bookmakers embedding
+    the offer in the webpage.
     scrapers (dict): A dictionary mapping bookmakers to lists of scraper
-    classes.
+    classes of the backend selected for every bookmaker.
+
+    Parameters:
+    -----------
+    backends (dict, optional): A dictionary mapping names of bookmaker
+    classes to "browser" or "http", overriding the backend attribute
+    of the bookmakers.
 
     Note:
     -----
@@ -70,14 +107,25 @@ class ScrapersDict:
     to retrieve scraper classes for specific bookmakers.
     """
 
-    def __init__(self) -> None:
-        self.scrapers = {
-            STS(): [STSTwoWayBets, STSThreeWayBets],
-            Fortuna(): [FortunaTwoWayBets, FortunaThreeWayBets],
-            Betclic(): [BetclicTwoWayBets, BetclicThreeWayBets],
-            Superbet(): [SuperbetTwoWayBets, SuperbetThreeWayBets],
-            Forbet(): [ForbetTwoWayBets, ForbetThreeWayBets],
+    def __init__(self, backends: dict = None) -> None:
+        self.browser_scrapers = {
+            STS: [STSTwoWayBets, STSThreeWayBets],
+            Fortuna: [FortunaTwoWayBets, FortunaThreeWayBets],
+            Betclic: [BetclicTwoWayBets, BetclicThreeWayBets],
+            Superbet: [SuperbetTwoWayBets, SuperbetThreeWayBets],
+            Forbet: [ForbetTwoWayBets, ForbetThreeWayBets],
+        }
+        self.http_scrapers = {
+            Forbet: [ForbetHttpTwoWayBets, ForbetHttpThreeWayBets],
         }
+        backends = backends or {}
+        self.scrapers = {}
+        for bookmaker, scrapers in self.browser_scrapers.items():
+            site = bookmaker()
+            backend = backends.get(bookmaker.__name__, site.backend)
+            if backend == "http":
+                scrapers = self.http_scrapers[bookmaker]
+            self.scrapers[site] = scrapers
 
 
 class STS:
@@ -88,6 +136,7 @@ class STS:
 
     def __init__(self) -> None:
         self.legal = True
+        self.backend = "browser"
         self.football = (
             "https://www.sts.pl/zaklady-bukmacherskie/pilka-nozna/184"
         )
@@ -123,6 +172,7 @@ class Fortuna:
 
     def __init__(self) -> None:
         self.legal = True
+        self.backend = "browser"
         self.football = (
             "https://www.efortuna.pl/zaklady-bukmacherskie/pilka-nozna"
         )
@@ -158,6 +208,7 @@ class Betclic:
 
     def __init__(self) -> None:
         self.legal = True
+        self.backend = "browser"
         self.football = "https://www.betclic.pl/pilka-nozna-s1"
         self.hokey = "https://www.betclic.pl/hokej-s13"
         self.tennis = "https://www.betclic.pl/tenis-s2"
@@ -181,6 +232,7 @@ class Superbet:
 
     def __init__(self) -> None:
         self.legal = True
+        self.backend = "browser"
         self.football = "https://superbet.pl/zaklady-bukmacherskie/pilka-nozna"
         self.hokey = (
             "https://superbet.pl/zaklady-bukmacherskie/hokej-na-lodzie"
@@ -207,11 +259,14 @@ class Superbet:
 class Forbet:
     """
     Class representing the Forbet bookmaker and its legal status, along with
-    URLs for different sports.
+    URLs for different sports. Forbet embeds its offer in the webpage, so
+    it may be scraped without a browser with the experimental "http"
+    backend, selected in ScrapersDict.
     """
 
     def __init__(self) -> None:
         self.legal = True
+        self.backend = "browser"
         self.football = "https://www.iforbet.pl/zaklady-bukmacherskie/1"
         self.hokey = "https://www.iforbet.pl/zaklady-bukmacherskie/4"
         self.tennis = "https://www.iforbet.pl/zaklady-bukmacherskie/5"
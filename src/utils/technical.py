@@ -75,6 +75,26 @@ class Constant:
     4. CLUSTER_STRINGS_THRESHOLD (float): The threshold value for
         string clustering in the application.  It is used in the
         `cluster_strings` method. Default is 0.001.
+    5. EVENT_SIMILARITY_THRESHOLD (float): The minimal Jaccard
+        similarity of the names of two matched events. Default is 0.6.
+    6. PLAYER_SIMILARITY_THRESHOLD (float): The minimal Jaccard
+        similarity of the home and away names of two matched events.
+        Default is 0.5.
+    7. TFIDF_SIMILARITY_THRESHOLD (float): The minimal cosine similarity
+        of TF-IDF vectors of two events matched by the `tfidf` matcher.
+        Default is 0.5.
+    8. AUTO_MATCHER_LIMIT (int): The biggest number of candidates scored
+        directly by the `auto` matcher, longer lists are blocked with
+        the trigram index. Default is 300.
+    9. NGRAM_INDEX_MIN_POSTINGS (int): Trigrams of at most this many
+        candidates are always indexed, regardless of their frequency.
+        Default is 20.
+    10. SORTED_NEIGHBOURHOOD_WINDOW (int): The number of neighbours
+        of the home and of the away participant scored by
+        the `sorted_neighbourhood` matcher. Default is 10.
+    11. ODDS_DECIMALS (int): The number of decimals the float32 odds of
+        the events tables are rounded to when they are cast to float64
+        for the arbitrage calculations. Default is 3.
 
     References:
     -----------
@@ -87,6 +107,13 @@ class Constant:
     TOTAL_MIN_RETURN = 0.00
     CLUSTER_STRINGS_THRESHOLDS = 0.001
     # https://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html
+    EVENT_SIMILARITY_THRESHOLD = 0.6
+    PLAYER_SIMILARITY_THRESHOLD = 0.5
+    TFIDF_SIMILARITY_THRESHOLD = 0.5
+    AUTO_MATCHER_LIMIT = 300
+    NGRAM_INDEX_MIN_POSTINGS = 20
+    SORTED_NEIGHBOURHOOD_WINDOW = 10
+    ODDS_DECIMALS = 3
 
 
 class Mailbox:
@@ -116,4 +143,4 @@ class Mailbox:
     """
     The email address list where emails will be sent.
     It is loaded from the environment variable "SEND_TO".
-    """
\ No newline at end of file
+    """
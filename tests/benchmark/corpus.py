@@ -0,0 +1,211 @@
+"""
+Module corpus:
+
+This module builds synthetic multi-bookmaker event corpora with known
+ground truth. The corpus is used to measure the quality and the speed of
+the event matching methods of MainEventsBoard.
+
+Classes:
+--------
+1. SyntheticCorpus: Generates events listed by several bookmakers with
+    perturbed spelling of participants names and keeps the mapping of
+    every listed event to the real (canonical) event.
+
+Usage:
+------
+corpus = SyntheticCorpus(events_per_bookmaker=100)
+board = corpus.create_board(matcher="auto")
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Set, Tuple
+from faker import Faker
+from utils.events import MainEventsBoard, TwoWayBetEvent, TwoWayBetEventsTable
+
+
+class SyntheticCorpus:
+    """
+    Synthetic corpus of two-way events listed by several bookmakers.
+
+    Every bookmaker lists `events_per_bookmaker` events drawn from one
+    pool of canonical events, so the same event is usually offered by
+    several bookmakers under slightly different names.
+
+    Attributes:
+    -----------
+    - events_per_bookmaker (int): Number of events listed by every
+        bookmaker.
+    - bookmakers (tuple): Names of the simulated bookmakers.
+    - days (int): Number of days the events are spread over.
+    - coverage (float): Probability that a canonical event is listed by
+        a single bookmaker.
+    - perturbation (float): Probability that a bookmaker spells the name
+        of a participant differently.
+    - tables (dict): Events tables of the bookmakers.
+    - ground_truth (dict): Mapping of (bookmaker, event_name) to the id
+        of the canonical event.
+    """
+
+    SUFFIXES = ["FC", "United", "City", "SK", "KS", "Sporting", "AC"]
+
+    def __init__(
+        self,
+        events_per_bookmaker: int,
+        bookmakers: tuple = ("STS", "FORTUNA", "BETCLIC", "SUPERBET"),
+        days: int = 7,
+        coverage: float = 0.8,
+        perturbation: float = 0.3,
+        seed: int = 2023,
+    ) -> None:
+        self.events_per_bookmaker = events_per_bookmaker
+        self.bookmakers = bookmakers
+        self.days = days
+        self.coverage = coverage
+        self.perturbation = perturbation
+        self.random = random.Random(seed)
+        self.fake = Faker("pl_PL")
+        try:
+            self.fake.seed_instance(seed)
+        except AttributeError:
+            self.fake.seed(seed)
+        self.tables: Dict[str, TwoWayBetEventsTable] = {}
+        self.ground_truth: Dict[Tuple[str, str], int] = {}
+        self.generate()
+
+    def create_participants(self, number: int) -> List[str]:
+        """
+        Create a list of unique participants names.
+
+        Parameters:
+        -----------
+        - number (int): Number of participants to create.
+
+        Returns:
+        --------
+        List[str]: Unique names of teams or players.
+        """
+        participants: Set[str] = set()
+        while len(participants) < number:
+            if self.random.random() < 0.5:
+                name = (
+                    f"{self.fake.city()} {self.random.choice(self.SUFFIXES)}"
+                )
+            else:
+                name = f"{self.fake.first_name()} {self.fake.last_name()}"
+            participants.add(name)
+        return sorted(participants)
+
+    def perturb(self, name: str) -> str:
+        """
+        Return a name spelled the way a different bookmaker might spell it.
+
+        Parameters:
+        -----------
+        - name (str): Canonical name of the participant.
+
+        Returns:
+        --------
+        str: Perturbed (or unchanged) name of the participant.
+        """
+        if self.random.random() >= self.perturbation or len(name) < 4:
+            return name
+        words = name.split(" ")
+        method = self.random.randrange(5)
+        if method == 0:
+            position = self.random.randrange(1, len(name) - 1)
+            end = position + 1
+            return name[:position] + name[end:]
+        if method == 1:
+            position = self.random.randrange(1, len(name) - 2)
+            end = position + 2
+            return (
+                name[:position]
+                + name[position + 1]
+                + name[position]
+                + name[end:]
+            )
+        if method == 2:
+            position = self.random.randrange(1, len(name) - 1)
+            return name[:position] + name[position] + name[position:]
+        if method == 3 and len(words) > 1:
+            return " ".join(words[:-1] + [f"{words[-1][0]}."])
+        if method == 4 and len(words) > 1:
+            return " ".join(words[1:] + words[:1])
+        return name.upper()
+
+    def generate(self) -> None:
+        """
+        Generate canonical events and the events tables of all bookmakers.
+        """
+        events_number = int(self.events_per_bookmaker / self.coverage) + 1
+        participants = self.create_participants(2 * events_number)
+        self.random.shuffle(participants)
+        first_day = date(2023, 10, 20)
+        canonical_events = [
+            (
+                participants[2 * idx],
+                participants[2 * idx + 1],
+                (first_day + timedelta(days=idx % self.days)).isoformat(),
+            )
+            for idx in range(events_number)
+        ]
+        for bookmaker in self.bookmakers:
+            table = TwoWayBetEventsTable(bookmaker)
+            listed = self.random.sample(
+                range(events_number), self.events_per_bookmaker
+            )
+            for event_id in sorted(listed):
+                home, away, event_date = canonical_events[event_id]
+                home, away = self.perturb(home), self.perturb(away)
+                event_name = f"{home} - {away}"
+                if (bookmaker, event_name) in self.ground_truth:
+                    continue
+                table.put(
+                    TwoWayBetEvent(
+                        event_name,
+                        home.upper(),
+                        away.upper(),
+                        event_date,
+                        round(self.random.uniform(1.05, 5.0), 2),
+                        round(self.random.uniform(1.05, 5.0), 2),
+                    )
+                )
+                self.ground_truth[(bookmaker, event_name)] = event_id
+            self.tables[bookmaker] = table
+
+    def create_board(self, **board_options) -> MainEventsBoard:
+        """
+        Create a board filled with the events tables of all bookmakers.
+
+        Parameters:
+        -----------
+        - board_options: Keyword arguments of MainEventsBoard, like
+            the matching strategy or the matching mode.
+
+        Returns:
+        --------
+        MainEventsBoard: Board ready for matching events.
+        """
+        board = MainEventsBoard(**board_options)
+        for table in self.tables.values():
+            board.put_data(table)
+        return board
+
+    def true_pairs(self) -> Set[frozenset]:
+        """
+        Get all pairs of listings which describe the same canonical event.
+
+        Returns:
+        --------
+        Set[frozenset]: Pairs of (bookmaker, event_name) tuples.
+        """
+        listings: Dict[int, list] = {}
+        for listing, event_id in self.ground_truth.items():
+            listings.setdefault(event_id, []).append(listing)
+        pairs = set()
+        for members in listings.values():
+            for idx, first in enumerate(members, start=1):
+                for second in members[idx:]:
+                    pairs.add(frozenset((first, second)))
+        return pairs
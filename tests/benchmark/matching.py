@@ -0,0 +1,187 @@
+"""
+Module matching:
+
+Benchmark harness measuring the quality and the speed of the event
+matching methods of MainEventsBoard on synthetic corpora.
+
+Classes:
+--------
+1. SingleJaccardMatcher: Matching strategy using only the Jaccard
+    similarity of whole events names.
+2. MatchingBenchmark: Runs the matching strategies on synthetic corpora
+    and reports precision, recall and wall time.
+
+Usage:
+------
+To run the whole benchmark use the following command from the root of
+the repository: python -m tests.benchmark.matching
+"""
+
+import argparse
+import time
+from typing import Dict, List, Set
+from pandas import DataFrame
+from utils.matching import JaccardMatcher
+from utils.technical import Constant
+from tests.benchmark.corpus import SyntheticCorpus
+
+
+class SingleJaccardMatcher(JaccardMatcher):
+    """
+    Matching strategy using the single Jaccard similarity algorithm.
+    """
+
+    name = "single_jaccard"
+
+    def best_match(self, main_event, candidates):
+        if not candidates:
+            return None
+        matrix = self.get_index(candidates)
+        similarity = matrix.scores(self.charsets.get_features(main_event))[0]
+        best = int(similarity.argmax())
+        if similarity[best] > Constant.EVENT_SIMILARITY_THRESHOLD:
+            return matrix.names[best]
+        return None
+
+
+class MatchingBenchmark:
+    """
+    Measures precision, recall and wall time of the matching methods.
+
+    Attributes:
+    -----------
+    - modes (dict): Mapping of the matching mode name to the options of
+        the board (the matching strategy may be given by its class).
+    - max_cluster_events (int): The biggest number of events per bookmaker
+        for which the clustering mode is run.
+    - results (list): Collected results of the benchmark.
+    """
+
+    MODES = {
+        "jaccard": {"matcher": SingleJaccardMatcher},
+        "double_jaccard": {"matcher": "jaccard"},
+        "indexed_jaccard": {"matcher": "indexed_jaccard"},
+        "sorted_neighbourhood": {"matcher": "sorted_neighbourhood"},
+        "auto": {"matcher": "auto"},
+        "graph": {"matcher": "auto", "matching_mode": "graph"},
+        "exact": {"matcher": "exact"},
+        "tfidf": {"matcher": "tfidf"},
+        "lsh": {"matcher": "lsh"},
+        "cluster": {"matcher": "cluster"},
+    }
+
+    def __init__(
+        self, modes: List[str] = None, max_cluster_events: int = 1000
+    ) -> None:
+        self.modes = {mode: self.MODES[mode] for mode in (modes or self.MODES)}
+        self.max_cluster_events = max_cluster_events
+        self.results: List[Dict] = []
+
+    @staticmethod
+    def predicted_pairs(events_table: DataFrame) -> Set[frozenset]:
+        """
+        Get all pairs of listings matched together in the events table.
+
+        Parameters:
+        -----------
+        - events_table (DataFrame): Events table created by the board.
+
+        Returns:
+        --------
+        Set[frozenset]: Pairs of (bookmaker, event_name) tuples.
+        """
+        pairs = set()
+        for row in events_table.to_dict("records"):
+            members = [
+                (bookmaker, name)
+                for bookmaker, name in row.items()
+                if isinstance(name, str)
+            ]
+            for idx, first in enumerate(members, start=1):
+                for second in members[idx:]:
+                    pairs.add(frozenset((first, second)))
+        return pairs
+
+    def run_mode(self, mode: str, corpus: SyntheticCorpus) -> Dict:
+        """
+        Run a single matching mode on the corpus.
+
+        Parameters:
+        -----------
+        - mode (str): Name of the matching mode.
+        - corpus (SyntheticCorpus): Corpus with known ground truth.
+
+        Returns:
+        --------
+        dict: Precision, recall and wall time of the matching.
+        """
+        board_options = dict(self.modes[mode])
+        if isinstance(board_options["matcher"], type):
+            board_options["matcher"] = board_options["matcher"]()
+        board = corpus.create_board(**board_options)
+        start = time.perf_counter()
+        events_table = board.create_events_table()
+        wall_time = time.perf_counter() - start
+
+        predicted = self.predicted_pairs(events_table)
+        expected = corpus.true_pairs()
+        true_positives = len(predicted & expected)
+        return {
+            "mode": mode,
+            "events": corpus.events_per_bookmaker,
+            "precision": true_positives / len(predicted) if predicted else 0,
+            "recall": true_positives / len(expected) if expected else 0,
+            "wall_time": wall_time,
+        }
+
+    def run(self, sizes: List[int]) -> DataFrame:
+        """
+        Run all matching modes for all corpus sizes.
+
+        Parameters:
+        -----------
+        - sizes (List[int]): Numbers of events per bookmaker.
+
+        Returns:
+        --------
+        DataFrame: Results of the benchmark.
+        """
+        for size in sizes:
+            corpus = SyntheticCorpus(events_per_bookmaker=size)
+            for mode in self.modes:
+                if mode == "cluster" and size > self.max_cluster_events:
+                    continue
+                self.results.append(self.run_mode(mode, corpus))
+        return DataFrame(self.results)
+
+
+def main():
+    """
+    Run the benchmark from the command line and print the results.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the event matching methods."
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[100, 1000, 10000]
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=list(MatchingBenchmark.MODES),
+        default=list(MatchingBenchmark.MODES),
+    )
+    parser.add_argument(
+        "--max-cluster-events",
+        type=int,
+        default=1000,
+        help="clustering fits a TF-IDF model for every pair of events, "
+        "bigger corpora take hours",
+    )
+    args = parser.parse_args()
+    benchmark = MatchingBenchmark(args.modes, args.max_cluster_events)
+    print(benchmark.run(args.sizes).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
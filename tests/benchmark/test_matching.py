@@ -0,0 +1,77 @@
+"""
+Module Test_Matching:
+
+This module contains smoke tests of the matching benchmark harness. They
+run the fast matching methods on a small synthetic corpus, so the harness
+stays usable while the matching methods evolve.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest tests/benchmark
+"""
+
+import pytest
+from tests.benchmark.corpus import SyntheticCorpus
+from tests.benchmark.matching import MatchingBenchmark
+
+
+class Test_SyntheticCorpus:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the SyntheticCorpus class.
+    """
+
+    @pytest.fixture
+    def corpus(self):
+        return SyntheticCorpus(events_per_bookmaker=50)
+
+    def test_every_bookmaker_lists_requested_number_of_events(self, corpus):
+        """
+        Test Case:
+        ----------
+        Every bookmaker table should contain the requested number of
+        events (duplicated names after perturbation are skipped).
+        """
+        for table in corpus.tables.values():
+            assert 45 <= len(table.data) <= 50
+
+    def test_ground_truth_covers_all_listings(self, corpus):
+        """
+        Test Case:
+        ----------
+        Every listed event should be mapped to its canonical event.
+        """
+        listings = sum(len(table.data) for table in corpus.tables.values())
+        assert len(corpus.ground_truth) == listings
+
+    def test_corpus_is_reproducible(self, corpus):
+        """
+        Test Case:
+        ----------
+        Two corpora created with the same seed should be equal.
+        """
+        assert SyntheticCorpus(50).ground_truth == corpus.ground_truth
+
+
+class Test_MatchingBenchmark:
+    """
+    Test Class:
+    ------------
+    This class contains smoke tests of the MatchingBenchmark class.
+    """
+
+    def test_run_reports_quality_and_time_of_fast_modes(self):
+        """
+        Test Case:
+        ----------
+        The benchmark should report precision, recall and wall time of
+        every requested mode, and double Jaccard should be precise.
+        """
+        results = MatchingBenchmark(["jaccard", "double_jaccard"]).run([50])
+        assert results["mode"].to_list() == ["jaccard", "double_jaccard"]
+        assert (results["wall_time"] > 0).all()
+        double_jaccard = results.set_index("mode").loc["double_jaccard"]
+        assert double_jaccard["precision"] > 0.9
+        assert double_jaccard["recall"] > 0.8
@@ -311,6 +311,36 @@ class Test_TwoWayArbitrageCalculator:
         result = calculator.create_combinations()
         assert len(result) == 16
 
+    def test_create_combinations_cast_float32_odds_to_exact_float64(self):
+        """
+        Test Case:
+        ----------
+        The float32 odds of the events tables should reach
+        the calculations as the exact float64 values of the odds.
+
+        1. Create an event with the float32 odds of two bookmakers.
+        2. Call the create_combinations method.
+        3. Check if the odds and the implied probability are exactly
+            the values calculated from the float64 odds.
+        """
+        event = Mock(spec=Event)
+        event.events_data = {
+            "STS": DataFrame(
+                {"home_team_win": [2.1], "away_team_win": [1.7]}
+            ).astype("float32"),
+            "BETCLIC": DataFrame(
+                {"home_team_win": [2.05], "away_team_win": [1.85]}
+            ).astype("float32"),
+        }
+        calculator = TwoWayArbitrageCalculator(event)
+        combination = calculator.create_combinations()[0]
+        home_win, away_win = calculator.get_values_from_dict(combination)
+        assert (home_win, away_win) == (2.1, 1.7)
+        assert (
+            calculator.calculate_implied_probability(home_win, away_win)
+            == (1 + Constant.TAX_VALUE) / 2.1 + (1 + Constant.TAX_VALUE) / 1.7
+        )
+
     def test_get_values_from_dict(self, event_mock):
         """
         Test Case:
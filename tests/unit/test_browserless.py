@@ -0,0 +1,166 @@
+"""
+Module Test_Browserless:
+
+This module contains unit tests for the browserless scrapers, which read
+the offer embedded in the webpage with a shared HTTP session, and for
+selecting the backend of a bookmaker.
+
+Classes:
+--------
+1. Test_HttpScraper: Unit tests for the HttpScraper class.
+2. Test_ScrapersDict: Unit tests for selecting the backends.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_browserless.py
+"""
+
+import json
+from queue import Queue
+from unittest.mock import Mock
+import pytest
+import requests
+from scrapers.browserless import HttpScraper, create_session
+from scrapers.forbet import (
+    ForbetHttpThreeWayBets,
+    ForbetHttpTwoWayBets,
+    ForbetThreeWayBets,
+)
+from utils.sports import Forbet, ScrapersDict
+
+
+def webpage(payload):
+    return (
+        "<html><body><div id='__next'></div>"
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(payload)}</script></body></html>"
+    )
+
+
+class Test_HttpScraper:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the HttpScraper class methods.
+    The shared session is replaced by a mock returning the webpage.
+    """
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        session = Mock()
+        monkeypatch.setattr(HttpScraper, "session", session)
+        return session
+
+    @pytest.fixture
+    def payload(self):
+        return {
+            "props": {
+                "pageProps": {
+                    "events": [
+                        {
+                            "eventName": "Legia - Lech",
+                            "eventStart": 1698166800000,
+                            "eventGames": [
+                                {
+                                    "gameName": "1X2",
+                                    "outcomes": [
+                                        {"outcomeOdds": 2.1},
+                                        {"outcomeOdds": 3.3},
+                                        {"outcomeOdds": 3.4},
+                                    ],
+                                }
+                            ],
+                        },
+                        {
+                            "eventName": "Hurkacz - Sinner",
+                            "eventStart": 1698166800000,
+                            "eventGames": [
+                                {
+                                    "gameName": "Zwycięzca meczu",
+                                    "outcomes": [
+                                        {"outcomeOdds": 2.2},
+                                        {"outcomeOdds": 1.7},
+                                    ],
+                                }
+                            ],
+                        },
+                    ]
+                }
+            }
+        }
+
+    def test_collect_puts_table_of_embedded_events(self, session, payload):
+        """
+        Test Case:
+        ----------
+        The events of the embedded offer having all odds of the table
+        should be put into the events table of the bookmaker.
+        """
+        session.get.return_value.text = webpage(payload)
+        result_queue = Queue()
+        ForbetHttpThreeWayBets.init_with(
+            "https://www.iforbet.pl/zaklady-bukmacherskie/1"
+        ).collect(result_queue)
+        table = result_queue.get_nowait()
+        assert table.bookmaker == "FORBET"
+        assert table.data["event_name"].tolist() == ["Legia - Lech"]
+        assert table.data["draw"].tolist() == pytest.approx([3.3])
+
+    def test_collect_logs_failed_requests(self, session):
+        """
+        Test Case:
+        ----------
+        A failed request should not put a table nor raise in the thread
+        of the scraper.
+        """
+        session.get.side_effect = requests.ConnectionError("refused")
+        result_queue = Queue()
+        ForbetHttpTwoWayBets.init_with(
+            "https://www.iforbet.pl/zaklady-bukmacherskie/5"
+        ).collect(result_queue)
+        assert result_queue.empty()
+
+    def test_session_keeps_a_pool_of_connections(self):
+        """
+        Test Case:
+        ----------
+        The session should reuse a pool of connections of the configured
+        size and send the headers of a browser.
+        """
+        session = create_session(pool_size=4)
+        adapter = session.get_adapter("https://www.iforbet.pl")
+        assert adapter._pool_maxsize == 4
+        assert "Mozilla" in session.headers["User-Agent"]
+
+
+class Test_ScrapersDict:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for selecting the backend of
+    the scrapers of every bookmaker.
+    """
+
+    def test_backend_of_bookmaker_selects_scrapers(self):
+        """
+        Test Case:
+        ----------
+        Forbet should be scraped with Chrome by default and without
+        a browser when the "http" backend is selected.
+        """
+        scrapers = {
+            type(site): value
+            for site, value in ScrapersDict().scrapers.items()
+        }
+        assert scrapers[Forbet][1] is ForbetThreeWayBets
+        scrapers = {
+            type(site): value
+            for site, value in ScrapersDict(
+                {"Forbet": "http"}
+            ).scrapers.items()
+        }
+        assert scrapers[Forbet] == [
+            ForbetHttpTwoWayBets,
+            ForbetHttpThreeWayBets,
+        ]
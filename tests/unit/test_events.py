@@ -1,7 +1,113 @@
 import os
+from datetime import date
+from unittest.mock import patch
 import pytest
 import pandas as pd
-from utils.events import MainEventsBoard
+from utils.events import (
+    Event,
+    MainEventsBoard,
+    ThreeWayBetEvent,
+    ThreeWayBetEventsTable,
+    TwoWayBetEvent,
+    TwoWayBetEventsTable,
+)
+from utils.matching import MatchingCache
+
+
+class Test_BetEvent:
+    def test_events_are_slotted_records(self):
+        event = ThreeWayBetEvent(
+            "Lens - PSV", "LENS", "PSV", "2023-10-24", 2.1, 3.4, 3.2
+        )
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.odds = 2.1
+
+    def test_from_columns_builds_events_in_constructor_order(self):
+        events = TwoWayBetEvent.from_columns(
+            {
+                "event_name": ["Lens - PSV", "Lech - Legia"],
+                "home_player": ["LENS", "LECH"],
+                "away_player": ["PSV", "LEGIA"],
+                "event_date": ["2023-10-24", "2023-10-25"],
+                "home_team_win": [1.5, 2.0],
+                "away_team_win": [2.5, 1.8],
+            }
+        )
+        assert [
+            (event.event_name, event.away_team_win, event.competition)
+            for event in events
+        ] == [("Lens - PSV", 2.5, None), ("Lech - Legia", 1.8, None)]
+        table = TwoWayBetEventsTable("STS")
+        for event in events:
+            table.put(event)
+        assert table.data["home_team_win"].to_list() == [1.5, 2.0]
+
+
+class Test_BetEventsTable:
+    def test_put_buffers_events_until_data_is_read(self):
+        table = ThreeWayBetEventsTable("STS")
+        table.put(
+            ThreeWayBetEvent(
+                "Lens - PSV", "LENS", "PSV", "2023-10-24", 2.1, 3.4, 3.2
+            )
+        )
+        assert len(table.buffer["event_name"]) == 1
+        record = table.data.iloc[0]
+        assert record[
+            ["event_name", "home_player", "away_player"]
+        ].to_list() == [
+            "Lens - PSV",
+            "LENS",
+            "PSV",
+        ]
+        assert record["event_date"] == "2023-10-24"
+        assert pd.isna(record["competition"])
+        assert record[
+            ["home_team_win", "draw", "away_team_win"]
+        ].to_list() == [
+            pytest.approx(2.1),
+            pytest.approx(3.4),
+            pytest.approx(3.2),
+        ]
+        assert table.buffer["event_name"] == []
+
+    def test_data_enforces_dtypes_of_columns(self):
+        table = TwoWayBetEventsTable("STS")
+        table.put(
+            TwoWayBetEvent(
+                "Lens - PSV", "LENS", "PSV", date(2023, 10, 24), "2.1", 1.7
+            )
+        )
+        table.put(
+            TwoWayBetEvent(
+                "Lech - Legia", "LECH", "LEGIA", "2023-10-24", 1.9, None
+            )
+        )
+        dtypes = table.data.dtypes.astype(str).to_dict()
+        assert dtypes["home_team_win"] == dtypes["away_team_win"] == "float32"
+        assert dtypes["event_date"] == dtypes["competition"] == "category"
+        assert dtypes["event_name"] == "object"
+        assert table.data["event_date"].to_list() == ["2023-10-24"] * 2
+        assert table.data["away_team_win"].isna().to_list() == [False, True]
+
+    def test_put_after_read_appends_to_materialized_data(self):
+        table = TwoWayBetEventsTable("STS")
+        assert table.data.columns.to_list()[-2:] == [
+            "home_team_win",
+            "away_team_win",
+        ]
+        for name in ["Lens - PSV", "Lech - Legia"]:
+            home, away = name.split(" - ")
+            table.put(TwoWayBetEvent(name, home, away, "2023-10-24", 1, 2))
+            assert table.data["event_name"].to_list()[-1] == name
+        assert table.data.index.to_list() == [0, 1]
+
+    def test_data_setter_replaces_events(self):
+        table = TwoWayBetEventsTable("STS")
+        table.put(TwoWayBetEvent("Lens - PSV", "A", "B", "2023-10-24", 1, 2))
+        table.data = table.data.iloc[0:0]
+        assert table.data.empty
 
 
 class Test_MainEventsBoard:
@@ -41,3 +147,227 @@ class Test_MainEventsBoard:
         assert len(obj.events_dict) == 1
         obj.put_data(sts_board)
         assert len(obj.events_dict) == 2
+
+    @pytest.fixture
+    def first_cycle_tables(self):
+        sts = TwoWayBetEventsTable("STS")
+        fortuna = TwoWayBetEventsTable("FORTUNA")
+        for table, names in [
+            (sts, ["Galatasaray - Bayern M.", "Lens - PSV Eindhoven"]),
+            (
+                fortuna,
+                ["Galatasaray - Bayern Monachium", "Lens - PSV Eindhoven"],
+            ),
+        ]:
+            for name in names:
+                home, away = name.split(" - ")
+                table.put(
+                    TwoWayBetEvent(name, home, away, "2023-10-24", 1.5, 2.5)
+                )
+        return sts, fortuna
+
+    def test_create_events_table_matches_only_new_events_in_next_cycle(
+        self, first_cycle_tables
+    ):
+        cache = MatchingCache()
+        first_board = MainEventsBoard(cache)
+        for table in first_cycle_tables:
+            first_board.put_data(table)
+        assert len(first_board.create_events_table()) == 2
+
+        sts, fortuna = first_cycle_tables
+        sts.put(
+            TwoWayBetEvent(
+                "Sevilla - Arsenal", "SEVILLA", "ARSENAL", "2023-10-24", 2, 2
+            )
+        )
+        fortuna.put(
+            TwoWayBetEvent(
+                "Sevilla - Arsenal FC",
+                "SEVILLA",
+                "ARSENAL",
+                "2023-10-24",
+                2,
+                2,
+            )
+        )
+        second_board = MainEventsBoard(cache)
+        for table in first_cycle_tables:
+            second_board.put_data(table)
+        with patch.object(
+            second_board,
+            "run_matching_pool",
+            wraps=second_board.run_matching_pool,
+        ) as matching_pool:
+            events_table = second_board.create_events_table()
+
+        assert matching_pool.call_count == 1
+        assert len(events_table) == 3
+        assert "Sevilla - Arsenal FC" in events_table["FORTUNA"].to_list()
+
+    def test_create_events_table_compares_events_within_league_bucket(self):
+        sts = TwoWayBetEventsTable("STS")
+        fortuna = TwoWayBetEventsTable("FORTUNA")
+        for table, name, competition in [
+            (sts, "Lech Poznan - Legia", "Polska - Ekstraklasa"),
+            (sts, "Lech II Poznan - Legia II", "Polska - III liga"),
+            (fortuna, "Lech Poznan II - Legia II", "III liga, Polska"),
+            (fortuna, "Lech Poznan - Legia W.", "Ekstraklasa Polska"),
+            (fortuna, "Wisla - Ruch", None),
+        ]:
+            home, away = name.split(" - ")
+            table.put(
+                TwoWayBetEvent(
+                    name, home, away, "2023-10-24", 1.5, 2.5, competition
+                )
+            )
+        board = MainEventsBoard()
+        board.put_data(sts)
+        board.put_data(fortuna)
+        buckets = board.create_league_buckets(
+            board.create_provisor_dict("2023-10-24"),
+            board.create_leagues_dict("2023-10-24"),
+        )
+        assert buckets["FORTUNA"]["iii liga polska"] == (
+            "Lech Poznan II - Legia II",
+            "Wisla - Ruch",
+        )
+
+        events_table = board.create_events_table()
+        assert events_table.set_index("STS")["FORTUNA"].to_dict() == {
+            "Lech Poznan - Legia": "Lech Poznan - Legia W.",
+            "Lech II Poznan - Legia II": "Lech Poznan II - Legia II",
+        }
+
+    @pytest.fixture
+    def graph_tables(self):
+        tables = {}
+        for bookmaker, names in [
+            (
+                "STS",
+                [
+                    "Galatasaray - Bayern M.",
+                    "Lens - PSV Eindhoven",
+                    "Wisla - Ruch",
+                ],
+            ),
+            (
+                "FORTUNA",
+                ["Galatasaray - Bayern Monachium", "Sevilla - Arsenal"],
+            ),
+            ("BETCLIC", ["Sevilla - Arsenal FC", "Galatasaray - Bayern"]),
+        ]:
+            tables[bookmaker] = TwoWayBetEventsTable(bookmaker)
+            for name in names:
+                home, away = name.split(" - ")
+                tables[bookmaker].put(
+                    TwoWayBetEvent(name, home, away, "2023-10-24", 1.5, 2.5)
+                )
+        return tables
+
+    def test_graph_mode_matches_events_missing_at_biggest_bookmaker(
+        self, graph_tables
+    ):
+        anchor_board = MainEventsBoard()
+        graph_board = MainEventsBoard(matching_mode="graph")
+        for table in graph_tables.values():
+            anchor_board.put_data(table)
+            graph_board.put_data(table)
+
+        anchor_table = anchor_board.create_events_table()
+        assert "Sevilla - Arsenal" not in anchor_table["FORTUNA"].to_list()
+
+        graph_table = graph_board.create_events_table()
+        rows = graph_table.set_index("FORTUNA").to_dict("index")
+        assert rows["Sevilla - Arsenal"]["BETCLIC"] == "Sevilla - Arsenal FC"
+        assert rows["Galatasaray - Bayern Monachium"] == {
+            "STS": "Galatasaray - Bayern M.",
+            "BETCLIC": "Galatasaray - Bayern",
+        }
+        assert len(graph_table) == 2
+
+    def test_graph_mode_keeps_one_event_of_bookmaker_in_cluster(self):
+        board = MainEventsBoard(matching_mode="graph")
+        rows = board.match_events_graph(
+            {
+                "STS": ["Lens - PSV Eindhoven"],
+                "FORTUNA": [
+                    "Lens - PSV Eindhoven",
+                    "Lens - PSV Eindhoven U19",
+                ],
+            }
+        )
+        assert {
+            "STS": "Lens - PSV Eindhoven",
+            "FORTUNA": "Lens - PSV Eindhoven",
+        } in rows
+        assert {"FORTUNA": "Lens - PSV Eindhoven U19"} in rows
+
+    def test_unknown_matching_mode_raises_value_error(self):
+        with pytest.raises(ValueError):
+            MainEventsBoard(matching_mode="pairs")
+
+    def test_reversed_listing_is_matched_and_its_odds_swapped(self):
+        sts = TwoWayBetEventsTable("STS")
+        fortuna = TwoWayBetEventsTable("FORTUNA")
+        sts.put(
+            TwoWayBetEvent(
+                "Iga Swiatek - Aryna Sabalenka",
+                "IGA SWIATEK",
+                "ARYNA SABALENKA",
+                "2023-10-24",
+                1.6,
+                2.4,
+            )
+        )
+        fortuna.put(
+            TwoWayBetEvent(
+                "Sabalenka Aryna - Świątek Iga",
+                "SABALENKA ARYNA",
+                "ŚWIĄTEK IGA",
+                "2023-10-24",
+                2.5,
+                1.55,
+            )
+        )
+        board = MainEventsBoard()
+        board.put_data(sts)
+        board.put_data(fortuna)
+        events_table = board.create_events_table()
+        assert events_table.to_dict("records") == [
+            {
+                "STS": "Iga Swiatek - Aryna Sabalenka",
+                "FORTUNA": "Sabalenka Aryna - Świątek Iga",
+            }
+        ]
+        assert board.swapped_events == {
+            ("FORTUNA", "Sabalenka Aryna - Świątek Iga")
+        }
+
+        event = Event.create(
+            events_table.iloc[0], board.events_dict, board.swapped_events
+        )
+        fortuna_odds = event.events_data["FORTUNA"].iloc[0]
+        assert fortuna_odds["home_team_win"] == 1.55
+        assert fortuna_odds["away_team_win"] == 2.5
+        assert fortuna_odds["home_player"] == "ŚWIĄTEK IGA"
+
+    def test_run_matching_pool_resolves_exact_names_without_threads(self):
+        board = MainEventsBoard()
+        with patch.object(
+            board,
+            "find_matching_events",
+            wraps=board.find_matching_events,
+        ) as find_matching_events:
+            matching_events_dict = board.run_matching_pool(
+                "Lens - PSV Eindhoven",
+                {
+                    "FORTUNA": ["LENS - PSV EINDHOVEN", "Wisla - Ruch"],
+                    "BETCLIC": ["Lens - PSV", "Wisla - Ruch"],
+                },
+            )
+        assert matching_events_dict == {
+            "FORTUNA": "LENS - PSV EINDHOVEN",
+            "BETCLIC": None,
+        }
+        assert find_matching_events.call_count == 1
@@ -0,0 +1,438 @@
+"""
+Module Test_Feeds:
+
+This module contains unit tests for the adapters of the JSON feeds of
+bookmakers and for reading the feeds captured by the scrapers.
+
+Classes:
+--------
+1. Test_SuperbetFeedAdapter: Unit tests for the SuperbetFeedAdapter class.
+2. Test_BetclicFeedAdapter: Unit tests for the BetclicFeedAdapter class.
+3. Test_ForbetFeedAdapter: Unit tests for the ForbetFeedAdapter class.
+4. Test_FeedCapture: Unit tests for reading the captured responses.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_feeds.py
+"""
+
+import json
+import time
+from unittest.mock import Mock
+import pytest
+from scrapers.base import BrowserProfile
+from scrapers.betclic import BetclicTwoWayBets
+from scrapers.feeds import (
+    BetclicFeedAdapter,
+    ForbetFeedAdapter,
+    SuperbetFeedAdapter,
+)
+from scrapers.superbet import SuperbetThreeWayBets
+from utils.events import TwoWayBetEvent
+from utils.parsers import FeedParser
+
+
+@pytest.fixture
+def superbet_payload():
+    return {
+        "data": [
+            {
+                "matchName": "Lens·PSV",
+                "matchDate": "2023-10-24T19:00:00",
+                "tournamentName": "Liga Mistrzów",
+                "odds": [
+                    {"marketId": 7, "marketName": "Gole", "price": 1.8},
+                    {"marketId": 7, "marketName": "Gole", "price": 1.9},
+                    {"marketId": 7, "marketName": "Gole", "price": 2.0},
+                    {
+                        "marketId": 1,
+                        "marketName": "Końcowy wynik",
+                        "price": 2.9,
+                    },
+                    {
+                        "marketId": 1,
+                        "marketName": "Końcowy wynik",
+                        "price": 3.4,
+                    },
+                    {
+                        "marketId": 1,
+                        "marketName": "Końcowy wynik",
+                        "price": 2.5,
+                    },
+                ],
+            },
+            {
+                "matchName": "Lech·Legia",
+                "odds": [
+                    {"marketId": 7, "marketName": "Gole", "price": 1.8},
+                    {"marketId": 7, "marketName": "Gole", "price": 1.9},
+                    {"marketId": 7, "marketName": "Gole", "price": 2.0},
+                ],
+            },
+            {"matchName": "Zwycięzca turnieju", "odds": []},
+        ]
+    }
+
+
+@pytest.fixture
+def betclic_payload():
+    return [
+        {
+            "contestants": [{"name": "Iga Swiatek"}, {"name": "Coco Gauff"}],
+            "date": "2023-10-24T12:00:00",
+            "competition": {"name": "WTA Finals"},
+            "grouped_markets": [
+                {
+                    "markets": [
+                        {
+                            "name": "Liczba gemów",
+                            "selections": [[{"odds": 1.9}], [{"odds": 1.9}]],
+                        }
+                    ]
+                },
+                {
+                    "markets": [
+                        {
+                            "name": "Zwycięzca meczu",
+                            "selections": [[{"odds": 1.35}], [{"odds": 3.2}]],
+                        }
+                    ]
+                },
+            ],
+        },
+        {
+            "contestants": [
+                {"name": "Jessica Pegula"},
+                {"name": "Qinwen Zheng"},
+            ],
+            "grouped_markets": [
+                {
+                    "markets": [
+                        {
+                            "name": "Liczba gemów",
+                            "selections": [[{"odds": 1.9}], [{"odds": 1.9}]],
+                        }
+                    ]
+                }
+            ],
+        },
+    ]
+
+
+@pytest.fixture
+def forbet_payload():
+    return {
+        "props": {
+            "pageProps": {
+                "offer": [
+                    {
+                        "category3Name": "Ekstraklasa",
+                        "events": [
+                            {
+                                "eventName": "Legia - Lech",
+                                "eventStart": 1698166800000,
+                                "category3Name": "Ekstraklasa",
+                                "eventGames": [
+                                    {
+                                        "gameName": "Podwójna szansa",
+                                        "outcomes": [
+                                            {"outcomeOdds": 1.3},
+                                            {"outcomeOdds": 1.2},
+                                            {"outcomeOdds": 1.7},
+                                        ],
+                                    },
+                                    {
+                                        "gameName": "1X2",
+                                        "outcomes": [
+                                            {"outcomeOdds": 2.1},
+                                            {"outcomeOdds": 3.3},
+                                            {"outcomeOdds": 3.4},
+                                        ],
+                                    },
+                                ],
+                            },
+                            {
+                                "eventName": "Wisła - Cracovia",
+                                "eventStart": 1698166800000,
+                                "eventGames": [
+                                    {
+                                        "gameName": "Podwójna szansa",
+                                        "outcomes": [
+                                            {"outcomeOdds": 1.3},
+                                            {"outcomeOdds": 1.2},
+                                            {"outcomeOdds": 1.7},
+                                        ],
+                                    }
+                                ],
+                            },
+                        ],
+                    }
+                ]
+            }
+        }
+    }
+
+
+def log_entry(method, params):
+    return {
+        "message": json.dumps(
+            {"message": {"method": method, "params": params}}
+        )
+    }
+
+
+def performance_log(url, request_id="1", finished=True):
+    entries = [
+        log_entry(
+            "Network.responseReceived",
+            {"requestId": request_id, "response": {"url": url}},
+        )
+    ]
+    if finished:
+        entries.append(
+            log_entry("Network.loadingFinished", {"requestId": request_id})
+        )
+    return entries
+
+
+def feed_scraper(scraper_class, *log_reads):
+    scraper = scraper_class.__new__(scraper_class)
+    scraper.driver = Mock()
+    scraper.driver.get_log.side_effect = list(log_reads) + [[]] * 100
+    scraper.driver.execute_script.return_value = 12
+    scraper.logging = Mock()
+    return scraper
+
+
+class Test_SuperbetFeedAdapter:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the SuperbetFeedAdapter class
+    methods.
+    """
+
+    def test_events_name_odds_of_the_main_market(self, superbet_payload):
+        """
+        Test Case:
+        ----------
+        Events should be split into participants and get the odds of
+        the match result market listed after other markets, events
+        without two participants or without the market should be skipped.
+        """
+        events = SuperbetFeedAdapter().events(superbet_payload)
+        assert events == [
+            {
+                "home_player": "Lens",
+                "away_player": "PSV",
+                "event_date": "2023-10-24T19:00:00",
+                "competition": "Liga Mistrzów",
+                "home_team_win": 2.9,
+                "draw": 3.4,
+                "away_team_win": 2.5,
+            }
+        ]
+
+    def test_matches_only_offer_responses(self):
+        """
+        Test Case:
+        ----------
+        Only the responses of the offer feed should be adapted.
+        """
+        adapter = SuperbetFeedAdapter()
+        assert adapter.matches(
+            "https://production-superbet-offer-pl.freetls.fastly.net"
+            "/sb-offer/api/v2/pl-PL/events/by-date"
+        )
+        assert not adapter.matches("https://superbet.pl/static/app.js")
+
+
+class Test_BetclicFeedAdapter:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the BetclicFeedAdapter class
+    methods.
+    """
+
+    def test_events_read_contestants_and_selections(self, betclic_payload):
+        """
+        Test Case:
+        ----------
+        Events should get the names of the contestants and the odds of
+        the selections of the match result market from any group of
+        markets, events without the market should be skipped.
+        """
+        events = BetclicFeedAdapter().events(betclic_payload)
+        assert events == [
+            {
+                "home_player": "Iga Swiatek",
+                "away_player": "Coco Gauff",
+                "event_date": "2023-10-24T12:00:00",
+                "competition": "WTA Finals",
+                "home_team_win": 1.35,
+                "away_team_win": 3.2,
+            }
+        ]
+
+    def test_events_become_rows_of_the_table(self, betclic_payload):
+        """
+        Test Case:
+        ----------
+        Adapted events should be parsed by the FeedParser like the values
+        read from the webpage.
+        """
+        event = TwoWayBetEvent.create_from_data(
+            BetclicFeedAdapter().events(betclic_payload)[0], FeedParser()
+        )
+        assert event.event_name == "Iga Swiatek - Coco Gauff"
+        assert event.home_player == "IGA SWIATEK"
+        assert event.event_date == "2023-10-24"
+        assert event.home_team_win == 1.35
+
+
+class Test_ForbetFeedAdapter:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the ForbetFeedAdapter class
+    methods.
+    """
+
+    def test_events_are_found_in_the_next_data(self, forbet_payload):
+        """
+        Test Case:
+        ----------
+        Events nested in the page properties should be found and get
+        the odds of their match result game, events without the game
+        should be skipped.
+        """
+        assert ForbetFeedAdapter().events(forbet_payload) == [
+            {
+                "home_player": "Legia",
+                "away_player": "Lech",
+                "event_date": 1698166800000,
+                "competition": "Ekstraklasa",
+                "home_team_win": 2.1,
+                "draw": 3.3,
+                "away_team_win": 3.4,
+            }
+        ]
+
+
+class Test_FeedCapture:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for reading the responses captured in
+    the performance log of a mocked driver.
+    """
+
+    def test_profile_enables_performance_log(self):
+        """
+        Test Case:
+        ----------
+        The capturing profile should ask the browser for the performance
+        log, the default profile should not.
+        """
+        capabilities = (
+            BrowserProfile(capture_network=True).options().to_capabilities()
+        )
+        assert capabilities["goog:loggingPrefs"] == {"performance": "ALL"}
+        assert "goog:loggingPrefs" not in (
+            BrowserProfile().options().to_capabilities()
+        )
+
+    def test_get_feed_events_reads_matching_responses(self, betclic_payload):
+        """
+        Test Case:
+        ----------
+        Bodies of the matching responses should be fetched and adapted,
+        other responses should not be fetched.
+        """
+        scraper = feed_scraper(
+            BetclicTwoWayBets,
+            performance_log("https://www.betclic.pl/static/app.js", "1")
+            + performance_log(
+                "https://offer.cdn.begmedia.com/api/events", "2"
+            ),
+        )
+        scraper.driver.execute_cdp_cmd.return_value = {
+            "body": json.dumps(betclic_payload)
+        }
+        events = scraper.get_feed_events(quiet=0)
+        assert [event["home_player"] for event in events] == ["Iga Swiatek"]
+        scraper.driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.getResponseBody", {"requestId": "2"}
+        )
+        scraper.logging.info.assert_called_with(
+            "Feed events: 1, rows on the webpage: 12"
+        )
+
+    def test_get_feed_events_waits_for_responses_to_finish_loading(
+        self, betclic_payload
+    ):
+        """
+        Test Case:
+        ----------
+        A response of the feed should be read only after it finished
+        loading, responses arriving in later reads of the log should be
+        read too.
+        """
+        url = "https://offer.cdn.begmedia.com/api/events"
+        first = performance_log(url, "1")
+        scraper = feed_scraper(
+            BetclicTwoWayBets,
+            first[:1],
+            [],
+            first[1:] + performance_log(url, "2", finished=False),
+            performance_log(url, "2")[1:],
+        )
+        scraper.driver.execute_cdp_cmd.return_value = {
+            "body": json.dumps(betclic_payload)
+        }
+        assert len(scraper.get_feed_events(quiet=0)) == 2
+        assert scraper.driver.get_log.call_count == 4
+        assert [
+            call.args[1]
+            for call in scraper.driver.execute_cdp_cmd.call_args_list
+        ] == [{"requestId": "1"}, {"requestId": "2"}]
+
+    def test_get_feed_events_skips_events_without_all_values(
+        self, superbet_payload
+    ):
+        """
+        Test Case:
+        ----------
+        Events of the feed missing odds required by the scraper should be
+        left out, so the scraper may fall back to the webpage.
+        """
+        for event in superbet_payload["data"]:
+            event["odds"] = event["odds"][:5]
+        scraper = feed_scraper(
+            SuperbetThreeWayBets,
+            performance_log("https://superbet-offer.pl/api/v2/events"),
+        )
+        scraper.driver.execute_cdp_cmd.return_value = {
+            "body": json.dumps(superbet_payload)
+        }
+        assert scraper.get_feed_events(quiet=0) == []
+
+    def test_get_feed_events_leaves_pages_without_the_feed(self):
+        """
+        Test Case:
+        ----------
+        A page whose responses do not match the feed, e.g. served from
+        the cache, should be left after the quiet period instead of
+        waiting for the timeout.
+        """
+        scraper = feed_scraper(
+            BetclicTwoWayBets,
+            performance_log("https://www.betclic.pl/static/app.js"),
+        )
+        start = time.monotonic()
+        assert scraper.get_feed_events(quiet=0.2, timeout=10) == []
+        assert time.monotonic() - start < 2
+        scraper.driver.execute_cdp_cmd.assert_not_called()
+        scraper.logging.warning.assert_not_called()
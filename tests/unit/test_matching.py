@@ -0,0 +1,483 @@
+"""
+Module Test_Matching:
+
+This module contains unit tests for the classes and functions defined in
+the matching module, which are used by MainEventsBoard to match events
+listed by different bookmakers.
+
+Classes:
+--------
+1. Test_MatchingCache: Unit tests for the MatchingCache class.
+2. Test_LeagueKey: Unit tests for the league_key function.
+3. Test_CharsetEncoder: Unit tests for the bitmask character sets.
+4. Test_EventsMatcher: Unit tests for the matching strategies.
+5. Test_UnionFind: Unit tests for the UnionFind class.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_matching.py
+"""
+
+import numpy as np
+import pytest
+from utils.matching import (
+    MATCHERS,
+    AutoMatcher,
+    CharsetEncoder,
+    CharsetMatrix,
+    MatchingCache,
+    NgramIndex,
+    SortedNeighbourhoodMatcher,
+    UnionFind,
+    canonical_key,
+    create_matcher,
+    league_key,
+    normalize_name,
+    phonetic_key,
+    popcount_array,
+)
+
+
+class Test_MatchingCache:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the MatchingCache class methods.
+    """
+
+    @pytest.fixture
+    def cache(self):
+        cache = MatchingCache()
+        cache.update(
+            {
+                "2023-10-24": [
+                    {"STS": "Lens - PSV", "FORTUNA": "Lens - PSV Eindhoven"},
+                    {"STS": "Sevilla - Arsenal", "FORTUNA": None},
+                ]
+            }
+        )
+        return cache
+
+    def test_update_maps_every_matched_event_to_its_row(self, cache):
+        """
+        Test Case:
+        ----------
+        Every not empty event of the matched rows should be cached with
+        the id of its row.
+        """
+        assert len(cache) == 3
+        assert (
+            cache.rows[("STS", "Lens - PSV", "2023-10-24")]
+            == cache.rows[("FORTUNA", "Lens - PSV Eindhoven", "2023-10-24")]
+        )
+
+    def test_split_returns_cached_rows_and_new_events(self, cache):
+        """
+        Test Case:
+        ----------
+        Cached events should be grouped into their rows, the rest should
+        be returned as events to match.
+        """
+        rows, new_events = cache.split(
+            "2023-10-24",
+            {
+                "STS": ["Lens - PSV", "Sevilla - Arsenal"],
+                "FORTUNA": ["Lens - PSV Eindhoven", "Sevilla - Arsenal FC"],
+            },
+        )
+        assert rows == [
+            {"STS": "Lens - PSV", "FORTUNA": "Lens - PSV Eindhoven"},
+            {"STS": "Sevilla - Arsenal"},
+        ]
+        assert new_events == {"STS": [], "FORTUNA": ["Sevilla - Arsenal FC"]}
+
+    def test_split_does_not_reuse_events_from_other_dates(self, cache):
+        """
+        Test Case:
+        ----------
+        The same event name listed on another date should be matched again.
+        """
+        rows, new_events = cache.split("2023-10-25", {"STS": ["Lens - PSV"]})
+        assert rows == []
+        assert new_events == {"STS": ["Lens - PSV"]}
+
+
+class Test_LeagueKey:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the league_key function.
+    """
+
+    def test_league_key_ignores_order_case_and_diacritics(self):
+        """
+        Test Case:
+        ----------
+        Labels of the same league spelled differently by bookmakers
+        should be mapped to the same key.
+        """
+        assert league_key("Polska - Ekstraklasa") == league_key(
+            "EKSTRAKLASA, POLSKA"
+        )
+        assert league_key("Łotwa. Virslīga") == "lotwa virsliga"
+
+    @pytest.mark.parametrize("competition", [None, "", " - ", float("nan")])
+    def test_league_key_returns_none_for_missing_label(self, competition):
+        """
+        Test Case:
+        ----------
+        Missing labels should not create a league bucket.
+        """
+        assert league_key(competition) is None
+
+
+class Test_CharsetEncoder:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the CharsetEncoder and CharsetMatrix
+    classes, which compute the Jaccard similarity with bitmasks.
+    """
+
+    @pytest.fixture
+    def names(self):
+        return [
+            "Galatasaray - Bayern M.",
+            "Galatasaray - Bayern Monachium",
+            "Łotwa - Armenia",
+            "Walkower",
+        ]
+
+    @staticmethod
+    def set_jaccard(first, second):
+        return len(set(first) & set(second)) / len(set(first) | set(second))
+
+    def test_jaccard_of_bitmasks_equals_jaccard_of_sets(self, names):
+        """
+        Test Case:
+        ----------
+        The bitmask representation should not change the similarity.
+        """
+        encoder = CharsetEncoder()
+        for first in names:
+            for second in names:
+                assert encoder.jaccard(
+                    encoder.encode(first), encoder.encode(second)
+                ) == pytest.approx(self.set_jaccard(first, second))
+
+    def test_matrix_scores_whole_names_and_their_parts(self, names):
+        """
+        Test Case:
+        ----------
+        The vectorized scores should equal the similarity of the whole
+        names and of their home and away parts, also for characters
+        encoded after the matrix was built.
+        """
+        encoder = CharsetEncoder()
+        matrix = CharsetMatrix(names, encoder)
+        main_event = "Galatasaray SK - Bayern Munchen"
+        similarity, home, away = matrix.scores(
+            encoder.get_features(main_event)
+        )
+        assert similarity == pytest.approx(
+            [self.set_jaccard(main_event, name) for name in names]
+        )
+        assert home[0] == pytest.approx(
+            self.set_jaccard("Galatasaray SK", "Galatasaray")
+        )
+        assert away[1] == pytest.approx(
+            self.set_jaccard("Bayern Munchen", "Bayern Monachium")
+        )
+        assert matrix.valid.tolist() == [True, True, True, False]
+
+    def test_popcount_array_without_bitwise_count(self, monkeypatch):
+        """
+        Test Case:
+        ----------
+        The lookup table fallback for NumPy older than 2.0 should count
+        the same bits as np.bitwise_count.
+        """
+        words = np.array([[0, 1], [2**64 - 1, 5]], dtype=np.uint64)
+        assert popcount_array(words).tolist() == [1, 66]
+        monkeypatch.delattr(np, "bitwise_count", raising=False)
+        assert popcount_array(words).tolist() == [1, 66]
+
+
+class Test_EventsMatcher:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the matching strategies and
+    the NgramIndex class.
+    """
+
+    @pytest.fixture
+    def candidates(self):
+        return [
+            "Lens - PSV Eindhoven",
+            "Galatasaray - Bayern Monachium",
+            "Sevilla - Arsenal Londyn",
+            "Łotwa - Armenia",
+        ]
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "jaccard",
+            "indexed_jaccard",
+            "sorted_neighbourhood",
+            "tfidf",
+            "lsh",
+            "auto",
+        ],
+    )
+    def test_fuzzy_matchers_find_differently_spelled_event(
+        self, name, candidates
+    ):
+        """
+        Test Case:
+        ----------
+        Every fuzzy strategy should match an event spelled differently by
+        another bookmaker and reject an event which is not listed.
+        """
+        matcher = create_matcher(name)
+        assert (
+            matcher.best_match("Galatasaray SK - Bayern Monachium", candidates)
+            == "Galatasaray - Bayern Monachium"
+        )
+        assert matcher.best_match("Wisła - Legia", candidates) is None
+        assert matcher.best_match("Lens - PSV", []) is None
+
+    def test_exact_matcher_compares_normalized_names(self, candidates):
+        """
+        Test Case:
+        ----------
+        The exact strategy should ignore case, punctuation and diacritics,
+        but nothing more.
+        """
+        matcher = create_matcher("exact")
+        assert matcher.best_match("LOTWA - ARMENIA", candidates) == (
+            "Łotwa - Armenia"
+        )
+        assert matcher.best_match("Lens - PSV", candidates) is None
+        assert normalize_name("Bayern M. - PSV") == "bayern m - psv"
+
+    @pytest.mark.parametrize("name", ["exact", "jaccard", "auto"])
+    def test_match_finds_event_listed_in_reverse_order(self, name, candidates):
+        """
+        Test Case:
+        ----------
+        A reversed listing fails the check of home and away parts, it
+        should be found by its canonical key.
+        """
+        matcher = create_matcher(name)
+        assert matcher.best_match("Armenia - Lotwa", candidates) is None
+        assert matcher.match("Armenia - Lotwa", candidates) == (
+            "Łotwa - Armenia"
+        )
+        assert canonical_key("Armenia - Łotwa") == "armenia lotwa"
+
+    def test_match_returns_equal_normalized_name_without_scoring(
+        self, candidates, monkeypatch
+    ):
+        """
+        Test Case:
+        ----------
+        A candidate with the equal normalized name should be returned
+        before the strategy scores the candidates.
+        """
+        matcher = create_matcher("jaccard")
+
+        def fail(*args):
+            raise AssertionError("candidates should not be scored")
+
+        monkeypatch.setattr(matcher, "best_match", fail)
+        assert matcher.match("LENS - PSV EINDHOVEN", candidates) == (
+            "Lens - PSV Eindhoven"
+        )
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ("Schwartzman", "Szwarcman"),
+            ("Novak Djokovic", "Đoković Novak"),
+            ("Zhang Shuai", "Zang Szuaj"),
+            ("Tsitsipas S.", "Cicipas"),
+        ],
+    )
+    def test_phonetic_key_ignores_transliteration(self, first, second):
+        """
+        Test Case:
+        ----------
+        Different transliterations of the same name, in any order of
+        words and with or without initials, should have the same key.
+        """
+        assert phonetic_key(first) == phonetic_key(second)
+
+    def test_lookup_scores_only_candidates_with_equal_phonetic_keys(
+        self, monkeypatch
+    ):
+        """
+        Test Case:
+        ----------
+        The lookup should score only the candidates with the equal
+        phonetic keys and accept a transliteration passing the Jaccard
+        thresholds.
+        """
+        matcher = create_matcher("jaccard")
+        candidates = ["Szwarcman D. - Djokovic N.", "Lens - PSV"]
+        scored = []
+        best_match = matcher.best_match
+
+        def record(main_event, bucket):
+            scored.append(list(bucket))
+            return best_match(main_event, bucket)
+
+        monkeypatch.setattr(matcher, "best_match", record)
+        assert matcher.lookup("Schwartzman D. - Djokovic N.", candidates) == (
+            candidates[0]
+        )
+        assert scored == [[candidates[0]]]
+
+    def test_lookup_rejects_equal_phonetic_keys_failing_thresholds(self):
+        """
+        Test Case:
+        ----------
+        Equal phonetic keys should only narrow the candidates, a candidate
+        failing the Jaccard thresholds should not be matched.
+        """
+        matcher = create_matcher("jaccard")
+        candidates = ["Szuaj Zang - Ksu Jifan", "Lens - PSV"]
+        main_event = "Zhang Shuai - Xu Yifan"
+        assert matcher.charsets.get_features(main_event).phonetic_key == (
+            matcher.phonetic_key(candidates[0])
+        )
+        assert matcher.lookup(main_event, candidates) is None
+        assert matcher.match(main_event, candidates) is None
+
+    def test_index_is_built_once_per_candidate_list(self, candidates):
+        """
+        Test Case:
+        ----------
+        The index of a candidate list should be reused until the list
+        changes, also in place with the same length, or the matcher is
+        reset.
+        """
+        matcher = create_matcher("jaccard")
+        index = matcher.get_index(candidates)
+        assert matcher.get_index(candidates) is index
+        candidates.append("Wisła - Legia")
+        assert matcher.get_index(candidates) is not index
+        index = matcher.get_index(candidates)
+        candidates[0] = "Lech - Górnik"
+        assert matcher.get_index(candidates) is not index
+        assert matcher.get_index(list(candidates)) is matcher.get_index(
+            candidates
+        )
+        matcher.reset()
+        assert matcher.indexes == {}
+
+    def test_index_of_candidate_tuple_is_found_by_identity(self, candidates):
+        """
+        Test Case:
+        ----------
+        The index of a tuple of candidates should be found by the identity
+        of the tuple, without hashing the candidates on every call.
+        """
+        matcher = create_matcher("jaccard")
+        bucket = tuple(candidates)
+        index = matcher.get_index(bucket)
+        assert matcher.get_index(bucket) is index
+        assert list(matcher.indexes) == [id(bucket)]
+        assert matcher.get_index(tuple(candidates)) is not index
+
+    def test_auto_matcher_chooses_strategy_by_candidates_number(
+        self, candidates
+    ):
+        """
+        Test Case:
+        ----------
+        Short candidate lists should be scored directly, longer lists
+        should go through the trigram index.
+        """
+        matcher = AutoMatcher(limit=3)
+        matcher.best_match("Lens - PSV", candidates[:3])
+        assert matcher.small.indexes and not matcher.large.indexes
+        matcher.best_match("Lens - PSV", candidates)
+        assert matcher.large.indexes
+
+    def test_sorted_neighbourhood_scores_only_window_of_candidates(self):
+        """
+        Test Case:
+        ----------
+        Candidates far from both participants in the sorted keys should
+        not be scored, even if they are similar.
+        """
+        names = [f"Team{idx:02} - Rival{idx:02}" for idx in range(50)]
+        matcher = SortedNeighbourhoodMatcher(window=4)
+        assert matcher.best_match("Team25 - Rival25", names) == (
+            "Team25 - Rival25"
+        )
+        assert matcher.best_match("Zeam25 - Zival25", names) is None
+        assert create_matcher("jaccard").best_match(
+            "Zeam25 - Zival25", names
+        ) == ("Team25 - Rival25")
+
+    def test_ngram_index_skips_frequent_trigrams(self):
+        """
+        Test Case:
+        ----------
+        Trigrams shared by most candidates should not be indexed.
+        """
+        names = [f"Team{idx} FC - Rival{idx} FC" for idx in range(100)]
+        index = NgramIndex(names, max_frequency=0.1)
+        assert " fc" not in index.postings
+        blocked = index.candidates("Team7 FC - Rival7 FC").tolist()
+        assert 7 in blocked and len(blocked) < 20
+
+    def test_unknown_matcher_raises_value_error(self):
+        """
+        Test Case:
+        ----------
+        Creating a strategy which is not registered should fail.
+        """
+        assert "auto" in MATCHERS
+        with pytest.raises(ValueError):
+            create_matcher("levenshtein")
+
+
+class Test_UnionFind:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the UnionFind class.
+    """
+
+    def test_union_merges_sets_transitively(self):
+        """
+        Test Case:
+        ----------
+        Items merged through a shared item should end in one set, other
+        items should stay in their own sets.
+        """
+        events = UnionFind()
+        for item in "abcd":
+            events.add(item)
+        events.union("a", "b")
+        events.union("c", "b")
+        assert events.find("a") == events.find("c")
+        assert events.groups() == [["a", "b", "c"], ["d"]]
+
+    def test_add_does_not_reset_known_item(self):
+        """
+        Test Case:
+        ----------
+        Adding an item again should not split its set.
+        """
+        events = UnionFind()
+        events.add("a")
+        events.add("b")
+        events.union("a", "b")
+        events.add("b")
+        assert len(events.groups()) == 1
@@ -0,0 +1,199 @@
+"""
+Module Test_Odds:
+
+This module contains unit tests for the OddsStore class defined in the
+odds module, which keeps the odds of matched events of all sports in
+one long-format table.
+
+Classes:
+--------
+1. Test_OddsStore: Unit tests for the OddsStore class.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_odds.py
+"""
+
+import pytest
+from application.arbitrage import Arbitrage
+from utils.events import (
+    MainEventsBoard,
+    ThreeWayBetEvent,
+    ThreeWayBetEventsTable,
+    TwoWayBetEvent,
+    TwoWayBetEventsTable,
+)
+from utils.odds import OddsStore
+
+
+class Test_OddsStore:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the OddsStore class methods.
+    """
+
+    @pytest.fixture
+    def tennis_board(self):
+        sts = TwoWayBetEventsTable("STS")
+        fortuna = TwoWayBetEventsTable("FORTUNA")
+        sts.put(
+            TwoWayBetEvent(
+                "Iga Swiatek - Aryna Sabalenka",
+                "IGA SWIATEK",
+                "ARYNA SABALENKA",
+                "2023-10-24",
+                1.6,
+                2.4,
+            )
+        )
+        sts.put(
+            TwoWayBetEvent(
+                "Hubert Hurkacz - Jannik Sinner",
+                "HUBERT HURKACZ",
+                "JANNIK SINNER",
+                "2023-10-24",
+                2.2,
+                1.7,
+            )
+        )
+        fortuna.put(
+            TwoWayBetEvent(
+                "Sabalenka Aryna - Świątek Iga",
+                "SABALENKA ARYNA",
+                "ŚWIĄTEK IGA",
+                "2023-10-24",
+                1.45,
+                3.3,
+            )
+        )
+        fortuna.put(
+            TwoWayBetEvent(
+                "Hurkacz Hubert - Sinner Jannik",
+                "HURKACZ HUBERT",
+                "SINNER JANNIK",
+                "2023-10-24",
+                2.1,
+                1.75,
+            )
+        )
+        board = MainEventsBoard()
+        board.put_data(sts)
+        board.put_data(fortuna)
+        board.create_events_table()
+        return board
+
+    @pytest.fixture
+    def football_board(self):
+        sts = ThreeWayBetEventsTable("STS")
+        fortuna = ThreeWayBetEventsTable("FORTUNA")
+        sts.put(
+            ThreeWayBetEvent(
+                "Lens - PSV", "LENS", "PSV", "2023-10-24", 3.1, None, 2.9
+            )
+        )
+        fortuna.put(
+            ThreeWayBetEvent(
+                "Lens - PSV", "LENS", "PSV", "2023-10-24", 2.9, None, 3.2
+            )
+        )
+        board = MainEventsBoard()
+        board.put_data(sts)
+        board.put_data(fortuna)
+        board.create_events_table()
+        return board
+
+    def test_put_board_stores_one_row_per_outcome_and_bookmaker(
+        self, tennis_board
+    ):
+        """
+        Test Case:
+        ----------
+        Every odds value of the matched events should be stored as its own
+        row with categorical strings and float32 odds.
+        """
+        store = OddsStore()
+        frame = store.put_board("tennis", tennis_board)
+        assert len(frame) == 8
+        assert set(frame["event_id"]) == {0, 1}
+        assert str(frame["odds"].dtype) == "float32"
+        for column in ["sport", "bookmaker", "market", "outcome"]:
+            assert str(frame[column].dtype) == "category"
+
+    def test_put_board_swaps_outcomes_of_reversed_listings(self, tennis_board):
+        """
+        Test Case:
+        ----------
+        The home odds of a listing with reversed participants should be
+        stored as the away odds of the event.
+        """
+        store = OddsStore()
+        frame = store.put_board("tennis", tennis_board)
+        fortuna = frame[
+            frame["event_name"] == "Sabalenka Aryna - Świątek Iga"
+        ].set_index("outcome")["odds"]
+        assert fortuna["home"] == pytest.approx(3.3)
+        assert fortuna["away"] == pytest.approx(1.45)
+
+    def test_best_odds_keeps_the_bookmaker_of_every_outcome(
+        self, tennis_board
+    ):
+        """
+        Test Case:
+        ----------
+        The best odds of every outcome should come with the bookmaker
+        which offers them.
+        """
+        store = OddsStore()
+        store.put_board("tennis", tennis_board)
+        best = store.best_odds("tennis")
+        swiatek = best[best["event_id"] == 0].set_index("outcome")
+        assert swiatek.loc["home", "bookmaker"] == "FORTUNA"
+        assert swiatek.loc["away", "bookmaker"] == "STS"
+
+    def test_find_arbitrage_selects_events_across_sports(
+        self, tennis_board, football_board
+    ):
+        """
+        Test Case:
+        ----------
+        Only events whose best odds of all outcomes give the implied
+        probability below one should be selected, events missing the odds
+        of an outcome should be skipped.
+        """
+        store = OddsStore()
+        store.put_board("tennis", tennis_board)
+        store.put_board("football", football_board)
+        candidates = store.find_arbitrage(tax=0.0)
+        assert candidates[["sport", "event_id"]].values.tolist() == [
+            ["tennis", 0]
+        ]
+        assert set(store.data["sport"].cat.categories) == {
+            "tennis",
+            "football",
+        }
+
+    def test_arbitrage_calculates_only_selected_events(self, tennis_board):
+        """
+        Test Case:
+        ----------
+        Arbitrage reading the store should return the same opportunities
+        as the calculation of all events.
+        """
+        store = OddsStore()
+        store.put_board("tennis", tennis_board)
+        all_events = [
+            opportunity
+            for opportunity in Arbitrage(tennis_board).calculate_arbitage()
+            if opportunity
+        ]
+        selected = [
+            opportunity
+            for opportunity in Arbitrage(
+                tennis_board, store, "tennis"
+            ).calculate_arbitage()
+            if opportunity
+        ]
+        assert selected == all_events
+        assert len(store.find_arbitrage("tennis")) == len(selected)
@@ -0,0 +1,101 @@
+"""
+Module Test_Operators:
+
+This module contains unit tests for the DataOperator class defined in
+the operators module, which scans the sports of the market.
+
+Classes:
+--------
+1. Test_DataOperator: Unit tests for the DataOperator class.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_operators.py
+"""
+
+import time
+from threading import Lock
+import pytest
+from application import operators
+from application.operators import DataOperator
+from utils.sports import EventsTypes
+
+
+class FakeDisciplineOperator:
+    """
+    A DisciplineOperator recording how many sports are scanned at once.
+    """
+
+    running = 0
+    peak = 0
+    options = {}
+    lock = Lock()
+
+    def __init__(self, sport, bet_type, matching_cache, options, *args):
+        self.sport = sport
+        FakeDisciplineOperator.options[sport] = options
+
+    def scan_market(self, events_tables=None):
+        with self.lock:
+            FakeDisciplineOperator.running += 1
+            FakeDisciplineOperator.peak = max(
+                FakeDisciplineOperator.peak, FakeDisciplineOperator.running
+            )
+        time.sleep(0.02)
+        with self.lock:
+            FakeDisciplineOperator.running -= 1
+        if self.sport == "snooker":
+            raise RuntimeError("no events")
+        return {self.sport: []}
+
+
+class Test_DataOperator:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the DataOperator class methods.
+    Scanning of a sport is replaced by a fake operator.
+    """
+
+    @pytest.fixture(autouse=True)
+    def fake_operator(self, monkeypatch):
+        FakeDisciplineOperator.running = 0
+        FakeDisciplineOperator.peak = 0
+        FakeDisciplineOperator.options = {}
+        monkeypatch.setattr(
+            operators, "DisciplineOperator", FakeDisciplineOperator
+        )
+
+    def test_sports_are_scanned_in_parallel_within_budget(self):
+        """
+        Test Case:
+        ----------
+        No more sports than max_sports should be scanned at once and
+        the results of all scanned sports should keep their shape.
+        """
+        data_operator = DataOperator(orchestrated=False, max_sports=3)
+        data_operator.get_data()
+        assert FakeDisciplineOperator.peak == 3
+        sports = set(EventsTypes().sports) - {"snooker"}
+        assert {
+            next(iter(result)) for result in data_operator.results
+        } == sports
+        assert all(
+            result == {next(iter(result)): []}
+            for result in data_operator.results
+        )
+
+    def test_serial_scanning_keeps_matching_options(self):
+        """
+        Test Case:
+        ----------
+        Scanning one sport at a time should pass the matching options of
+        the sports unchanged.
+        """
+        DataOperator(orchestrated=False, max_sports=1).get_data()
+        assert FakeDisciplineOperator.peak == 1
+        assert (
+            FakeDisciplineOperator.options["tennis"]
+            == EventsTypes().matching["tennis"]
+        )
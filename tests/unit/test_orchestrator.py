@@ -0,0 +1,173 @@
+"""
+Module Test_Orchestrator:
+
+This module contains unit tests for the ScrapeOrchestrator class, which
+runs the scrapers of all sports and bookmakers at once.
+
+Classes:
+--------
+1. Test_ScrapeOrchestrator: Unit tests for the ScrapeOrchestrator class.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_orchestrator.py
+"""
+
+import time
+from threading import Lock
+from unittest.mock import Mock
+import pytest
+from application.orchestrator import ScrapeOrchestrator
+
+
+class FakeScraper:
+    """
+    A blocking scraper recording how many scrapers of its bookmaker run
+    at once.
+    """
+
+    running = {}
+    peak = {}
+    finished = []
+    lock = Lock()
+    delay = 0.05
+
+    def __init__(self, site_path, driver_pool=None):
+        self.site_path = site_path
+        self.bookmaker = site_path.split("/")[0]
+
+    @classmethod
+    def init_with(cls, site_path, driver_pool=None):
+        return cls(site_path, driver_pool)
+
+    def collect(self, result_queue):
+        with self.lock:
+            running = self.running.get(self.bookmaker, 0) + 1
+            self.running[self.bookmaker] = running
+            self.peak[self.bookmaker] = max(
+                running, self.peak.get(self.bookmaker, 0)
+            )
+        time.sleep(self.delay)
+        with self.lock:
+            self.running[self.bookmaker] -= 1
+            self.finished.append(self.site_path)
+        if "broken" in self.site_path:
+            raise RuntimeError("session deleted")
+        result_queue.put(self.site_path)
+
+
+class SlowScraper(FakeScraper):
+    """
+    A blocking scraper of a slow bookmaker.
+    """
+
+    delay = 0.3
+
+
+def bookmaker(name, **sports):
+    site = type(name, (), {})()
+    for sport, site_path in sports.items():
+        setattr(site, sport, site_path)
+    return site
+
+
+class Test_ScrapeOrchestrator:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the ScrapeOrchestrator class
+    methods. Bookmakers and scrapers are replaced by fakes.
+    """
+
+    @pytest.fixture(autouse=True)
+    def reset_fake_scraper(self):
+        FakeScraper.running.clear()
+        FakeScraper.peak.clear()
+        FakeScraper.finished.clear()
+
+    @pytest.fixture
+    def scrapers(self):
+        return Mock(
+            scrapers={
+                bookmaker(
+                    "STS", football="sts/1", tennis="sts/2", mma="sts/3"
+                ): [FakeScraper, FakeScraper],
+                bookmaker(
+                    "Forbet", football="forbet/1", tennis=None, mma="forbet/3"
+                ): [FakeScraper, FakeScraper],
+            }
+        )
+
+    def test_run_groups_tables_by_sport(self, scrapers):
+        """
+        Test Case:
+        ----------
+        Tables of all bookmakers should be grouped by sports, sports
+        a bookmaker does not offer should be skipped.
+        """
+        orchestrator = ScrapeOrchestrator(
+            {"football": 3, "tennis": 2, "mma": 2}, scrapers=scrapers
+        )
+        tables = orchestrator.run()
+        assert sorted(tables["football"]) == ["forbet/1", "sts/1"]
+        assert tables["tennis"] == ["sts/2"]
+        assert sorted(tables["mma"]) == ["forbet/3", "sts/3"]
+
+    def test_jobs_of_bookmaker_are_bounded(self, scrapers):
+        """
+        Test Case:
+        ----------
+        No more jobs of one bookmaker than allowed should run at once,
+        even if the global limit allows more.
+        """
+        ScrapeOrchestrator(
+            {"football": 3, "tennis": 2, "mma": 2},
+            max_jobs=5,
+            jobs_per_bookmaker=2,
+            scrapers=scrapers,
+        ).run()
+        assert FakeScraper.peak["sts"] == 2
+
+    def test_failed_job_does_not_stop_the_cycle(self, scrapers):
+        """
+        Test Case:
+        ----------
+        A scraper raising an exception should be logged and skipped,
+        the tables of other jobs should be kept.
+        """
+        site = next(iter(scrapers.scrapers))
+        site.tennis = "sts/broken"
+        tables = ScrapeOrchestrator(
+            {"football": 3, "tennis": 2}, scrapers=scrapers
+        ).run()
+        assert tables["tennis"] == []
+        assert sorted(tables["football"]) == ["forbet/1", "sts/1"]
+
+    def test_slow_bookmaker_does_not_hold_global_slots(self):
+        """
+        Test Case:
+        ----------
+        Jobs waiting for a slow bookmaker should not take the global
+        slots, so the jobs of other bookmakers keep running.
+        """
+        scrapers = Mock(
+            scrapers={
+                bookmaker(
+                    "STS", football="sts/1", tennis="sts/2", mma="sts/3"
+                ): [SlowScraper, SlowScraper],
+                bookmaker(
+                    "Forbet",
+                    football="forbet/1",
+                    tennis="forbet/2",
+                    mma="forbet/3",
+                ): [FakeScraper, FakeScraper],
+            }
+        )
+        ScrapeOrchestrator(
+            {"football": 3, "tennis": 2, "mma": 2},
+            max_jobs=2,
+            jobs_per_bookmaker=1,
+            scrapers=scrapers,
+        ).run()
+        assert FakeScraper.finished[:3] == ["forbet/1", "forbet/2", "forbet/3"]
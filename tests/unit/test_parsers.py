@@ -4,7 +4,8 @@ from utils.parsers import (
     FortunaParser,
     STSParser,
     SuperbetParser,
-    ForbetParser
+    ForbetParser,
+    FeedParser,
 )
 import pytest
 from datetime import datetime, timedelta
@@ -602,4 +603,40 @@ class Test_ForbetParser:
         parser = ForbetParser()
         value = parser.parse_away_name(example_data["away_player"])
         assert type(value) == str
-        assert value == expected_return["away_player"]
\ No newline at end of file
+        assert value == expected_return["away_player"]
+
+
+class Test_FeedParser:
+    @pytest.fixture
+    def example_data(self):
+        return {
+            "home_player": " Iga Swiatek",
+            "away_player": "Coco Gauff ",
+            "home_team_win": 1.35,
+            "away_team_win": "3,2",
+        }
+
+    def test_parse_odds_return_float(self, example_data):
+        parser = FeedParser()
+        assert parser.parse_home_win(example_data["home_team_win"]) == 1.35
+        assert parser.parse_away_win(example_data["away_team_win"]) == 3.2
+
+    def test_parse_date_return_proper_str(self):
+        parser = FeedParser()
+        assert parser.parse_date("2023-10-24T12:00:00") == "2023-10-24"
+        timestamp = datetime(2023, 10, 24, 12).timestamp()
+        assert parser.parse_date(int(timestamp)) == "2023-10-24"
+        assert parser.parse_date(int(timestamp * 1000)) == "2023-10-24"
+
+    def test_parse_event_name_return_proper_str(self, example_data):
+        parser = FeedParser()
+        value = parser.parse_event_name(
+            example_data["home_player"], example_data["away_player"]
+        )
+        assert value == "Iga Swiatek - Coco Gauff"
+        assert parser.parse_home_name(example_data["home_player"]) == (
+            "IGA SWIATEK"
+        )
+        assert parser.parse_away_name(example_data["away_player"]) == (
+            "COCO GAUFF"
+        )
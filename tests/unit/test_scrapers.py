@@ -0,0 +1,482 @@
+"""
+Module Test_Scrapers:
+
+This module contains unit tests for the browser independent parts of
+the base scraper module.
+
+Classes:
+--------
+1. Test_BrowserProfile: Unit tests for the BrowserProfile class.
+2. Test_DriverPool: Unit tests for the DriverPool class.
+3. Test_Scraper: Unit tests for the bulk extraction of events and
+    waiting for the webpage.
+4. Test_STSScraper: Unit tests for showing all events of STS.
+
+Usage:
+------
+To run the tests, use a testing framework such as pytest with the following
+command: pytest test_scrapers.py
+"""
+
+import json
+import shutil
+import subprocess
+from unittest.mock import Mock
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    WebDriverException,
+)
+from scrapers.base import (
+    EVENTS_SCRIPT,
+    QUIET_SCRIPT,
+    STREAM_SCRIPT,
+    BrowserProfile,
+    DriverPool,
+    Scraper,
+)
+from scrapers.sts import STSTwoWayBets
+from scrapers.superbet import SuperbetTwoWayBets
+from utils.sports import ScrapersDict
+
+# A fake page for the recording scripts: every row is an element with
+# the id of its event and the values of its fields, changed by the
+# "rows" command which also notifies the MutationObserver.
+FAKE_PAGE = """
+const readline = require("readline");
+let rows = [];
+let changed = () => {};
+const element = (row) => ({
+    row,
+    getAttribute: () => null,
+    closest: () => ({ id: row.id }),
+});
+global.window = global;
+global.XPathResult = {
+    ORDERED_NODE_SNAPSHOT_TYPE: 7,
+    FIRST_ORDERED_NODE_TYPE: 9,
+};
+global.document = {
+    body: {},
+    evaluate: (xpath, context, resolver, type) => {
+        if (type === XPathResult.ORDERED_NODE_SNAPSHOT_TYPE) {
+            const found = rows.map(element);
+            return {
+                snapshotLength: found.length,
+                snapshotItem: (idx) => found[idx],
+            };
+        }
+        const value = context.row[xpath];
+        return {
+            singleNodeValue: value === undefined ? null : { innerText: value },
+        };
+    },
+};
+global.MutationObserver = class {
+    constructor(callback) {
+        changed = callback;
+    }
+    observe() {}
+    disconnect() {}
+};
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+    const message = JSON.parse(line);
+    let result = null;
+    if (message.rows) {
+        rows = message.rows;
+        changed();
+    } else {
+        result = new Function(message.script)(...message.args);
+    }
+    console.log(JSON.stringify(result === undefined ? null : result));
+});
+"""
+
+
+class NodeDriver:
+    """
+    A driver running the scripts of the scrapers in Node.js on
+    the FAKE_PAGE.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ["node", "-e", FAKE_PAGE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def send(self, message):
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+        return json.loads(self.process.stdout.readline())
+
+    def execute_script(self, script, *args):
+        return self.send({"script": script, "args": list(args)})
+
+    def render(self, rows):
+        self.send({"rows": rows})
+
+    def quit(self):
+        self.process.stdin.close()
+        self.process.wait(timeout=5)
+
+
+class Test_BrowserProfile:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the BrowserProfile class methods.
+    """
+
+    def test_default_profile_is_headless_without_images(self):
+        """
+        Test Case:
+        ----------
+        The default options should run a headless browser which does not
+        load images.
+        """
+        options = BrowserProfile().options()
+        assert "--headless=new" in options.arguments
+        assert "--disable-extensions" in options.arguments
+        assert options.experimental_options["prefs"] == {
+            "profile.managed_default_content_settings.images": 2
+        }
+
+    def test_apply_blocks_urls_through_devtools(self):
+        """
+        Test Case:
+        ----------
+        The blocked URL patterns of the profile should be sent to
+        the browser, a profile without blocking should send nothing.
+        """
+        driver = Mock()
+        BrowserProfile(blocked_urls=["*ads.example.com*"]).apply(driver)
+        command, params = driver.execute_cdp_cmd.call_args.args
+        assert command == "Network.setBlockedURLs"
+        assert "*.woff2" in params["urls"]
+        assert "*ads.example.com*" in params["urls"]
+
+        driver = Mock()
+        BrowserProfile(headless=False, block_resources=False).apply(driver)
+        driver.execute_cdp_cmd.assert_not_called()
+
+
+class Test_DriverPool:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the DriverPool class methods.
+    The pool launches mocked drivers instead of browsers.
+    """
+
+    @pytest.fixture
+    def pool(self):
+        return DriverPool(max_pages=3, driver_factory=Mock)
+
+    def test_released_driver_is_reused_for_the_same_host(self, pool):
+        """
+        Test Case:
+        ----------
+        The next scraper of the host should get the driver released by
+        the previous one instead of a new browser.
+        """
+        driver = pool.acquire("https://www.sts.pl/tenis/185")
+        pool.release("https://www.sts.pl/tenis/185", driver)
+        assert pool.acquire("https://www.sts.pl/koszykowka/186") is driver
+
+    def test_hosts_get_separate_drivers(self, pool):
+        """
+        Test Case:
+        ----------
+        Scrapers of different bookmakers should not share drivers.
+        """
+        first = pool.acquire("https://www.sts.pl/tenis/185")
+        second = pool.acquire("https://www.betclic.pl/tenis-s2")
+        assert first is not second
+
+    def test_driver_is_recycled_after_max_pages(self, pool):
+        """
+        Test Case:
+        ----------
+        A driver which loaded max_pages pages should be quit and replaced.
+        """
+        site_path = "https://www.sts.pl/tenis/185"
+        driver = pool.acquire(site_path)
+        for _ in range(2):
+            pool.release(site_path, driver)
+            assert pool.acquire(site_path) is driver
+        pool.release(site_path, driver)
+        driver.quit.assert_called_once()
+        assert pool.acquire(site_path) is not driver
+
+    def test_broken_driver_is_replaced(self, pool):
+        """
+        Test Case:
+        ----------
+        A driver whose session does not respond should be quit and
+        replaced by a new one.
+        """
+        site_path = "https://www.sts.pl/tenis/185"
+        driver = pool.acquire(site_path)
+        pool.release(site_path, driver)
+        type(driver).window_handles = property(
+            Mock(side_effect=WebDriverException("session deleted"))
+        )
+        assert pool.acquire(site_path) is not driver
+        driver.quit.assert_called_once()
+
+    def test_close_quits_idle_drivers(self, pool):
+        """
+        Test Case:
+        ----------
+        Closing the pool should quit all drivers waiting in it.
+        """
+        driver = pool.acquire("https://www.sts.pl/tenis/185")
+        pool.release("https://www.sts.pl/tenis/185", driver)
+        pool.close()
+        driver.quit.assert_called_once()
+        assert pool.idle == {}
+
+
+class Test_Scraper:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for the bulk extraction of events
+    and the waiting for the webpage shared by the scrapers of all
+    bookmakers.
+    """
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = Scraper.__new__(Scraper)
+        scraper.driver = Mock()
+        return scraper
+
+    def test_wait_until_quiet_counts_the_rows(self, scraper):
+        """
+        Test Case:
+        ----------
+        Waiting should run the script counting the rows of the layout
+        once with the quiet period and the timeout in milliseconds.
+        """
+        scraper.EVENTS_LAYOUT = {"events": "//row"}
+        scraper.driver.execute_async_script.return_value = True
+        assert scraper.wait_until_quiet(quiet=0.2, timeout=5) is True
+        scraper.driver.execute_async_script.assert_called_once_with(
+            QUIET_SCRIPT, {"events": "//row"}, 200, 5000
+        )
+
+    def test_get_whole_site_stops_when_height_settles(self, scraper):
+        """
+        Test Case:
+        ----------
+        Scrolling should stop on the first step which does not make
+        the webpage longer, waiting for the page on every step.
+        """
+        scraper.driver.execute_script.side_effect = [
+            1000,
+            None,
+            2000,
+            None,
+            2000,
+        ]
+        scraper.get_whole_site()
+        assert scraper.driver.execute_script.call_count == 5
+        assert scraper.driver.execute_async_script.call_count == 2
+
+    def test_get_whole_site_stops_when_page_does_not_settle(self, scraper):
+        """
+        Test Case:
+        ----------
+        Scrolling should stop when the rows keep changing until
+        the timeout, instead of scrolling again.
+        """
+        scraper.logging = Mock()
+        scraper.driver.execute_script.return_value = 1000
+        scraper.driver.execute_async_script.return_value = False
+        scraper.get_whole_site()
+        assert scraper.driver.execute_script.call_count == 2
+        scraper.logging.warning.assert_called_once()
+
+    def test_wait_for_missing_element_gives_up(self, scraper):
+        """
+        Test Case:
+        ----------
+        Waiting for an element which never appears should return False
+        instead of raising.
+        """
+        scraper.driver.find_element.side_effect = NoSuchElementException()
+        assert scraper.wait_for("//button", timeout=0) is False
+
+    def test_extract_events_reads_page_with_one_script(self):
+        """
+        Test Case:
+        ----------
+        All events should be collected with a single script call which
+        receives the layout of the scraper.
+        """
+        scraper = Scraper.__new__(Scraper)
+        scraper.driver = Mock()
+        scraper.driver.execute_script.return_value = [{"home_player": "A"}]
+        scraper.EVENTS_LAYOUT = {"events": "//tr", "fields": {}}
+        assert scraper.extract_events() == [{"home_player": "A"}]
+        scraper.driver.execute_script.assert_called_once_with(
+            EVENTS_SCRIPT, {"events": "//tr", "fields": {}}
+        )
+
+    def test_layouts_of_scrapers_give_all_values_of_events(self):
+        """
+        Test Case:
+        ----------
+        The layout of every scraper should read the participants, the odds
+        of the table and the date of the event.
+        """
+        for scrapers in ScrapersDict().browser_scrapers.values():
+            for scraper, odds in zip(
+                scrapers,
+                [
+                    {"home_team_win", "away_team_win"},
+                    {"home_team_win", "draw", "away_team_win"},
+                ],
+            ):
+                layout = scraper.EVENTS_LAYOUT
+                values = set(layout["fields"]) | set(
+                    layout.get("group_fields", {})
+                )
+                assert {"home_player", "away_player", "event_date"} <= values
+                assert odds <= values
+                assert "events" in layout
+
+    def test_stream_events_drains_batches_while_scrolling(self, scraper):
+        """
+        Test Case:
+        ----------
+        Streaming should install the recording script once, drain
+        the recorded events after every scroll step and stop recording
+        when the list cannot be scrolled further.
+        """
+        batches = [[{"home_player": "A"}], [], [{"home_player": "B"}]]
+        positions = [0, 2000, 2000]
+
+        def execute_script(script, *args):
+            if script == STREAM_SCRIPT:
+                return None
+            if "drain" in script:
+                return batches.pop(0) if batches else []
+            if "scroll" in script:
+                return positions.pop(0)
+            return None
+
+        scraper.driver.execute_script.side_effect = execute_script
+        scraper.EVENTS_LAYOUT = {"events": "//tr", "fields": {}}
+        events = [
+            event["home_player"]
+            for batch in scraper.stream_events()
+            for event in batch
+        ]
+        assert events == ["A", "B"]
+        scripts = [
+            call.args[0] for call in scraper.driver.execute_script.mock_calls
+        ]
+        assert scripts.count(STREAM_SCRIPT) == 1
+        assert "stop()" in scripts[-1]
+
+    @pytest.mark.skipif(
+        shutil.which("node") is None, reason="Node.js is not installed"
+    )
+    def test_drain_stream_returns_every_fixture_once(self):
+        """
+        Test Case:
+        ----------
+        Superbet lists one fixture under several event-<id> elements, so
+        a row of the same participants under a new id, written in another
+        case or spacing, should never be drained again. The recording
+        script runs in Node.js on a fake page.
+        """
+        scraper = SuperbetTwoWayBets.__new__(SuperbetTwoWayBets)
+        scraper.driver = NodeDriver()
+        layout = {
+            **SuperbetTwoWayBets.EVENTS_LAYOUT,
+            "fields": {"home_player": "home", "away_player": "away"},
+        }
+        try:
+            scraper.driver.render(
+                [{"id": "event-1", "home": "Swiatek", "away": "Gauff"}]
+            )
+            scraper.start_stream(layout)
+            first = scraper.drain_stream()
+            scraper.driver.render(
+                [
+                    {"id": "event-1", "home": "Swiatek", "away": "Gauff"},
+                    {"id": "event-2", "home": "SWIATEK", "away": "Gauff"},
+                    {"id": "event-3", "home": "Pegula", "away": "Zheng"},
+                    {"id": "event-4", "home": "Swiatek", "away": "Gauff"},
+                ]
+            )
+            second = scraper.drain_stream()
+        finally:
+            scraper.driver.quit()
+        assert first == [{"home_player": "Swiatek", "away_player": "Gauff"}]
+        assert second == [{"home_player": "Pegula", "away_player": "Zheng"}]
+
+
+class Test_STSScraper:
+    """
+    Test Class:
+    ------------
+    This class contains unit tests for clicking the button showing more
+    competitions of STS.
+    """
+
+    @pytest.fixture
+    def scraper(self):
+        scraper = STSTwoWayBets.__new__(STSTwoWayBets)
+        scraper.driver = Mock()
+        scraper.logging = Mock()
+        scraper.driver.execute_async_script.return_value = True
+        return scraper
+
+    def test_get_whole_site_clicks_until_the_button_disappears(self, scraper):
+        """
+        Test Case:
+        ----------
+        The button should be clicked until it is no longer found.
+        """
+        button = Mock()
+        scraper.driver.find_element.side_effect = [
+            button,
+            button,
+            NoSuchElementException(),
+        ]
+        scraper.get_whole_site()
+        assert button.click.call_count == 2
+
+    def test_get_whole_site_is_bounded(self, scraper):
+        """
+        Test Case:
+        ----------
+        A button which never disappears should be clicked at most
+        max_steps times.
+        """
+        scraper.get_whole_site(max_steps=3)
+        assert scraper.driver.find_element.return_value.click.call_count == 3
+
+    @pytest.mark.parametrize(
+        "settled, error", [(False, None), (True, WebDriverException())]
+    )
+    def test_get_whole_site_stops_on_unsettled_page_or_error(
+        self, scraper, settled, error
+    ):
+        """
+        Test Case:
+        ----------
+        Clicking should stop when the webpage does not settle or
+        the click fails with an unexpected error.
+        """
+        scraper.driver.execute_async_script.return_value = settled
+        scraper.driver.find_element.return_value.click.side_effect = error
+        scraper.get_whole_site()
+        assert scraper.driver.find_element.call_count == 1